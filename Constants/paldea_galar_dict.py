@@ -1403,11 +1403,10 @@ def get_dex_number_by_name(name: str) -> int | None:
     Example: get_dex_number_by_name("flutter-mane") -> 987
     Returns None if not found.
     """
+    from Constants.pokedex_index import POKEDEX
+
     # Only return if the name matches exactly (case-sensitive)
-    for dex_num, poke_name in dex.items():
-        if poke_name == name:
-            return dex_num
-    return None
+    return POKEDEX.dex_by_name.get(name)
 
 
 def get_rarity_by_color(color_value):
@@ -1426,10 +1425,9 @@ def get_rarity_by_color(color_value):
         >>> get_rarity_by_color(16550924)
         'rare'
     """
-    for rarity_name, rarity_data in rarity_meta.items():
-        if rarity_data["color"] == color_value:
-            return rarity_name
-    return "unknown"
+    from Constants.pokedex_index import POKEDEX
+
+    return POKEDEX.rarity_by_color.get(color_value, "unknown")
 
 
 def get_color_by_rarity(rarity_name):
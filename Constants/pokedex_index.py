@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from Constants.paldea_galar_dict import dex, rarity_meta
+from Constants.weakness_chart import weakness_chart
+
+# 🟣────────────────────────────────────────────
+#            📖 Immutable Pokédex Index
+# 🟣────────────────────────────────────────────
+# Built once at import from weakness_chart, paldea_galar_dict.dex and
+# rarity_meta so name/dex/color lookups are dict hits instead of scans.
+# Where the source has duplicates, the first entry wins, matching the old
+# linear scans.
+
+SHINY_DEX_OFFSET = 1000
+GOLDEN_DEX_OFFSET = 9000
+FORM_DEX_START = 7000  # 7xxx dex numbers are special forms, no shiny/golden offset
+
+PREFIX_DEX_OFFSETS = {
+    "": 0,
+    "Shiny ": SHINY_DEX_OFFSET,
+    "Golden ": GOLDEN_DEX_OFFSET,
+}
+
+
+@dataclass(frozen=True)
+class PokedexIndex:
+    # weakness_chart key -> dex
+    chart_dex_by_name: Mapping[str, int]
+    # dex -> first weakness_chart key with that dex
+    chart_name_by_dex: Mapping[int, str]
+    # dex -> every weakness_chart key with that dex, in chart order
+    chart_names_by_dex: Mapping[int, tuple[str, ...]]
+    # paldea_galar_dict.dex and its reverse
+    name_by_dex: Mapping[int, str]
+    dex_by_name: Mapping[str, int]
+    # embed color -> rarity name
+    rarity_by_color: Mapping[int, str]
+
+    @staticmethod
+    def split_dex_input(dex_input: str) -> tuple[str, int]:
+        """
+        Splits numeric input into (prefix, base dex):
+        "1460" -> ("Shiny ", 460), "9460" -> ("Golden ", 460), "460" -> ("", 460).
+        """
+        if len(dex_input) > 3 and dex_input[0] == "9":
+            return "Golden ", int(dex_input[1:])
+        if len(dex_input) > 3 and dex_input[0] == "1":
+            return "Shiny ", int(dex_input[1:])
+        return "", int(dex_input)
+
+    @staticmethod
+    def apply_prefix_offset(base_dex: int, prefix: str) -> int:
+        """Adds the shiny/golden dex offset, except for special forms (7xxx+)."""
+        if base_dex >= FORM_DEX_START:
+            return base_dex
+        return base_dex + PREFIX_DEX_OFFSETS.get(prefix, 0)
+
+
+def _build_pokedex_index() -> PokedexIndex:
+    chart_dex_by_name = {}
+    chart_name_by_dex = {}
+    chart_names_by_dex: dict[int, list[str]] = {}
+    for name, dex_str in weakness_chart.dex_items():
+        try:
+            dex_int = int(dex_str)
+        except (TypeError, ValueError):
+            continue
+        chart_dex_by_name[name] = dex_int
+        chart_name_by_dex.setdefault(dex_int, name)
+        chart_names_by_dex.setdefault(dex_int, []).append(name)
+
+    dex_by_name = {}
+    for dex_num, poke_name in dex.items():
+        dex_by_name.setdefault(poke_name, dex_num)
+
+    rarity_by_color = {}
+    for rarity_name, rarity_data in rarity_meta.items():
+        rarity_by_color.setdefault(rarity_data["color"], rarity_name)
+
+    return PokedexIndex(
+        chart_dex_by_name=MappingProxyType(chart_dex_by_name),
+        chart_name_by_dex=MappingProxyType(chart_name_by_dex),
+        chart_names_by_dex=MappingProxyType(
+            {k: tuple(v) for k, v in chart_names_by_dex.items()}
+        ),
+        name_by_dex=MappingProxyType(dict(dex)),
+        dex_by_name=MappingProxyType(dex_by_name),
+        rarity_by_color=MappingProxyType(rarity_by_color),
+    )
+
+
+POKEDEX = _build_pokedex_index()
@@ -0,0 +1,123 @@
+"""
+Microbenchmark for the PokéMeow embed parsers in utils/pokemeow/embed_parsers.py.
+
+    python benchmarks/bench_embed_parsers.py
+    python benchmarks/bench_embed_parsers.py --number 20000
+
+Patterns: every entry of PATTERNS is searched against every recorded embed
+text (so both hits and misses are timed), once through the precompiled
+pattern and once the way listeners used to do it, re.search(<pattern str>)
+inside the function body (which goes through re's compile cache each call).
+
+Parsers: every parse_* / extract_* function is run against the samples
+recorded for it and checked to return a record, then timed.
+
+Corpus lines (see benchmarks/corpus/embed_samples.jsonl):
+  {"parser": "watering_action", "text": "<:wailmer_pail:...> Watered ..."}
+"parser" names one of the PARSERS below, or "none" for text no parser
+should care about (chatter, other embeds).
+"""
+
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.pokemeow import embed_parsers  # noqa: E402
+from utils.pokemeow.embed_parsers import PATTERNS  # noqa: E402
+
+DEFAULT_CORPUS = ROOT / "benchmarks" / "corpus" / "embed_samples.jsonl"
+
+PARSERS = {
+    "spawn_trainer": embed_parsers.parse_spawn_trainer,
+    "fishing_trainer": embed_parsers.extract_fishing_trainer_name,
+    "caught_author": embed_parsers.extract_caught_username,
+    "watering_action": embed_parsers.parse_watering_action,
+    "mulch_application": embed_parsers.parse_mulch_application,
+    "berry_slots": embed_parsers.parse_berry_slots,
+    "battle_challenge": embed_parsers.parse_battle_challenge,
+    "enemy_id": embed_parsers.extract_enemy_id,
+    "wb_boss_name": embed_parsers.extract_wb_boss_name,
+    "world_boss_announcement": embed_parsers.parse_world_boss_announcement,
+    "wb_boss_variant": embed_parsers.parse_wb_boss_variant,
+    "eternatus_votes": embed_parsers.parse_eternatus_votes,
+    "clan_stats": embed_parsers.parse_clan_stats,
+}
+
+
+def load_samples(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def per_call_ns(func, number: int, calls_per_run: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=3))
+    return best / (number * calls_per_run) * 1e9
+
+
+def bench_patterns(texts: list[str], number: int):
+    print(f"{'pattern':<22} {'hits':>5} {'inline ns':>10} {'compiled ns':>12} {'speedup':>8}")
+    for name, pattern in PATTERNS.items():
+        source, flags = pattern.pattern, pattern.flags
+        hits = sum(1 for text in texts if pattern.search(text))
+
+        def inline():
+            for text in texts:
+                re.search(source, text, flags)
+
+        def compiled():
+            for text in texts:
+                pattern.search(text)
+
+        inline_ns = per_call_ns(inline, number, len(texts))
+        compiled_ns = per_call_ns(compiled, number, len(texts))
+        print(
+            f"{name:<22} {hits:>5} {inline_ns:>10.0f} {compiled_ns:>12.0f} "
+            f"{inline_ns / compiled_ns:>7.2f}x"
+        )
+
+
+def bench_parsers(samples: list[dict], number: int) -> int:
+    failures = 0
+    print(f"\n{'parser':<24} {'samples':>7} {'ns/call':>9}  result")
+    for name, parser in PARSERS.items():
+        texts = [s["text"] for s in samples if s["parser"] == name]
+        if not texts:
+            print(f"{name:<24} {0:>7} {'—':>9}  no samples")
+            continue
+        results = [parser(text) for text in texts]
+        if any(not result or not any(result) for result in results):
+            failures += 1
+
+        def run():
+            for text in texts:
+                parser(text)
+
+        print(
+            f"{name:<24} {len(texts):>7} {per_call_ns(run, number, len(texts)):>9.0f}  "
+            f"{results[0]!r:.60}"
+        )
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    samples = load_samples(args.corpus)
+    bench_patterns([s["text"] for s in samples], args.number)
+    failures = bench_parsers(samples, args.number)
+    if failures:
+        print(f"\n❌ {failures} parser(s) returned nothing for a recorded sample")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark + equivalence check for the market feed listing parser.
+
+    python benchmarks/bench_market_listing.py
+    python benchmarks/bench_market_listing.py --number 20000 --check 50000
+
+Parses the captured market feed embeds (Embed.to_dict payloads, one per
+line in benchmarks/corpus/market_feed_embeds.jsonl) with the old listener
+code path (fields dict, re.sub emoji strip + re.search per price, int()
+amount) and with parse_market_listing, and prints µs per embed and per
+10-embed feed message for both.
+
+Before timing, both parsers must agree on every captured embed and on
+--check randomly generated ones (emoji / animated emoji prefixes, commas,
+missing or reordered fields, text-only values); any mismatch is printed and
+the script exits non-zero. Needs discord.py installed (for Embed), no token.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import discord  # noqa: E402
+
+from utils.pokemeow.embed_parsers import parse_market_listing  # noqa: E402
+
+DEFAULT_CORPUS = ROOT / "benchmarks" / "corpus" / "market_feed_embeds.jsonl"
+FEED_EMBEDS = 10  # a market feed webhook message carries up to 10 listings
+
+
+def legacy_parse(embed: discord.Embed) -> dict | None:
+    """The parsing market_feeds_listener did before parse_market_listing."""
+    embed_author_name = embed.author.name if embed.author else ""
+    match = re.match(r"(.+?)\s+#(\d+)", embed_author_name)
+    if not match:
+        return None
+    fields = {f.name: f.value for f in embed.fields}
+    listed_price_str = re.sub(r"<a?:\w+:\d+>", "", fields.get("Listed Price", "0"))
+    match_price = re.search(r"(\d[\d,]*)", listed_price_str)
+    lowest_market_str = re.sub(r"<a?:\w+:\d+>", "", fields.get("Lowest Market", "0"))
+    lowest_market_match = re.search(r"(\d[\d,]*)", lowest_market_str)
+    return {
+        "poke_name": match.group(1),
+        "dex": int(match.group(2)),
+        "listing_id": fields.get("ID", "0"),
+        "listed_price": (
+            int(match_price.group(1).replace(",", "")) if match_price else 0
+        ),
+        "lowest_market": (
+            int(lowest_market_match.group(1).replace(",", ""))
+            if lowest_market_match
+            else 0
+        ),
+        "amount": int(fields.get("Amount", "1")),
+        "listing_seen": fields.get("Listing Seen", "N/A"),
+    }
+
+
+def new_parse(embed: discord.Embed):
+    return parse_market_listing(
+        embed.author.name if embed.author else "",
+        ((f.name, f.value) for f in embed.fields),
+    )
+
+
+def read_fields(embed: discord.Embed):
+    return embed.author.name, [(f.name, f.value) for f in embed.fields]
+
+
+def as_dict(listing) -> dict | None:
+    if listing is None:
+        return None
+    return {name: getattr(listing, name) for name in listing.__slots__}
+
+
+# 🟣────────────────────────────────────────────
+#        🎲 Random Embeds
+# 🟣────────────────────────────────────────────
+def random_price(rng: random.Random) -> str:
+    prefix = rng.choice(
+        [
+            "",
+            "<:PokeCoin:666879070650236928> ",
+            "<a:PokeCoinSpin:1170000000000000010> ",
+            "<:PokeCoin:666879070650236928><:PokeCoin:666879070650236928> ",
+            "≈ ",
+        ]
+    )
+    kind = rng.random()
+    if kind < 0.1:
+        return prefix + rng.choice(["N/A", "—", ""])
+    number = rng.randint(0, 10**9)
+    text = f"{number:,}" if kind < 0.8 else str(number)
+    return prefix + text + rng.choice(["", " each", " (x2)"])
+
+
+def random_embed(rng: random.Random) -> discord.Embed:
+    name = rng.choice(["Pikachu", "Shiny Mega Gengar", "Mr. Mime", "Ho-Oh", "Gigantamax-Lapras"])
+    author = rng.choice([f"{name} #{rng.randint(1, 1025)}", name, f"#{rng.randint(1, 9)}"])
+    fields = [
+        ("Listed Price", random_price(rng)),
+        ("Lowest Market", random_price(rng)),
+        ("Amount", str(rng.randint(1, 99))),
+        ("Listing Seen", f"<t:{rng.randint(1_700_000_000, 1_800_000_000)}:R>"),
+        ("ID", "".join(rng.choices("ABCDEFGHJKLMNPQRSTUVWXYZ0123456789", k=6))),
+    ]
+    fields = [field for field in fields if rng.random() > 0.1]
+    rng.shuffle(fields)
+    embed = discord.Embed(color=rng.randint(0, 0xFFFFFF))
+    embed.set_author(name=author)
+    for field_name, value in fields:
+        embed.add_field(name=field_name, value=value)
+    return embed
+
+
+def check(embeds: list[discord.Embed], label: str) -> int:
+    mismatches = 0
+    for embed in embeds:
+        old, new = legacy_parse(embed), as_dict(new_parse(embed))
+        if old != new:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"❌ {label} mismatch for {embed.to_dict()}\n   old {old}\n   new {new}")
+    print(f"{label}: {len(embeds) - mismatches}/{len(embeds)} embeds parse the same")
+    return mismatches
+
+
+def best_us(funcs: dict, number: int, repeat: int = 7) -> dict[str, float]:
+    """Best of `repeat` runs per function, runs interleaved so drift hits all."""
+    best = dict.fromkeys(funcs, float("inf"))
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            elapsed = timeit.timeit(func, number=number) / number * 1e6
+            best[name] = min(best[name], elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--number", type=int, default=5000)
+    parser.add_argument("--check", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding="utf-8") as f:
+        captured = [discord.Embed.from_dict(json.loads(line)) for line in f if line.strip()]
+    rng = random.Random(args.seed)
+    mismatches = check(captured, "captured")
+    mismatches += check([random_embed(rng) for _ in range(args.check)], "random")
+    if mismatches:
+        sys.exit(1)
+
+    # "fields" only reads the author and fields off the Embed, which both
+    # parsers pay; the rest of each row is the parsing itself
+    feed = (captured * FEED_EMBEDS)[:FEED_EMBEDS]
+    parsers = {"fields": read_fields, "legacy": legacy_parse, "single": new_parse}
+    per_embed = best_us(
+        {
+            name: (lambda parse=parse: [parse(embed) for embed in captured])
+            for name, parse in parsers.items()
+        },
+        args.number,
+    )
+    per_feed = best_us(
+        {
+            name: (lambda parse=parse: [parse(embed) for embed in feed])
+            for name, parse in parsers.items()
+        },
+        args.number,
+    )
+    print(f"\n{'parser':<8} {'µs/embed':>9} {'µs/feed msg':>12}")
+    for name in parsers:
+        print(f"{name:<8} {per_embed[name] / len(captured):>9.2f} {per_feed[name]:>12.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Startup / RSS benchmark: old dict-literal weakness chart vs the compiled,
+lazily mmapped one.
+
+    python benchmarks/bench_weakness_chart.py
+
+Each measurement runs in a fresh interpreter and covers import + one lookup.
+"literal" regenerates the old 61k-line module from Data/weakness_chart.json
+into a temp dir and imports it cold (its .pyc deleted first) and warm (.pyc
+cached). "compiled" imports Constants.weakness_chart the same two ways.
+"""
+
+import importlib.util
+import json
+import pprint
+import py_compile
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Resident set size from /proc (Linux), in KB
+MEASURE = """
+import os, sys, time
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+sys.path.insert(0, {path!r})
+rss_before = rss_kb()
+start = time.perf_counter()
+from {module} import weakness_chart
+entry = weakness_chart["abomasnow"]
+elapsed = (time.perf_counter() - start) * 1000
+print(f"{{elapsed:.1f}} {{rss_kb() - rss_before}}")
+"""
+
+
+def run(path: Path, module: str, cold: bool) -> tuple[float, int]:
+    source = path.joinpath(*module.split(".")).with_suffix(".py")
+    pyc = Path(importlib.util.cache_from_source(str(source)))
+    if cold:
+        pyc.unlink(missing_ok=True)
+    elif not pyc.exists():
+        py_compile.compile(str(source), cfile=str(pyc))
+    code = MEASURE.format(path=str(path), module=module)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(out[0]), int(out[1])
+
+
+def main(repeat: int = 3):
+    with open(ROOT / "Data" / "weakness_chart.json", encoding="utf-8") as f:
+        chart = json.load(f)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "weakness_chart_literal.py").write_text(
+            "weakness_chart = " + pprint.pformat(chart, indent=4, sort_dicts=False),
+            encoding="utf-8",
+        )
+
+        scenarios = {}
+        for name, path, module in (
+            ("literal", tmp, "weakness_chart_literal"),
+            ("compiled", ROOT, "Constants.weakness_chart"),
+        ):
+            cold = [run(path, module, cold=True) for _ in range(repeat)]
+            warm = [run(path, module, cold=False) for _ in range(repeat)]
+            scenarios[name] = (cold, warm)
+
+    print(f"{'scenario':<10} {'cold ms':>9} {'cold RSS KB':>12} {'warm ms':>9} {'warm RSS KB':>12}")
+    for name, (cold, warm) in scenarios.items():
+        print(
+            f"{name:<10} "
+            f"{min(t for t, _ in cold):>9.1f} {min(r for _, r in cold):>12} "
+            f"{min(t for t, _ in warm):>9.1f} {min(r for _, r in warm):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,519 @@
+"""
+Offline replay benchmark for the message listener pipeline.
+
+    python benchmarks/replay_listeners.py
+    python benchmarks/replay_listeners.py --corpus my_capture.jsonl --repeat 200
+
+Replays a JSONL corpus of PokéMeow messages (spawn, caught, market feed,
+stats, berry, plain chatter) through MessageCreateListener.on_message and
+OnMessageEditCog.on_message_edit, and prints per-listener / per-kind latency
+percentiles and messages/sec.
+
+Nothing touches the network: messages, members, channels and the bot are
+in-memory fakes, bot.pg_pool answers every query with an empty result, and
+webhook / channel sends are only counted. Needs discord.py installed (for
+Embed and the Message/Member types listeners isinstance-check), no token.
+
+Corpus lines (see benchmarks/corpus/listener_messages.jsonl):
+  {"type": "members", "guild_id": ..., "members": [{"id", "name",
+   "pokemeow_name", "channel_id", "faction"}]}
+      Seeds the guild members and the VNA member cache, so listeners
+      resolve users like they do in production.
+  {"type": "message", "kind": "caught", "event": "create" | "edit",
+   "guild_id", "channel_id", "author": {"id", "name", "bot"},
+   "reply_to": member id (optional), "webhook_id" (optional),
+   "content", "embeds": [Embed.to_dict() payloads],
+   "before": {"content", "embeds"} (optional, edits only)}
+
+Message ids are renumbered every round, so dedup stores don't turn later
+rounds into no-ops.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import discord  # noqa: E402
+
+DEFAULT_CORPUS = ROOT / "benchmarks" / "corpus" / "listener_messages.jsonl"
+
+
+# 🟣────────────────────────────────────────────
+#        🧸 Fakes
+# 🟣────────────────────────────────────────────
+class Counters:
+    sends = 0
+    db_calls = 0
+
+
+class FakeAsset:
+    url = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+    async def read(self) -> bytes:
+        return b""
+
+
+class FakeRole:
+    def __init__(self, role_id: int):
+        self.id = role_id
+        self.name = f"role-{role_id}"
+        self.mention = f"<@&{role_id}>"
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, guild=None):
+        self.id = channel_id
+        self.name = f"channel-{channel_id}"
+        self.guild = guild
+        self.mention = f"<#{channel_id}>"
+
+    async def send(self, *args, **kwargs):
+        Counters.sends += 1
+
+    async def fetch_message(self, message_id: int):
+        raise discord.NotFound(_FakeResponse(), "replay: no message history")
+
+    async def create_webhook(self, *args, **kwargs):
+        return _FakeWebhook(self.id)
+
+    async def webhooks(self):
+        return []
+
+
+class _FakeResponse:
+    status = 404
+    reason = "Not Found"
+
+
+class _FakeWebhook:
+    def __init__(self, channel_id: int):
+        self.url = f"https://discord.com/api/webhooks/{channel_id}/replay"
+
+
+class FakeMember(discord.Member):
+    # Plain attributes instead of discord.Member's properties over _user
+    id = 0
+    name = ""
+    display_name = ""
+    global_name = None
+    bot = False
+    mention = ""
+    roles = ()
+    display_avatar = FakeAsset()
+    avatar = FakeAsset()
+
+    def __init__(self, member_id: int, name: str, guild=None, bot: bool = False):
+        self.id = member_id
+        self.name = name
+        self.display_name = name
+        self.bot = bot
+        self.mention = f"<@{member_id}>"
+        self.roles = []
+        self.guild = guild
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"<FakeMember id={self.id} name={self.name!r}>"
+
+    __hash__ = object.__hash__
+
+    def __eq__(self, other):
+        return isinstance(other, FakeMember) and other.id == self.id
+
+    async def send(self, *args, **kwargs):
+        Counters.sends += 1
+
+    async def add_roles(self, *roles, **kwargs):
+        pass
+
+    async def remove_roles(self, *roles, **kwargs):
+        pass
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = f"guild-{guild_id}"
+        self.icon = FakeAsset()
+        self._members: dict[int, FakeMember] = {}
+        self._channels: dict[int, FakeChannel] = {}
+
+    @property
+    def members(self) -> list[FakeMember]:
+        return list(self._members.values())
+
+    def add_member(self, member: FakeMember):
+        self._members[member.id] = member
+
+    def get_member(self, member_id: int):
+        return self._members.get(member_id)
+
+    async def fetch_member(self, member_id: int):
+        return self._members.get(member_id)
+
+    def get_channel(self, channel_id: int) -> FakeChannel:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeChannel(channel_id, self)
+        return channel
+
+    def get_role(self, role_id: int) -> FakeRole:
+        return FakeRole(role_id)
+
+
+class FakeReference:
+    def __init__(self, resolved):
+        self.resolved = resolved
+        self.message_id = resolved.id if resolved else None
+
+
+class FakeMessage(discord.Message):
+    # Plain attributes instead of discord.Message's properties
+    edited_at = None
+    jump_url = ""
+    interaction = None
+    interaction_metadata = None
+
+    def __init__(
+        self,
+        message_id: int,
+        *,
+        content: str,
+        embeds: list,
+        author,
+        guild: FakeGuild,
+        channel: FakeChannel,
+        webhook_id: int | None = None,
+        reference: FakeReference | None = None,
+    ):
+        self.id = message_id
+        self.content = content
+        self.embeds = embeds
+        self.author = author
+        self.guild = guild
+        self.channel = channel
+        self.webhook_id = webhook_id
+        self.reference = reference
+        self.attachments = []
+        self.mentions = []
+
+    def __repr__(self):
+        return f"<FakeMessage id={self.id}>"
+
+    async def reply(self, *args, **kwargs):
+        Counters.sends += 1
+
+    async def add_reaction(self, *args, **kwargs):
+        pass
+
+    async def edit(self, *args, **kwargs):
+        pass
+
+    async def delete(self, *args, **kwargs):
+        pass
+
+
+class FakeConnection:
+    """Every query succeeds and returns nothing."""
+
+    async def execute(self, *args, **kwargs):
+        Counters.db_calls += 1
+        return "UPDATE 0"
+
+    async def executemany(self, *args, **kwargs):
+        Counters.db_calls += 1
+
+    async def fetch(self, *args, **kwargs):
+        Counters.db_calls += 1
+        return []
+
+    async def fetchrow(self, *args, **kwargs):
+        Counters.db_calls += 1
+        return None
+
+    async def fetchval(self, *args, **kwargs):
+        Counters.db_calls += 1
+        return None
+
+    execute_named = execute
+    executemany_named = executemany
+    fetch_named = fetch
+    fetchrow_named = fetchrow
+    fetchval_named = fetchval
+
+    def transaction(self):
+        return _NullContext(None)
+
+
+class _NullContext:
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool(FakeConnection):
+    def acquire(self):
+        return _NullContext(FakeConnection())
+
+
+class FakeBot:
+    def __init__(self, guilds: dict[int, FakeGuild]):
+        self.user = FakeMember(1, "Arceus", bot=True)
+        self.pg_pool = FakePool()
+        self.loop = asyncio.get_running_loop()
+        self.latency = 0.0
+        self._guilds = guilds
+
+    def get_guild(self, guild_id: int):
+        return self._guilds.get(guild_id)
+
+    def get_channel(self, channel_id: int):
+        for guild in self._guilds.values():
+            if channel_id in guild._channels:
+                return guild._channels[channel_id]
+        return None
+
+    async def fetch_channel(self, channel_id: int):
+        return self.get_channel(channel_id)
+
+    def get_user(self, user_id: int):
+        for guild in self._guilds.values():
+            member = guild.get_member(user_id)
+            if member:
+                return member
+        return None
+
+    async def fetch_user(self, user_id: int):
+        return self.get_user(user_id)
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def wait_until_ready(self):
+        pass
+
+
+# 🟣────────────────────────────────────────────
+#        📼 Corpus
+# 🟣────────────────────────────────────────────
+def load_corpus(path: Path) -> tuple[list[dict], list[dict]]:
+    seeds, messages = [], []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("//"):
+                continue
+            record = json.loads(line)
+            if record.get("type") == "members":
+                seeds.append(record)
+            elif record.get("type") == "message":
+                messages.append(record)
+            else:
+                raise ValueError(f"{path}:{line_no}: unknown record type")
+    return seeds, messages
+
+
+def seed_members(seeds: list[dict], guilds: dict[int, FakeGuild]):
+    from utils.cache.vna_members_cache import upsert_vna_member_cache
+
+    for seed in seeds:
+        guild = guilds.setdefault(seed["guild_id"], FakeGuild(seed["guild_id"]))
+        for entry in seed["members"]:
+            guild.add_member(FakeMember(entry["id"], entry["name"], guild))
+            if "pokemeow_name" in entry:
+                upsert_vna_member_cache(
+                    entry["id"],
+                    entry["name"],
+                    entry["pokemeow_name"],
+                    entry.get("channel_id"),
+                    entry.get("perks", ""),
+                    entry.get("faction"),
+                )
+
+
+def build_message(
+    record: dict, part: dict, message_id: int, guilds: dict[int, FakeGuild]
+) -> FakeMessage:
+    guild = guilds.setdefault(record["guild_id"], FakeGuild(record["guild_id"]))
+    author_info = record["author"]
+    author = guild.get_member(author_info["id"]) or FakeMember(
+        author_info["id"], author_info["name"], guild, author_info.get("bot", False)
+    )
+    reference = None
+    if record.get("reply_to"):
+        replied_to = guild.get_member(record["reply_to"])
+        reference = FakeReference(
+            FakeMessage(
+                message_id - 1,
+                content="",
+                embeds=[],
+                author=replied_to,
+                guild=guild,
+                channel=guild.get_channel(record["channel_id"]),
+            )
+        )
+    return FakeMessage(
+        message_id,
+        content=part.get("content", ""),
+        embeds=[discord.Embed.from_dict(e) for e in part.get("embeds", [])],
+        author=author,
+        guild=guild,
+        channel=guild.get_channel(record["channel_id"]),
+        webhook_id=record.get("webhook_id"),
+        reference=reference,
+    )
+
+
+# 🟣────────────────────────────────────────────
+#        ⏱ Replay
+# 🟣────────────────────────────────────────────
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * pct / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def replay(corpus: Path, repeat: int, warmup: int) -> dict:
+    from cogs.events.on_message_create import MessageCreateListener
+    from cogs.events.on_message_edit import OnMessageEditCog
+    from utils.functions import webhook_func
+    from utils.logs.discord_log_sink import discord_log_sink
+
+    async def count_webhook_send(*args, **kwargs):
+        Counters.sends += 1
+
+    # Webhook sends are only counted
+    webhook_func.dispatch_webhook = count_webhook_send
+
+    seeds, records = load_corpus(corpus)
+    guilds: dict[int, FakeGuild] = {}
+    seed_members(seeds, guilds)
+    bot = FakeBot(guilds)
+    create_cog = MessageCreateListener(bot)
+    edit_cog = OnMessageEditCog(bot)
+
+    # (listener, kind) -> latencies in ms
+    timings: dict[tuple[str, str], list[float]] = defaultdict(list)
+    errors: dict[tuple[str, str], int] = defaultdict(int)
+    logs_before = discord_log_sink.submitted
+    message_id = 10**15
+
+    for round_no in range(warmup + repeat):
+        for record in records:
+            message_id += 2
+            after = build_message(record, record, message_id, guilds)
+            if record.get("event") == "edit":
+                listener = "on_message_edit"
+                before = build_message(
+                    record, record.get("before", record), message_id - 1, guilds
+                )
+                call = edit_cog.on_message_edit(before, after)
+            else:
+                listener = "on_message"
+                call = create_cog.on_message(after)
+
+            key = (listener, record.get("kind", "other"))
+            start = time.perf_counter()
+            try:
+                await call
+            except Exception as e:
+                if round_no >= warmup:
+                    errors[key] += 1
+                if round_no == 0:
+                    print(f"{key[0]} / {key[1]} raised {e!r}", file=sys.stderr)
+            elapsed = (time.perf_counter() - start) * 1000
+            if round_no >= warmup:
+                timings[key].append(elapsed)
+
+    return {
+        "timings": timings,
+        "errors": errors,
+        "error_logs": discord_log_sink.submitted - logs_before,
+    }
+
+
+def print_report(result: dict, repeat: int):
+    timings, errors = result["timings"], result["errors"]
+
+    def row(name: str, values: list[float], error_count: int):
+        values = sorted(values)
+        total_s = sum(values) / 1000
+        rate = len(values) / total_s if total_s else float("inf")
+        print(
+            f"{name:<34} {len(values):>7} {percentile(values, 50):>8.3f} "
+            f"{percentile(values, 95):>8.3f} {percentile(values, 99):>8.3f} "
+            f"{values[-1] if values else 0:>8.3f} {rate:>10.0f} {error_count:>6}"
+        )
+
+    print(
+        f"{'listener / kind':<34} {'msgs':>7} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'msgs/s':>10} {'errors':>6}"
+    )
+    for listener in ("on_message", "on_message_edit"):
+        keys = sorted(k for k in timings if k[0] == listener)
+        if not keys:
+            continue
+        all_values = [v for k in keys for v in timings[k]]
+        row(listener, all_values, sum(errors[k] for k in keys))
+        for key in keys:
+            row(f"  {key[1]}", timings[key], errors[key])
+
+    total = sum(len(v) for v in timings.values())
+    print(
+        f"\n{total} messages over {repeat} rounds · "
+        f"{Counters.sends} sends and {Counters.db_calls} DB calls stubbed · "
+        f"{result['error_logs']} warn/error logs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=100, help="timed rounds")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed rounds")
+    parser.add_argument(
+        "--log-level",
+        default="critical",
+        help="console log level while replaying (default: critical)",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="keep the debug_log toggles enabled in the listener modules",
+    )
+    args = parser.parse_args()
+
+    from utils.logs.log_backend import set_log_level
+
+    set_log_level(args.log_level)
+    # Importing the cogs runs the listener modules' enable_debug calls
+    import cogs.events.on_message_create  # noqa: F401
+    import cogs.events.on_message_edit  # noqa: F401
+    from utils.logs.debug_log import DEBUG_TOGGLES, disable_debug
+
+    if not args.debug:
+        for func_path in list(DEBUG_TOGGLES):
+            disable_debug(func_path)
+    logging.disable(logging.CRITICAL)
+    result = asyncio.run(replay(args.corpus, args.repeat, args.warmup))
+    print_report(result, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+from typing import Literal
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import (
+    ARCEUS_EMBED_COLOR,
+    KHY_USER_ID,
+    YUKI_USER_ID,
+)
+from utils.db import query_stats
+from utils.db.get_pg_pool import PREPARED_STATEMENTS
+from utils.db.write_behind import fetch_write_behind_stats
+
+STATS_ALLOWED_USER_IDS = {YUKI_USER_ID, KHY_USER_ID}
+TOP_ROWS = 15
+
+
+def _short_module(module: str) -> str:
+    return module.rsplit(".", 1)[-1]
+
+
+def _stats_line(name: str, stats: query_stats.LatencyStats) -> str:
+    return (
+        f"**{name}** — total `{stats.total_ms / 1000:.1f}s` · calls `{stats.calls}` · "
+        f"rows `{stats.rows}` · errors `{stats.errors}`\n"
+        f"avg `{stats.avg_ms:.1f}ms` · p50 ≤`{stats.percentile_ms(50):.0f}ms` · "
+        f"p95 ≤`{stats.percentile_ms(95):.0f}ms` · max `{stats.max_ms:.0f}ms`"
+    )
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: DB Stats
+#   Query latency / pool stats recorded by SafePool
+# 🍰──────────────────────────────
+class DBStats(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="dbstats",
+        description="Show database query latency and pool stats",
+    )
+    @app_commands.describe(
+        view="Group by DB module (default) or by individual query",
+        reset="Clear the stats after showing them",
+    )
+    async def dbstats(
+        self,
+        interaction: discord.Interaction,
+        view: Literal["modules", "queries"] = "modules",
+        reset: bool = False,
+    ):
+        if interaction.user.id not in STATS_ALLOWED_USER_IDS:
+            await interaction.response.send_message(
+                "❌ Only Yuki or Khy is allowed to use this command!", ephemeral=True
+            )
+            return
+
+        if view == "modules":
+            rows = [
+                (_short_module(module), stats)
+                for module, stats in query_stats.stats_by_module().items()
+            ]
+        else:
+            rows = [
+                (f"{_short_module(module)} · {key}", stats)
+                for (module, key), stats in query_stats.query_stats.items()
+            ]
+        # Whoever spends the most total time in the DB comes first
+        rows.sort(key=lambda row: row[1].total_ms, reverse=True)
+
+        wait = query_stats.pool_wait_stats
+        lines = [_stats_line(name, stats) for name, stats in rows[:TOP_ROWS]]
+        description = "\n\n".join(lines) or "No queries recorded yet."
+        embed = discord.Embed(
+            title="💾 Database Stats",
+            description=(
+                f"Since <t:{int(query_stats.stats_since)}:R>\n\n{description}"
+            )[:4096],
+            color=ARCEUS_EMBED_COLOR,
+        )
+        embed.add_field(
+            name="Pool",
+            value=(
+                f"acquires `{wait.calls}` · wait avg `{wait.avg_ms:.1f}ms` · "
+                f"p95 ≤`{wait.percentile_ms(95):.0f}ms` · max `{wait.max_ms:.0f}ms`\n"
+                f"retries `{query_stats.pool_counters['retries']}` · "
+                f"reconnects `{query_stats.pool_counters['reconnects']}` · "
+                f"named statements `{len(PREPARED_STATEMENTS)}`"
+            ),
+            inline=False,
+        )
+        buffers = fetch_write_behind_stats()
+        if buffers:
+            embed.add_field(
+                name="Write-behind",
+                value="\n".join(
+                    f"**{b['name']}** — pending `{b['pending']}` · "
+                    f"flushed `{b['flushed_rows']}` in `{b['flushes']}` · "
+                    f"coalesced `{b['coalesced']}` · failures `{b['failures']}` · "
+                    f"dropped `{b['dropped']}` · last `{b['last_flush_ms']}ms`"
+                    for b in buffers
+                )[:1024],
+                inline=False,
+            )
+        embed.set_footer(
+            text=f"Top {min(len(rows), TOP_ROWS)} of {len(rows)} by total time"
+        )
+
+        if reset:
+            query_stats.reset_db_stats()
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    dbstats.extras = {"category": "Staff"}
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(DBStats(bot))
@@ -1,7 +1,16 @@
 import asyncio
+import time
 
+import discord
+from discord import app_commands
 from discord.ext import commands
 
+from Constants.vn_allstars_constants import (
+    ARCEUS_EMBED_COLOR,
+    KHY_USER_ID,
+    YUKI_USER_ID,
+)
+
 # 🧹 Import your scheduled tasks
 from utils.background_task.reminders_checker import check_and_trigger_reminders
 from utils.background_task.secret_santa_timer_checker import secret_santa_timer_checker
@@ -14,10 +23,44 @@ from utils.background_task.special_battle_timer_checker import (
 from utils.logs.pretty_log import pretty_log
 from utils.background_task.berry_checker import berry_reminder_checker
 from utils.background_task.berry_water_checker import berry_water_reminder
+from utils.background_task.checker_runner import central_checkers
+from utils.background_task.reminder_scheduler import (
+    start_reminder_scheduler,
+    stop_reminder_scheduler,
+)
+from utils.cache.monthly_goal_tracker_cache import flush_monthly_goal_cache
+from utils.cache.weekly_goal_tracker_cache import flush_weekly_goal_cache
+from utils.essentials.listener_stats import dump_listener_stats
+
+TICK_SECONDS = 60
+STATS_ALLOWED_USER_IDS = {YUKI_USER_ID, KHY_USER_ID}
+
+# ⏰ Reminder checkers, fired by the reminder scheduler at each due time
+# name -> (checker, timeout seconds)
+REMINDER_CHECKERS = {
+    "special_battle": (special_battle_timer_checker, 60),
+    "secret_santa": (secret_santa_timer_checker, 60),
+    "shiny_bonus": (check_and_handle_expired_shiny_bonus, 30),
+    "user_reminders": (check_and_trigger_reminders, 180),
+    "berry_moisture": (berry_water_reminder, 180),
+    "berry_growth": (berry_reminder_checker, 180),
+}
+
+# 🧼 Checkers started every tick
+TICK_CHECKERS = {
+    "weekly_goal_flush": (flush_weekly_goal_cache, 45),
+    "monthly_goal_flush": (flush_monthly_goal_cache, 45),
+    "listener_stats_dump": (dump_listener_stats, 10),
+}
+
+for _name, (_func, _timeout) in (REMINDER_CHECKERS | TICK_CHECKERS).items():
+    central_checkers.register(_name, _func, timeout=_timeout)
+
 
 # 🍰──────────────────────────────
 #   🎀 Cog: CentralLoop
-#   Handles background tasks every 60 seconds
+#   Starts the goal cache flushes every 60 seconds
+#   and the event-driven reminder scheduler
 # 🍰──────────────────────────────
 class CentralLoop(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -25,6 +68,8 @@ class CentralLoop(commands.Cog):
         self.loop_task = None
 
     def cog_unload(self):
+        stop_reminder_scheduler()
+        central_checkers.cancel_all()
         if self.loop_task and not self.loop_task.done():
             self.loop_task.cancel()
             pretty_log(
@@ -37,8 +82,6 @@ class CentralLoop(commands.Cog):
     async def central_loop(self):
         """Background loop that ticks every 60 seconds"""
         await self.bot.wait_until_ready()
-        from utils.cache.monthly_goal_tracker_cache import flush_monthly_goal_cache
-        from utils.cache.weekly_goal_tracker_cache import flush_weekly_goal_cache
 
         pretty_log(
             "",
@@ -46,54 +89,63 @@ class CentralLoop(commands.Cog):
             label="🧭 CENTRAL LOOP",
             bot=self.bot,
         )
+        next_tick = time.time()
         while not self.bot.is_closed():
-            try:
-                """pretty_log(
-                    "",
-                    "🔂 Running background checks...",
-                    label="🧭 CENTRAL LOOP",
-                    bot=self.bot,
-                )"""
-
-                # ⏰ Check if any special battle timers are due
-                await special_battle_timer_checker(bot=self.bot)
-
-                # 🎅 Check if any Secret Santa reminders are due
-                await secret_santa_timer_checker(bot=self.bot)
-
-                # 💎 Check if shiny bonus has expired
-                await check_and_handle_expired_shiny_bonus(bot=self.bot)
-
-                # 🧼 Flush weekly goal cache
-                await flush_weekly_goal_cache(bot=self.bot)
-
-                # 🧼 Flush monthly goal cache
-                await flush_monthly_goal_cache(bot=self.bot)
-
-                # ⏰ Check and trigger due reminders
-                await check_and_trigger_reminders(bot=self.bot)
-
-                # Check berry water reminders
-                await berry_water_reminder(bot=self.bot)
-
-                # Check berry growth reminders
-                await berry_reminder_checker(bot=self.bot)
+            # Each checker runs as its own task with its own timeout; one that
+            # is still busy from the previous tick is skipped, not stacked
+            central_checkers.start_all(self.bot, TICK_CHECKERS, due_at=next_tick)
 
-            except Exception as e:
-                pretty_log(
-                    "error",
-                    f"{e}",
-                    label="CENTRAL LOOP ERROR",
-                    bot=self.bot,
-                )
-            await asyncio.sleep(60)  # ⏱ tick interval
+            # ⏱ Fixed-rate tick, so lag stats measure real delay
+            next_tick += TICK_SECONDS
+            if next_tick < time.time():
+                # Fell a whole tick behind (e.g. event loop stall), don't burst
+                next_tick = time.time()
+            await asyncio.sleep(max(next_tick - time.time(), 0))
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Start the loop automatically once the bot is ready"""
+        """Start the loop and reminder scheduler once the bot is ready"""
+        await start_reminder_scheduler(self.bot, REMINDER_CHECKERS)
         if not self.loop_task:
             self.loop_task = asyncio.create_task(self.central_loop())
 
+    # 📊 Checker duration / lag stats
+    @app_commands.command(
+        name="checker-stats",
+        description="Show run time and lag stats of the background checkers",
+    )
+    async def checker_stats(self, interaction: discord.Interaction):
+        if interaction.user.id not in STATS_ALLOWED_USER_IDS:
+            await interaction.response.send_message(
+                "❌ Only Yuki or Khy is allowed to use this command!", ephemeral=True
+            )
+            return
+
+        lines = []
+        for name, stats in central_checkers.stats().items():
+            running = " 🔄" if central_checkers.is_running(name) else ""
+            last_run = (
+                f"<t:{int(stats.last_started_at)}:R>"
+                if stats.last_started_at
+                else "never"
+            )
+            lines.append(
+                f"**{name}**{running} — last run {last_run}\n"
+                f"runs `{stats.runs}` · skipped `{stats.skipped}` · "
+                f"timeouts `{stats.timeouts}` · errors `{stats.errors}`\n"
+                f"duration avg `{stats.avg_duration:.2f}s` · last `{stats.last_duration:.2f}s` · "
+                f"max `{stats.max_duration:.2f}s`\n"
+                f"lag last `{stats.last_lag:.2f}s` · max `{stats.max_lag:.2f}s`"
+            )
+        embed = discord.Embed(
+            title="🧭 Background Checker Stats",
+            description="\n\n".join(lines) or "No checkers registered.",
+            color=ARCEUS_EMBED_COLOR,
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    checker_stats.extras = {"category": "Staff"}
+
 
 # ====================
 # 🔹 Setup
@@ -104,13 +156,15 @@ async def setup(bot: commands.Bot):
 
     print("\n[📋 CENTRAL LOOP CHECKLIST] Scheduled tasks loaded:")
     print("  ─────────────────────────────────────────────")
+    print("  ✅ 🧼  weekly_goal_tracker_cache_flush")
+    print("  ✅ 🧼  monthly_goal_tracker_cache_flush")
+    print("  ✅ ⏱  listener_stats_dump (every 15 minutes)")
+    print("  🧭 CentralLoop ticking every 60 seconds!")
     print("  ✅ ⏰  special_battle_timer_checker")
     print("  ✅ 🎅  secret_santa_timer_checker")
     print("  ✅ 💎  shiny_bonus_checker")
-    print("  ✅ 🧼  weekly_goal_tracker_cache_flush")
-    print("  ✅ 🧼  monthly_goal_tracker_cache_flush")
     print("  ✅ ⏰  reminders_checker")
     print("  ✅ ⏰  berry_reminder_checker")
     print("  ✅ ⏰  berry_water_reminder")
-    print("  🧭 CentralLoop ticking every 60 seconds!")
+    print("  ⏰ Reminders fire at their due time via the reminder scheduler!")
     print("  ─────────────────────────────────────────────\n")
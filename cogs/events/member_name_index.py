@@ -0,0 +1,61 @@
+import discord
+from discord.ext import commands
+
+from utils.cache.member_name_cache import (
+    build_guild_member_index,
+    index_member,
+    member_name_index,
+    unindex_member,
+)
+
+
+# 🍭──────────────────────────────
+#   🎀 Member Name Index Events
+# 🍭──────────────────────────────
+class MemberNameIndexCog(commands.Cog):
+    """Keeps the per-guild member name index in sync with member events."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            build_guild_member_index(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        build_guild_member_index(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        for member in guild.members:
+            unindex_member(guild.id, member.id)
+        member_name_index.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.name != after.name or before.display_name != after.display_name:
+            index_member(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # Username / global name changes arrive once per user, not per guild
+        if before.name == after.name and before.global_name == after.global_name:
+            return
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member:
+                index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        unindex_member(member.guild.id, member.id)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MemberNameIndexCog(bot))
@@ -58,6 +58,7 @@ from utils.listener_func.special_battle_npc_listener import (
 from utils.listener_func.wb_reg_listener import register_wb_battle_reminder
 from utils.listener_func.weekly_stats_listener import weekly_stats_listener
 from utils.AR.promo import promo_team
+from utils.essentials.trigger_registry import TriggerRegistry
 # ————————————————————————————————
 # 🩵 Import DB Functions
 #  ———————————————————————————————
@@ -99,6 +100,341 @@ secret_santa_phrases = [
 CC_SHINY_BONUS_CHANNEL_ID = 1457171231445876746
 
 
+# 🐾────────────────────────────────────────────
+#        🌸 Message Trigger Table
+# 🐾────────────────────────────────────────────
+# Every listener is declared once here and compiled into one scanner per
+# message field, so on_message does a single pass per field no matter how
+# many listeners are added. Handlers run in the order they are registered.
+message_triggers = TriggerRegistry()
+
+# ————————————————————————————————
+# 🩵 CC Channel Listeners (any author)
+# ————————————————————————————————
+message_triggers.register(
+    "cc_bump_reminder",
+    check_cc_bump_reminder,
+    guild_id=CC_GUILD_ID,
+    channel_id=CC_BUMP_CHANNEL_ID,
+    any_author=True,
+    log="Detected message in CC bump channel",
+    label="CC Bump Reminder Listener",
+)
+message_triggers.register(
+    "cc_shiny_bonus",
+    lambda bot, message: read_shiny_bonus_timestamp_from_cc_channel(
+        bot=bot, message=message
+    ),
+    guild_id=CC_GUILD_ID,
+    channel_id=CC_SHINY_BONUS_CHANNEL_ID,
+    any_author=True,
+    log="Detected message in CC shiny bonus channel",
+    label="CC Shiny Bonus Listener",
+)
+message_triggers.register(
+    "cc_promo_team",
+    lambda bot, message: promo_team_listener(bot=bot, message=message),
+    guild_id=CC_GUILD_ID,
+    channel_id=CC_PROMO_CHANNEL_ID,
+    any_author=True,
+    log="Detected message in CC promo channel",
+    label="CC Promo Team Listener",
+)
+
+# ————————————————————————————————
+# 🩵 Promo Team
+# ————————————————————————————————
+message_triggers.register(
+    "promo_team",
+    lambda bot, message: promo_team(bot=bot, message=message),
+    field="content",
+    needles="!promo",
+    ignore_case=True,
+    log="Detected !promo command message",
+    label="Promo Team Listener",
+)
+
+# ————————————————————————————————
+# 🩵 Clan wars server
+# ————————————————————————————————
+message_triggers.register(
+    "clan_wars_stats",
+    lambda bot, message: stats_command_listener(
+        bot=bot, before_message=message, after_message=message
+    ),
+    field="author",
+    needles="Stats",
+    guild_id=CLAN_WARS_SERVER_ID,
+    log="Detected stats command embed from PokéMeow bot",
+    label="Clan Wars Stats Listener",
+)
+message_triggers.register(
+    "clan_wars_autospawn",
+    as_spawn_ping,
+    guild_id=CLAN_WARS_SERVER_ID,
+    channel_id=CLAN_WARS_TEXT_CHANNELS.autospawn,
+)
+
+# ————————————————————————————————
+# 🩵 VNA Berry Listeners
+# ————————————————————————————————
+message_triggers.register(
+    "vna_berry_garden",
+    lambda bot, message: berry_listener(
+        bot=bot, before_message=message, message=message
+    ),
+    field="description",
+    needles="garden overview",
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+    log="Detected Garden Overview embed, processing berry reminders",
+)
+message_triggers.register(
+    "vna_berry_water",
+    lambda bot, message: handle_berry_water_message(bot=bot, message=message),
+    field="content",
+    needles=("Watered", "Next stage"),
+    guild_id=Server.VNA_ID,
+    log="Detected Berry Water message, processing berry water reminders",
+)
+message_triggers.register(
+    "vna_berry_mulch",
+    lambda bot, message: handle_mulch_message(bot=bot, message=message),
+    field="content",
+    needles=("Applied", "Mulch", "to Slot"),
+    guild_id=Server.VNA_ID,
+    log="Detected Mulch message, processing growth mulch reminders",
+)
+
+# ————————————————————————————————
+# 🩵 VNA Pokemon Spawn, Fish and Battle Timers
+# ————————————————————————————————
+message_triggers.register(
+    "vna_pokemon_timer",
+    lambda bot, message: pokemon_timer_handler(message),
+    field="content",
+    needles="found a wild",
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+)
+message_triggers.register(
+    "vna_pokemon_spawn",
+    pokemon_spawn_listener,
+    field="content",
+    needles="found a wild",
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+)
+message_triggers.register(
+    "vna_fish_timer",
+    lambda bot, message: fish_timer_handler(message),
+    field="description",
+    needles=("cast a", "into the water"),
+    guild_id=Server.VNA_ID,
+)
+message_triggers.register(
+    "vna_battle_timer",
+    lambda bot, message: battle_timer_handler(bot=bot, message=message),
+    field="author",
+    needles="PokeMeow Battles",
+    guild_id=Server.VNA_ID,
+)
+
+# ————————————————————————————————
+# 🩵 VNA Autospawn
+# ————————————————————————————————
+message_triggers.register(
+    "vna_autospawn",
+    as_spawn_ping,
+    guild_id=Server.VNA_ID,
+    channel_id=PublicChannels.Poke_Spawn,
+)
+
+"""# ————————————————————————————————
+# 🩵 VNA Market Snipe
+# ————————————————————————————————
+for feed_channel_id in MARKET_FEED_CHANNEL_IDS:
+    message_triggers.register(
+        "vna_market_snipe",
+        market_feeds_listener,
+        guild_id=Server.VNA_ID,
+        channel_id=feed_channel_id,
+    )"""
+
+# ————————————————————————————————
+# 🩵 VNA Weekly / Monthly Stats Listeners
+# ————————————————————————————————
+message_triggers.register(
+    "vna_weekly_stats",
+    lambda bot, message: weekly_stats_listener(
+        bot=bot, before_message=message, after_message=message
+    ),
+    field="title",
+    needles=triggers["weekly_stats_command"],
+    guild_id=Server.VNA_ID,
+    log="Detected weekly stats embed from PokéMeow bot",
+    label="Weekly Stats Listener",
+)
+message_triggers.register(
+    "vna_monthly_stats",
+    lambda bot, message: monthly_stats_listener(
+        bot=bot, before_message=message, after_message=message
+    ),
+    field="title",
+    needles=triggers["monthly_stats_command"],
+    guild_id=Server.VNA_ID,
+    log="Detected monthly stats embed from PokéMeow bot",
+    label="Monthly Stats Listener",
+)
+
+# 🔧───────────────────────────────────────────────🔧
+# 🔧    🩵 World Boss / EE Listeners
+# 🔧───────────────────────────────────────────────🔧
+message_triggers.register(
+    "vna_wb_spawn",
+    lambda bot, message: extract_boss_from_wb_spawn_command(bot=bot, message=message),
+    field="content",
+    needles=triggers["wb_spawn"],
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+    log="Detected world boss spawn message from PokéMeow bot",
+    label="World Boss Spawn Listener",
+)
+message_triggers.register(
+    "vna_wb_command",
+    lambda bot, message: extract_boss_from_wb_command_embed(bot=bot, message=message),
+    field="title",
+    needles=triggers["wb_command"],
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+    log="Detected world boss command embed from PokéMeow bot",
+    label="World Boss Command Embed Listener",
+)
+message_triggers.register(
+    "vna_ee_vote_checker",
+    lambda bot, message: check_ee_near_spawn_alert(bot=bot, message=message),
+    field="title",
+    needles=triggers["ee_vote_checker"],
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+    log="Detected EE vote checker embed from PokéMeow bot",
+    label="EE Near Spawn Alert Checker",
+)
+
+# 🔧───────────────────────────────────────────────🔧
+# 🔧 🩵 Faction Ball Listener from ;fa
+# 🔧───────────────────────────────────────────────🔧
+message_triggers.register(
+    "vna_faction_ball",
+    lambda bot, message: extract_faction_ball_from_fa(bot=bot, message=message),
+    field="author",
+    needles=tuple(FACTIONS),
+    require_all=False,
+    ignore_case=True,
+    guild_id=Server.VNA_ID,
+)
+
+# 🔧───────────────────────────────────────────────🔧
+# 🔧    🩵 WB Battle Reminder Registration Listener
+# 🔧───────────────────────────────────────────────🔧
+message_triggers.register(
+    "vna_wb_register",
+    lambda bot, message: register_wb_battle_reminder(bot=bot, message=message),
+    field="description",
+    needles=(
+        "<:checkedbox:752302633141665812> You are registered for this fight",
+        ";wb fight",
+    ),
+    guild_id=Server.VNA_ID,
+)
+
+# ————————————————————————————————
+# 🩵 Special Battle NPC Listeners
+# ————————————————————————————————
+message_triggers.register(
+    "vna_special_battle_npc",
+    lambda bot, message: special_battle_npc_listener(bot=bot, message=message),
+    field="description",
+    needles="challenged <:xmas_blue:1451059140955734110> **XMAS Blue** to a battle!",
+    guild_id=Server.VNA_ID,
+    log="🔹 Matched Special Battle NPC Listener for XMAS BLUE",
+)
+message_triggers.register(
+    "vna_special_battle_npc_timer",
+    lambda bot, message: special_battle_npc_timer_listener(bot=bot, message=message),
+    field="content",
+    needles=":x: You cannot fight XMAS Blue yet! He will be available for you to re-battle",
+    guild_id=Server.VNA_ID,
+    log="🔹 Matched Special Battle NPC Timer Listener for XMAS BLUE",
+)
+
+# ————————————————————————————————
+# 🩵 Secret Santa Listeners
+# ————————————————————————————————
+message_triggers.register(
+    "vna_secret_santa",
+    lambda bot, message: secret_santa_listener(bot=bot, message=message),
+    field="content",
+    needles=tuple(secret_santa_phrases),
+    guild_id=Server.VNA_ID,
+    log="🎅 Matched Secret Santa Listener",
+)
+message_triggers.register(
+    "vna_secret_santa_timer",
+    lambda bot, message: secret_santa_timer_listener(bot=bot, message=message),
+    field="content",
+    needles=":x: You may send out another gift on",
+    guild_id=Server.VNA_ID,
+    log="🎅 Matched Secret Santa Timer Listener",
+)
+
+# ————————————————————————————————
+# 🩵 Shiny Bonus Listener
+# ————————————————————————————————
+message_triggers.register(
+    "global_bonus",
+    lambda bot, message: handle_pokemeow_global_bonus(bot=bot, message=message),
+    field="title",
+    needles=triggers["global_bonus"],
+    log="Detected global bonus embed from PokéMeow bot",
+    label="Shiny Bonus Listener",
+)
+
+# ————————————————————————————————
+# 🩵 Incense Listeners
+# ————————————————————————————————
+message_triggers.register(
+    "incense_command",
+    lambda bot, message: incense_command_handler(bot=bot, message=message),
+    field="footer",
+    needles=triggers["incense_command"],
+    log="Detected incense command embed from PokéMeow bot",
+    label="Incense Command Handler",
+)
+message_triggers.register(
+    "incense_use",
+    lambda bot, message: incense_use_handler(bot=bot, message=message),
+    field="content",
+    needles=triggers["incense_use"],
+    log="Detected incense use message from PokéMeow bot",
+    label="Incense Use Handler",
+)
+message_triggers.register(
+    "has_incense",
+    lambda bot, message: server_has_incense_handler(bot=bot, message=message),
+    field="content",
+    needles=triggers["has_incense"],
+)
+message_triggers.register(
+    "incense_depleted",
+    lambda bot, message: incense_depleted_handler(bot=bot, message=message),
+    field="content",
+    needles=triggers["incense_depleted"],
+    log="Detected incense depleted message from PokéMeow bot",
+    label="Incense Depleted Handler",
+)
+
+
 # 🐾────────────────────────────────────────────
 #        🌸 Message Create Listener Cog
 # 🐾────────────────────────────────────────────
@@ -119,362 +455,15 @@ class MessageCreateListener(commands.Cog):
             return  # Skip DMs
 
         try:
-            # ————————————————————————————————
-            # 🩵 CC Bump Reminder Listener
-            # ————————————————————————————————
-            if guild.id == CC_GUILD_ID:
-                if message.channel.id == CC_BUMP_CHANNEL_ID:
-                    pretty_log(
-                        "info",
-                        f"Detected message in CC bump channel: Message ID {message.id}",
-                        label="CC Bump Reminder Listener",
-                    )
-                    await check_cc_bump_reminder(self.bot, message)
-                if message.channel.id == CC_SHINY_BONUS_CHANNEL_ID:
-                    pretty_log(
-                        "info",
-                        f"Detected message in CC shiny bonus channel: Message ID {message.id}",
-                        label="CC Shiny Bonus Listener",
-                    )
-                    await read_shiny_bonus_timestamp_from_cc_channel(
-                        bot=self.bot, message=message
-                    )
-                if message.channel.id == CC_PROMO_CHANNEL_ID:
-                    pretty_log(
-                        "info",
-                        f"Detected message in CC promo channel: Message ID {message.id}",
-                        label="CC Promo Team Listener",
-                    )
-                    await promo_team_listener(bot=self.bot, message=message)
-            # ————————————————————————————————
-            # 🏰 Ignore non-PokéMeow bot messages
-            # ————————————————————————————————
-            # 🚫 Ignore all bots except PokéMeow to prevent loops
-            if (
+            # 🚫 Only CC channel listeners see non-PokéMeow bot messages
+            trusted_author = not (
                 message.author.bot
                 and message.author.id != POKEMEOW_APPLICATION_ID
                 and not message.webhook_id
-            ):
-                return
-
-            content = message.content
-            first_embed = message.embeds[0] if message.embeds else None
-            first_embed_author = (
-                first_embed.author.name if first_embed and first_embed.author else ""
-            )
-            first_embed_description = (
-                first_embed.description
-                if first_embed and first_embed.description
-                else ""
-            )
-            first_embed_footer = (
-                first_embed.footer.text if first_embed and first_embed.footer else ""
             )
-            first_embed_title = (
-                first_embed.title if first_embed and first_embed.title else ""
+            await message_triggers.dispatch(
+                self.bot, message, trusted_author=trusted_author
             )
-            # ————————————————————————————————
-            # 🩵 Promo Team
-            # ————————————————————————————————
-            if content and "!promo" in content.lower():
-                pretty_log(
-                    "info",
-                    f"Detected !promo command message: Message ID {message.id}",
-                    label="Promo Team Listener",
-                )
-                await promo_team(bot=self.bot, message=message)
-
-            # ————————————————————————————————
-            # 🩵 Clan wars server message logic
-            # ————————————————————————————————
-            if guild.id == CLAN_WARS_SERVER_ID:
-                if first_embed:
-                    if "Stats" in first_embed_author:
-                        pretty_log(
-                            "info",
-                            f"Detected stats command embed from PokéMeow bot: Message ID {message.id}",
-                            label="Clan Wars Stats Listener",
-                        )
-                        await stats_command_listener(
-                            bot=self.bot, before_message=message, after_message=message
-                        )
-                if message.channel.id == CLAN_WARS_TEXT_CHANNELS.autospawn:
-                    await as_spawn_ping(self.bot, message)
-
-            # ————————————————————————————————
-            # 🩵 VNA message logic
-            # ————————————————————————————————
-            if guild.id == Server.VNA_ID:
-                first_embed = message.embeds[0] if message.embeds else None
-                first_embed_description = first_embed.description if first_embed else ""
-                first_embed_author = (
-                    first_embed.author.name
-                    if first_embed and first_embed.author
-                    else ""
-                )
-                # ————————————————————————————————
-                # 🩵 VNA Berry Command Listener
-                # ————————————————————————————————
-                if first_embed:
-                    if (
-                        first_embed_description
-                        and "garden overview" in first_embed_description.lower()
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Garden Overview embed, processing berry reminders...",
-                        )
-                        await berry_listener(
-                            bot=self.bot,
-                            before_message=message,
-                            message=message,
-                        )
-                # ————————————————————————————————
-                # 🩵 VNA Berry Water Listener
-                # ————————————————————————————————
-                if message.content:
-                    if "Watered" in message.content and "Next stage" in message.content:
-                        pretty_log(
-                            "info",
-                            "Detected Berry Water message, processing berry water reminders...",
-                        )
-                        await handle_berry_water_message(bot=self.bot, message=message)
-                # ————————————————————————————————
-                # 🩵 VNA Berry Mulch Listener
-                # ————————————————————————————————
-                if message.content:
-                    if (
-                        "Applied" in message.content
-                        and "Mulch" in message.content
-                        and "to Slot" in message.content
-                    ):
-                        pretty_log(
-                            "info",
-                            "Detected Mulch message, processing growth mulch reminders...",
-                        )
-                        await handle_mulch_message(bot=self.bot, message=message)
-
-
-                # ————————————————————————————————
-                # 🩵 VNA Pokemon Spawn
-                # ————————————————————————————————
-                if content and "found a wild" in content.lower():
-                    await pokemon_timer_handler(message)
-                    await pokemon_spawn_listener(self.bot, message)
-
-                # ————————————————————————————————
-                # 🩵 VNA Fish Timer
-                # ————————————————————————————————
-                if message.embeds and message.embeds[0]:
-                    embed = message.embeds[0]
-                    embed_description = embed.description if embed else None
-                    if (
-                        embed_description
-                        and "cast a" in embed_description
-                        and "into the water" in embed_description
-                    ):
-                        await fish_timer_handler(message)
-                # ————————————————————————————————
-                # 🩵 VNA Battle Timer
-                # ————————————————————————————————
-                if first_embed_author and "PokeMeow Battles" in first_embed_author:
-                    await battle_timer_handler(bot=self.bot, message=message)
-
-                # ————————————————————————————————
-                # 🩵 VNA Autospawn
-                # ————————————————————————————————
-                if message.channel.id == PublicChannels.Poke_Spawn:
-                    await as_spawn_ping(self.bot, message)
-
-                """# ————————————————————————————————
-                # 🩵 VNA Market Snipe
-                # ————————————————————————————————
-                if message.channel.id in MARKET_FEED_CHANNEL_IDS:
-                    await market_feeds_listener(self.bot, message)"""
-
-                # ————————————————————————————————
-                # 🩵 VNA Weekly Stats Listener
-                # ————————————————————————————————
-                if first_embed:
-                    if triggers["weekly_stats_command"] in first_embed_title:
-                        pretty_log(
-                            "info",
-                            f"Detected weekly stats embed from PokéMeow bot: Message ID {message.id}",
-                            label="Weekly Stats Listener",
-                        )
-                        await weekly_stats_listener(
-                            bot=self.bot, before_message=message, after_message=message
-                        )
-                # ————————————————————————————————
-                # 🩵 VNA Monthly Stats Listener
-                # ————————————————————————————————
-                if first_embed:
-                    if triggers["monthly_stats_command"] in first_embed_title:
-                        pretty_log(
-                            "info",
-                            f"Detected monthly stats embed from PokéMeow bot: Message ID {message.id}",
-                            label="Monthly Stats Listener",
-                        )
-                        await monthly_stats_listener(
-                            bot=self.bot, before_message=message, after_message=message
-                        )
-                # 🔧───────────────────────────────────────────────🔧
-                # 🔧    🩵 World Boss Spawn Listener
-                # 🔧───────────────────────────────────────────────🔧
-                if message.content:
-                    if triggers["wb_spawn"] in message.content.lower():
-                        pretty_log(
-                            "info",
-                            f"Detected world boss spawn message from PokéMeow bot: Message ID {message.id}",
-                            label="World Boss Spawn Listener",
-                        )
-                        await extract_boss_from_wb_spawn_command(
-                            bot=self.bot, message=message
-                        )
-
-                # 🔧───────────────────────────────────────────────🔧
-                # 🔧    🩵 World Boss Command Embed Listener
-                # 🔧───────────────────────────────────────────────🔧
-                if message.embeds:
-                    embed_title = (
-                        message.embeds[0].title if message.embeds[0].title else ""
-                    )
-                    if triggers["wb_command"] in embed_title.lower():
-                        pretty_log(
-                            "info",
-                            f"Detected world boss command embed from PokéMeow bot: Message ID {message.id}",
-                            label="World Boss Command Embed Listener",
-                        )
-                        await extract_boss_from_wb_command_embed(
-                            bot=self.bot, message=message
-                        )
-
-                # 🔧───────────────────────────────────────────────🔧
-                # 🔧    🩵 EE Near Spawn Alert Checker
-                # 🔧───────────────────────────────────────────────🔧
-                if message.embeds:
-                    embed_title = (
-                        message.embeds[0].title if message.embeds[0].title else ""
-                    )
-                    if triggers["ee_vote_checker"] in embed_title.lower():
-                        pretty_log(
-                            "info",
-                            f"Detected EE vote checker embed from PokéMeow bot: Message ID {message.id}",
-                            label="EE Near Spawn Alert Checker",
-                        )
-                        await check_ee_near_spawn_alert(bot=self.bot, message=message)
-
-                # 🔧───────────────────────────────────────────────🔧
-                # 🔧 🩵 Faction Ball Listener from ;fa
-                # 🔧───────────────────────────────────────────────🔧
-                if first_embed:
-                    if first_embed.author and any(
-                        f in first_embed.author.name.lower() for f in FACTIONS
-                    ):
-                        await extract_faction_ball_from_fa(
-                            bot=self.bot, message=message
-                        )
-                # 🔧───────────────────────────────────────────────🔧
-                # 🔧    🩵 WB Battle Reminder Registration Listener
-                # 🔧───────────────────────────────────────────────🔧
-                if first_embed:
-                    if first_embed_description:
-                        if (
-                            "<:checkedbox:752302633141665812> You are registered for this fight"
-                            in first_embed_description
-                            and ";wb fight" in first_embed_description
-                        ):
-                            await register_wb_battle_reminder(
-                                bot=self.bot, message=message
-                            )
-                # ————————————————————————————————
-                # 🩵 Special Battle NPC Listeners
-                # ————————————————————————————————
-                if first_embed:
-                    if (
-                        first_embed.description
-                        and "challenged <:xmas_blue:1451059140955734110> **XMAS Blue** to a battle!"
-                        in first_embed.description
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🔹 Matched Special Battle NPC Listener for XMAS BLUE | message_id={message.id}",
-                        )
-                        await special_battle_npc_listener(bot=self.bot, message=message)
-                if (
-                    content
-                    and ":x: You cannot fight XMAS Blue yet! He will be available for you to re-battle"
-                    in content
-                ):
-                    pretty_log(
-                        "info",
-                        f"🔹 Matched Special Battle NPC Timer Listener for XMAS BLUE | message_id={message.id}",
-                    )
-                    await special_battle_npc_timer_listener(
-                        bot=self.bot, message=message
-                    )
-                # ————————————————————————————————
-                # 🩵 Secret Santa Listeners
-                # ————————————————————————————————
-                if message.content:
-                    # Check if all ss phrases are in the message content
-                    if all(
-                        phrase in message.content for phrase in secret_santa_phrases
-                    ):
-                        pretty_log(
-                            "info",
-                            f"🎅 Matched Secret Santa Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await secret_santa_listener(bot=self.bot, message=message)
-                # Secret Santa Timer Listener
-                if message.content:
-                    if ":x: You may send out another gift on" in message.content:
-                        pretty_log(
-                            "info",
-                            f"🎅 Matched Secret Santa Timer Listener | Message ID: {message.id} | Channel: {message.channel.name}",
-                        )
-                        await secret_santa_timer_listener(bot=self.bot, message=message)
-            # ————————————————————————————————
-            # 🩵 Shiny Bonus Listener
-            # ————————————————————————————————
-            if first_embed:
-                if triggers["global_bonus"] in first_embed_title:
-                    pretty_log(
-                        "info",
-                        f"Detected global bonus embed from PokéMeow bot: Message ID {message.id}",
-                        label="Shiny Bonus Listener",
-                    )
-                    await handle_pokemeow_global_bonus(bot=self.bot, message=message)
-            # ————————————————————————————————
-            # 🩵 Incense Listeners
-            # ————————————————————————————————
-            if first_embed:
-                # Incense Command Handler
-                if triggers["incense_command"] in first_embed_footer:
-                    pretty_log(
-                        "info",
-                        f"Detected incense command embed from PokéMeow bot: Message ID {message.id}",
-                        label="Incense Command Handler",
-                    )
-                    await incense_command_handler(bot=self.bot, message=message)
-            if message.content and triggers["incense_use"] in message.content:
-                pretty_log(
-                    "info",
-                    f"Detected incense use message from PokéMeow bot: Message ID {message.id}",
-                    label="Incense Use Handler",
-                )
-                await incense_use_handler(bot=self.bot, message=message)
-
-            if message.content and triggers["has_incense"] in message.content:
-                await server_has_incense_handler(bot=self.bot, message=message)
-
-            if message.content and triggers["incense_depleted"] in message.content:
-                pretty_log(
-                    "info",
-                    f"Detected incense depleted message from PokéMeow bot: Message ID {message.id}",
-                    label="Incense Depleted Handler",
-                )
-                await incense_depleted_handler(bot=self.bot, message=message)
 
         except Exception as e:
             # 🛑────────────────────────────────────────────
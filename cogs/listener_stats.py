@@ -0,0 +1,95 @@
+from typing import Literal
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import (
+    ARCEUS_EMBED_COLOR,
+    KHY_USER_ID,
+    YUKI_USER_ID,
+)
+from utils.essentials import listener_stats
+from utils.essentials.listener_stats import HandlerStats
+
+STATS_ALLOWED_USER_IDS = {YUKI_USER_ID, KHY_USER_ID}
+TOP_ROWS = 15
+
+
+def _stats_line(name: str, stats: HandlerStats) -> str:
+    latency = stats.latency
+    line = (
+        f"**{name}** — calls `{stats.calls}` · errors `{stats.errors}` · "
+        f"est. total `{stats.est_total_ms / 1000:.1f}s`"
+    )
+    if latency.calls:
+        line += (
+            f"\navg `{latency.avg_ms:.2f}ms` · p50 ≤`{latency.percentile_ms(50):.0f}ms` · "
+            f"p95 ≤`{latency.percentile_ms(95):.0f}ms` · max `{latency.max_ms:.0f}ms`"
+        )
+    if stats.last_error:
+        line += f"\nlast error `{stats.last_error[:120]}`"
+    return line
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: Listener Stats
+#   Per-handler calls / errors / latency of the message listeners
+# 🍰──────────────────────────────
+class ListenerStats(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="listener-stats",
+        description="Show per-handler call, error and latency stats of the message listeners",
+    )
+    @app_commands.describe(
+        sort="What the slowest handlers are ranked by (default: estimated total time)",
+        sample_every="Time 1 in N calls from now on (0 = latency sampling off)",
+        reset="Clear the stats after showing them",
+    )
+    async def listener_stats_command(
+        self,
+        interaction: discord.Interaction,
+        sort: Literal["total", "p95", "calls", "errors"] = "total",
+        sample_every: app_commands.Range[int, 0, 1000] | None = None,
+        reset: bool = False,
+    ):
+        if interaction.user.id not in STATS_ALLOWED_USER_IDS:
+            await interaction.response.send_message(
+                "❌ Only Yuki or Khy is allowed to use this command!", ephemeral=True
+            )
+            return
+
+        rows = listener_stats.sorted_listener_stats(sort)
+        lines = [_stats_line(name, stats) for name, stats in rows[:TOP_ROWS]]
+        embed = discord.Embed(
+            title="⏱ Listener Stats",
+            description=(
+                f"Since <t:{int(listener_stats.stats_since)}:R>\n\n"
+                + ("\n\n".join(lines) or "No listener calls recorded yet.")
+            )[:4096],
+            color=ARCEUS_EMBED_COLOR,
+        )
+
+        sampling = listener_stats.listener_sample_every()
+        if sample_every is not None:
+            listener_stats.set_listener_sampling(sample_every)
+            sampling = sample_every
+        embed.set_footer(
+            text=(
+                f"Top {min(len(rows), TOP_ROWS)} of {len(rows)} by {sort} · "
+                + (f"latency sampled 1 in {sampling}" if sampling else "latency sampling off")
+            )
+        )
+
+        if reset:
+            listener_stats.reset_listener_stats()
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    listener_stats_command.extras = {"category": "Staff"}
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ListenerStats(bot))
@@ -0,0 +1,91 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import ARCEUS_EMBED_COLOR, VN_ALLSTARS_EMOJIS
+from utils.cache.market_price_stats_cache import (
+    MIN_SAMPLES,
+    WINDOW_SECONDS,
+    fetch_market_price_stats,
+    snipe_reference_price,
+)
+from utils.db.market_value_db import fetch_market_value_cache
+from utils.essentials.pokemon_autocomplete import pokemon_autocomplete
+from utils.listener_func.market_feed_listener import SNIPE_PRICE_RATIO
+
+
+def _coins(value: int | None) -> str:
+    if value is None:
+        return "—"
+    return f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {value:,}"
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: Market Price
+#   Rolling market price stats from the market feed
+# 🍰──────────────────────────────
+class MarketPrice(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="market-price",
+        description="Show a Pokémon's recent market price stats",
+    )
+    @app_commands.describe(pokemon="The Pokémon to look up")
+    @app_commands.autocomplete(pokemon=pokemon_autocomplete)
+    async def market_price(self, interaction: discord.Interaction, pokemon: str):
+        pokemon = pokemon.strip().lower()
+        market_value = fetch_market_value_cache(pokemon) or {}
+        stats = fetch_market_price_stats(pokemon)
+        if not stats and not market_value:
+            await interaction.response.send_message(
+                f"❌ No market data found for **{pokemon.title()}**.", ephemeral=True
+            )
+            return
+
+        lowest_market = market_value.get("lowest_market")
+        embed = discord.Embed(
+            title=f"📈 {pokemon.title()} Market Price",
+            color=ARCEUS_EMBED_COLOR,
+        )
+        if market_value.get("image_link"):
+            embed.set_thumbnail(url=market_value["image_link"])
+        embed.add_field(name="Lowest Market", value=_coins(lowest_market), inline=True)
+        embed.add_field(
+            name="Listing Seen",
+            value=market_value.get("listing_seen") or "—",
+            inline=True,
+        )
+
+        if stats:
+            embed.add_field(name="Median", value=_coins(stats["median"]), inline=True)
+            embed.add_field(
+                name="Typical Range (p10–p90)",
+                value=f"{_coins(stats['p10'])} – {_coins(stats['p90'])}",
+                inline=True,
+            )
+            embed.add_field(name="Trend (EWMA)", value=_coins(stats["ewma"]), inline=True)
+            if stats["samples"] >= MIN_SAMPLES:
+                reference_price = snipe_reference_price(pokemon, lowest_market or 0)
+                embed.add_field(
+                    name="Snipe Below",
+                    value=_coins(int(reference_price * SNIPE_PRICE_RATIO)),
+                    inline=True,
+                )
+            embed.set_footer(
+                text=(
+                    f"Based on {stats['samples']} listings from the last "
+                    f"{WINDOW_SECONDS // 86400} days"
+                )
+            )
+        else:
+            embed.set_footer(text="No listings seen in the market feed recently")
+
+        await interaction.response.send_message(embed=embed)
+
+    market_price.extras = {"category": "Public"}
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MarketPrice(bot))
@@ -0,0 +1,63 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from Constants.vn_allstars_constants import (
+    ARCEUS_EMBED_COLOR,
+    KHY_USER_ID,
+    YUKI_USER_ID,
+)
+from utils.functions.webhook_dispatcher import fetch_webhook_dispatch_stats
+
+STATS_ALLOWED_USER_IDS = {YUKI_USER_ID, KHY_USER_ID}
+TOP_ROWS = 15
+
+
+def _stats_line(stats: dict) -> str:
+    return (
+        f"<#{stats['channel_id']}> — queued `{stats['queue_depth']}` · "
+        f"max `{stats['max_depth']}`\n"
+        f"sent `{stats['sent_items']}` in `{stats['sent_messages']}` messages · "
+        f"rate limited `{stats['rate_limited']}` · failures `{stats['failures']}`"
+    )
+
+
+# 🍰──────────────────────────────
+#   🎀 Cog: Webhook Stats
+#   Queue depth / send counters of the pooled webhook dispatcher
+# 🍰──────────────────────────────
+class WebhookStats(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="webhook-stats",
+        description="Show webhook queue depth and send stats per channel",
+    )
+    async def webhook_stats(self, interaction: discord.Interaction):
+        if interaction.user.id not in STATS_ALLOWED_USER_IDS:
+            await interaction.response.send_message(
+                "❌ Only Yuki or Khy is allowed to use this command!", ephemeral=True
+            )
+            return
+
+        rows = fetch_webhook_dispatch_stats()
+        lines = [_stats_line(stats) for stats in rows[:TOP_ROWS]]
+        embed = discord.Embed(
+            title="📮 Webhook Stats",
+            description=("\n\n".join(lines) or "No webhook sends yet.")[:4096],
+            color=ARCEUS_EMBED_COLOR,
+        )
+        embed.set_footer(
+            text=(
+                f"Top {min(len(rows), TOP_ROWS)} of {len(rows)} channels by queue depth · "
+                f"{sum(s['queue_depth'] for s in rows)} queued in total"
+            )
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    webhook_stats.extras = {"category": "Staff"}
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(WebhookStats(bot))
@@ -6,14 +6,15 @@ import discord
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
-from utils.cache.cache_list import clear_processed_messages_cache
+from utils.cache.cache_list import prune_processed_messages_cache
+from utils.cache.cache_change_feed import start_cache_change_feed
 from utils.cache.central_cache_loader import load_all_cache
+from utils.cache.monthly_goal_tracker_cache import flush_monthly_goal_cache
+from utils.cache.weekly_goal_tracker_cache import flush_weekly_goal_cache
 from utils.db.get_pg_pool import get_pg_pool
+from utils.db.write_behind import flush_all_write_behind
 from utils.essentials.persist_views import register_persistent_views
-from utils.listener_func.market_feed_listener import (
-    processed_market_feed_ids,
-    processed_market_feed_message_ids,
-)
+from utils.logs.log_backend import configure_logging
 from utils.logs.pretty_log import pretty_log, set_arceus_bot
 from utils.schedule.scheduler import setup_scheduler
 
@@ -22,6 +23,8 @@ intents.message_content = True
 intents.guilds = True
 intents.members = True
 load_dotenv()
+# LOG_LEVEL=debug|info|warn|error (default debug, all logs), LOG_JSON=1 for JSON lines
+configure_logging(os.getenv("LOG_LEVEL"), json_output=os.getenv("LOG_JSON") == "1")
 
 # 🟣────────────────────────────────────────────
 #            ⚡ Initialize Bot Instance ⚡
@@ -34,18 +37,28 @@ set_arceus_bot(bot=bot)
 #         ⚡ Hourly Cache Refresh Task ⚡
 # 🟣────────────────────────────────────────────
 first_refresh = True
+# While the change feed is live, still do a full reload once a day as a safety net
+FULL_RELOAD_EVERY_HOURS = 24
+hours_since_full_reload = 0
 
 
 @tasks.loop(hours=1)
 async def refresh_all_caches():
-    global first_refresh
+    global first_refresh, hours_since_full_reload
     if first_refresh:
         first_refresh = False
         # Skip the first run since cache was already loaded at startup
         return
-    await load_all_cache(bot)
-    # Clear processed message ID sets to prevent memory bloat
-    clear_processed_messages_cache()
+    hours_since_full_reload += 1
+    feed_was_live = bot.pg_pool.is_listening
+    if not feed_was_live:
+        # Try to resubscribe; changes made while it was down need a full reload
+        await start_cache_change_feed(bot)
+    if not feed_was_live or hours_since_full_reload >= FULL_RELOAD_EVERY_HOURS:
+        await load_all_cache(bot)
+        hours_since_full_reload = 0
+    # Dedup stores are bounded and expire on their own, just prune and report
+    prune_processed_messages_cache()
 
 
 # 🟣────────────────────────────────────────────
@@ -122,6 +135,8 @@ async def on_ready():
         message=f"✅ Synced {commands_count} slash commands globally", tag="ready"
     )
 
+    # Subscribe to row changes first so nothing is missed while loading
+    await start_cache_change_feed(bot)
     # Load all caches immediately at startup
     await load_all_cache(bot)
     # Start the hourly cache refresh task
@@ -166,7 +181,14 @@ async def main():
 
     # Start the bot
     token = os.getenv("DISCORD_TOKEN")
-    await bot.start(token)
+    try:
+        await bot.start(token)
+    finally:
+        # Write out buffered listener writes and dirty goal stats before
+        # the process exits
+        await flush_all_write_behind()
+        await flush_weekly_goal_cache(bot)
+        await flush_monthly_goal_cache(bot)
 
 
 # 🟣────────────────────
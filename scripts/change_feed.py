@@ -0,0 +1,164 @@
+"""
+One-off install and a local check for the cache change feed
+(utils/cache/cache_change_feed.py).
+
+    python scripts/change_feed.py install
+    python scripts/change_feed.py check --dsn postgresql://localhost/arceus_dev
+
+install: creates (or refreshes) the notify function and the per-table
+triggers on the bot's database (DATABASE_URL / DATABASE_PUBLIC_URL, as the
+bot connects). Run it once, and again when TABLE_LOADERS changes.
+
+check: needs any local Postgres you can create a schema in. It builds a
+scratch schema with a timers table, installs the trigger there, LISTENs on
+the change channel and runs an INSERT, UPDATE and DELETE, checking after
+each that apply_change patched timer_cache the way the bot would. An
+oversized row must come through as a reload notice. The scratch schema is
+dropped afterwards; exits non-zero on the first failed check.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import asyncpg  # noqa: E402
+
+from utils.cache.cache_change_feed import (  # noqa: E402
+    CHANGE_FEED_CHANNEL,
+    MAX_PAYLOAD_BYTES,
+    TABLE_LOADERS,
+    apply_change,
+    install_change_feed_sql,
+    missing_change_feed_triggers,
+)
+from utils.cache.cache_list import timer_cache  # noqa: E402
+from utils.db.get_pg_pool import get_pg_pool  # noqa: E402
+
+CHECK_SCHEMA = "arceus_feed_check"
+NOTIFY_TIMEOUT_SECONDS = 5
+USER_ID = 424242
+
+
+# 🟣────────────────────────────────────────────
+#        🛠️ Install
+# 🟣────────────────────────────────────────────
+async def install():
+    pool = await get_pg_pool()
+    tables = list(TABLE_LOADERS)
+    async with pool.acquire() as conn:
+        await install_change_feed_sql(conn, tables)
+        missing = await missing_change_feed_triggers(conn, tables)
+    if missing:
+        print(f"❌ Triggers still missing on: {', '.join(missing)}")
+        sys.exit(1)
+    print(f"✅ Change feed triggers installed on {len(tables)} tables")
+
+
+# 🟣────────────────────────────────────────────
+#        🧪 Local Check
+# 🟣────────────────────────────────────────────
+async def _next_change(changes: asyncio.Queue) -> dict:
+    return json.loads(await asyncio.wait_for(changes.get(), NOTIFY_TIMEOUT_SECONDS))
+
+
+def _expect(ok: bool, what: str):
+    print(f"{'✅' if ok else '❌'} {what}")
+    if not ok:
+        sys.exit(1)
+
+
+async def check(dsn: str):
+    conn = await asyncpg.connect(dsn)
+    listener = await asyncpg.connect(dsn)
+    changes: asyncio.Queue[str] = asyncio.Queue()
+    await listener.add_listener(
+        CHANGE_FEED_CHANNEL, lambda c, pid, channel, payload: changes.put_nowait(payload)
+    )
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {CHECK_SCHEMA} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {CHECK_SCHEMA}")
+        await conn.execute(f"SET search_path TO {CHECK_SCHEMA}")
+        await conn.execute(
+            """
+            CREATE TABLE timers (
+                user_id BIGINT PRIMARY KEY,
+                user_name TEXT,
+                pokemon_setting TEXT,
+                fish_setting TEXT,
+                battle_setting TEXT
+            )
+            """
+        )
+        await install_change_feed_sql(conn, ["timers"])
+        _expect(
+            not await missing_change_feed_triggers(conn, ["timers"]),
+            "trigger installed on the scratch timers table",
+        )
+
+        await conn.execute(
+            "INSERT INTO timers VALUES ($1, 'feedcheck', 'on', 'on', 'off')", USER_ID
+        )
+        change = await _next_change(changes)
+        apply_change(None, change)
+        _expect(
+            change["op"] == "INSERT"
+            and timer_cache.get(USER_ID, {}).get("fish_setting") == "on",
+            "INSERT patched timer_cache",
+        )
+
+        await conn.execute(
+            "UPDATE timers SET fish_setting = 'off' WHERE user_id = $1", USER_ID
+        )
+        change = await _next_change(changes)
+        apply_change(None, change)
+        _expect(
+            change["op"] == "UPDATE"
+            and timer_cache.get(USER_ID, {}).get("fish_setting") == "off",
+            "UPDATE patched timer_cache",
+        )
+
+        await conn.execute(
+            "UPDATE timers SET user_name = $2 WHERE user_id = $1",
+            USER_ID,
+            "x" * (MAX_PAYLOAD_BYTES + 100),
+        )
+        change = await _next_change(changes)
+        _expect(
+            change.get("reload") is True and "row" not in change,
+            "oversized row sent as a reload notice",
+        )
+
+        await conn.execute("DELETE FROM timers WHERE user_id = $1", USER_ID)
+        change = await _next_change(changes)
+        apply_change(None, change)
+        _expect(
+            change["op"] == "DELETE" and USER_ID not in timer_cache,
+            "DELETE removed the timer_cache entry",
+        )
+    finally:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {CHECK_SCHEMA} CASCADE")
+        await listener.close()
+        await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("install", help="install the triggers on the bot's database")
+    check_parser = commands.add_parser("check", help="check the feed on a local database")
+    check_parser.add_argument("--dsn", required=True)
+    args = parser.parse_args()
+
+    if args.command == "install":
+        asyncio.run(install())
+    else:
+        asyncio.run(check(args.dsn))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        🏃 Background Checker Runner
+# 🟣────────────────────────────────────────────
+# Runs each background checker as its own task with its own timeout, so a
+# slow checker (e.g. one sending lots of DMs) never delays the others.
+# A checker that is still running when it is due again is skipped, not
+# stacked. Duration / lag stats are shown by /checker-stats.
+
+RUNNER_LABEL = "🏃 CHECKER RUNNER"
+DEFAULT_TIMEOUT_SECONDS = 120
+
+
+@dataclass
+class CheckerStats:
+    runs: int = 0
+    skipped: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    total_duration: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    last_started_at: float | None = None  # UNIX seconds
+
+    @property
+    def avg_duration(self) -> float:
+        return self.total_duration / self.runs if self.runs else 0.0
+
+
+@dataclass
+class _Checker:
+    name: str
+    func: Callable[..., Awaitable[None]]
+    timeout: float
+    stats: CheckerStats
+    task: asyncio.Task | None = None
+
+
+class CheckerRunner:
+    def __init__(self):
+        self._checkers: dict[str, _Checker] = {}
+
+    def register(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[None]],
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        """Adds (or replaces) a checker. func is called as func(bot=bot)."""
+        existing = self._checkers.get(name)
+        stats = existing.stats if existing else CheckerStats()
+        self._checkers[name] = _Checker(name, func, timeout, stats)
+
+    def is_running(self, name: str) -> bool:
+        checker = self._checkers.get(name)
+        return bool(checker and checker.task and not checker.task.done())
+
+    def start(
+        self, bot: discord.Client, name: str, due_at: float | None = None
+    ) -> asyncio.Task | None:
+        """
+        Starts a checker in the background. Returns None (and counts a skip)
+        if its previous run has not finished yet.
+        due_at (UNIX seconds) is when the run should have started, for lag stats.
+        """
+        checker = self._checkers[name]
+        if checker.task and not checker.task.done():
+            checker.stats.skipped += 1
+            return None
+        checker.task = asyncio.create_task(self._run(bot, checker, due_at))
+        return checker.task
+
+    async def run(self, bot: discord.Client, name: str, due_at: float | None = None):
+        """Like start(), but waits for the run to finish."""
+        task = self.start(bot, name, due_at)
+        if task:
+            await task
+
+    def start_all(self, bot: discord.Client, names=None, due_at: float | None = None):
+        """Starts every (or the given) checker concurrently without waiting."""
+        for name in names or list(self._checkers):
+            self.start(bot, name, due_at)
+
+    async def _run(self, bot: discord.Client, checker: _Checker, due_at: float | None):
+        stats = checker.stats
+        started_at = time.time()
+        stats.last_started_at = started_at
+        if due_at is not None:
+            stats.last_lag = max(started_at - due_at, 0.0)
+            stats.max_lag = max(stats.max_lag, stats.last_lag)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(checker.func(bot=bot), timeout=checker.timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            pretty_log(
+                "warn",
+                f"{checker.name} exceeded its {checker.timeout:.0f}s budget and was cancelled",
+                label=RUNNER_LABEL,
+                bot=bot,
+            )
+        except Exception as e:
+            stats.errors += 1
+            pretty_log(
+                "error",
+                f"{checker.name} failed: {e}",
+                label=RUNNER_LABEL,
+                bot=bot,
+            )
+        finally:
+            duration = time.perf_counter() - start
+            stats.runs += 1
+            stats.total_duration += duration
+            stats.last_duration = duration
+            stats.max_duration = max(stats.max_duration, duration)
+
+    def cancel_all(self):
+        for checker in self._checkers.values():
+            if checker.task and not checker.task.done():
+                checker.task.cancel()
+
+    def stats(self) -> dict[str, CheckerStats]:
+        return {name: checker.stats for name, checker in self._checkers.items()}
+
+
+# Shared by CentralLoop's tick and the reminder scheduler
+central_checkers = CheckerRunner()
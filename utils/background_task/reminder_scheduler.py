@@ -0,0 +1,194 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime
+import discord
+
+from utils.background_task.checker_runner import central_checkers
+from utils.db.get_pg_pool import register_statement
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        ⏰ Reminder Scheduler (min-heap)
+# 🟣────────────────────────────────────────────
+# Replaces the 60 s polling of the reminder tables. Each reminder kind keeps
+# its due timestamps in one in-memory heap; the scheduler sleeps until the
+# earliest one and only then runs that kind's checker (registered on
+# central_checkers under the kind's name), which reads the due
+# rows from Postgres as before. The DB stays the source of truth: at startup
+# and after every run the next due time is re-read with a single MIN() query,
+# so overdue rows from before a restart fire right away.
+#
+# The db helpers that write a due time (upsert_user_reminder,
+# upsert_berry_reminder, upsert_special_battle_timer, ...) call
+# schedule_reminder() so a new reminder wakes the scheduler immediately.
+
+SCHEDULER_LABEL = "⏰ REMINDER SCHEDULER"
+
+# kind -> query returning the earliest due UNIX timestamp (or NULL)
+NEXT_DUE_QUERIES = {
+    "special_battle": "SELECT MIN(ends_on) FROM special_battle_timers",
+    "secret_santa": (
+        "SELECT MIN(remind_on) FROM misc_pokemeow_reminders WHERE type = 'secret_santa'"
+    ),
+    "shiny_bonus": "SELECT MIN(ends_on) FROM shiny_bonus",
+    "user_reminders": "SELECT MIN(remind_on) FROM user_reminders",
+    "berry_moisture": "SELECT MIN(moisture_dries_on) FROM berry_reminder",
+    "berry_growth": "SELECT MIN(grows_on) FROM berry_reminder",
+}
+for _kind, _sql in NEXT_DUE_QUERIES.items():
+    register_statement(f"next_due.{_kind}", _sql)
+
+# Rows still due right after their checker ran (e.g. channel gone, member
+# left) are retried on the old 60 s cadence instead of in a tight loop
+STUCK_RETRY_SECONDS = 60
+
+# Cheap MIN() re-sync in case a row was written outside the bot
+RESYNC_SECONDS = 30 * 60
+
+_heap: list[tuple[float, str]] = []
+_kinds: set[str] = set()
+_running: dict[str, asyncio.Task] = {}
+_rerun: dict[str, float] = {}  # kind -> due time that fired mid-run
+_wakeup: asyncio.Event | None = None
+_loop_task: asyncio.Task | None = None
+_bot: discord.Client | None = None
+
+
+def _to_unix(due_at) -> float | None:
+    if due_at is None:
+        return None
+    if isinstance(due_at, datetime):
+        return due_at.timestamp()
+    return float(due_at)
+
+
+def schedule_reminder(kind: str, due_at: int | float | datetime | None):
+    """
+    Records that a reminder of `kind` is due at `due_at` (UNIX seconds).
+    Safe to call before the scheduler is started; duplicates and stale
+    entries only cost one extra checker run that finds nothing due.
+    """
+    due_at = _to_unix(due_at)
+    if due_at is None or kind not in NEXT_DUE_QUERIES:
+        return
+    is_earliest = not _heap or due_at < _heap[0][0]
+    heapq.heappush(_heap, (due_at, kind))
+    if is_earliest and _wakeup is not None:
+        _wakeup.set()
+
+
+async def refresh_next_due(
+    kind: str, bot: discord.Client = None, after_run: bool = False
+):
+    """
+    Reads the earliest due time of `kind` from the DB and schedules it.
+    With after_run, rows the checker just left due are pushed back by
+    STUCK_RETRY_SECONDS.
+    """
+    bot = bot or _bot
+    if bot is None:
+        return
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            next_due = await conn.fetchval_named(f"next_due.{kind}")
+    except Exception as e:
+        pretty_log(
+            "warn",
+            f"Could not read next due time for {kind}, retrying in {STUCK_RETRY_SECONDS}s: {e}",
+            label=SCHEDULER_LABEL,
+            include_trace=False,
+        )
+        schedule_reminder(kind, time.time() + STUCK_RETRY_SECONDS)
+        return
+
+    if next_due is None:
+        return
+    next_due = float(next_due)
+    if after_run and next_due <= time.time():
+        next_due = time.time() + STUCK_RETRY_SECONDS
+    schedule_reminder(kind, next_due)
+
+
+async def _run_checker(kind: str, due_at: float):
+    try:
+        while True:
+            # Timeout, error logging and stats are handled by the runner
+            await central_checkers.run(_bot, kind, due_at=due_at)
+            due_at = _rerun.pop(kind, None)
+            if due_at is None:
+                break
+        await refresh_next_due(kind, after_run=True)
+    finally:
+        _running.pop(kind, None)
+
+
+def _fire(kind: str, due_at: float):
+    if kind in _running:
+        # Already running, go once more when it finishes
+        _rerun.setdefault(kind, due_at)
+        return
+    _running[kind] = asyncio.create_task(_run_checker(kind, due_at))
+
+
+async def _scheduler_loop():
+    last_resync = time.monotonic()
+    while not _bot.is_closed():
+        _wakeup.clear()
+        now = time.time()
+        due_kinds: dict[str, float] = {}
+        while _heap and _heap[0][0] <= now:
+            due_at, kind = heapq.heappop(_heap)
+            due_kinds.setdefault(kind, due_at)
+        for kind, due_at in due_kinds.items():
+            if kind in _kinds:
+                _fire(kind, due_at)
+
+        if time.monotonic() - last_resync >= RESYNC_SECONDS:
+            last_resync = time.monotonic()
+            for kind in _kinds:
+                if kind not in _running:
+                    await refresh_next_due(kind)
+            continue
+
+        delay = RESYNC_SECONDS
+        if _heap:
+            delay = min(delay, max(_heap[0][0] - time.time(), 0))
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def start_reminder_scheduler(bot: discord.Client, kinds):
+    """
+    Loads the next due time of each reminder kind from the DB and starts the
+    scheduler task. Each kind must be registered on central_checkers.
+    Idempotent.
+    """
+    global _bot, _wakeup, _loop_task
+    if _loop_task and not _loop_task.done():
+        return _loop_task
+
+    _bot = bot
+    _wakeup = asyncio.Event()
+    _kinds.update(kinds)
+
+    await asyncio.gather(*(refresh_next_due(kind) for kind in _kinds))
+    pending = sorted({kind for _, kind in _heap})
+    pretty_log(
+        "ready",
+        f"Reminder scheduler started, {len(pending)} kinds pending: {', '.join(pending) or 'none'}",
+        label=SCHEDULER_LABEL,
+    )
+    _loop_task = asyncio.create_task(_scheduler_loop())
+    return _loop_task
+
+
+def stop_reminder_scheduler():
+    global _loop_task
+    if _loop_task and not _loop_task.done():
+        _loop_task.cancel()
+    _loop_task = None
+    for task in list(_running.values()):
+        task.cancel()
@@ -0,0 +1,350 @@
+import asyncio
+import json
+import os
+
+import discord
+
+from utils.cache.cache_list import market_value_cache
+from utils.cache.central_cache_loader import CACHE_LOADERS
+from utils.cache.faction_members_cache import (
+    remove_faction_member_from_cache,
+    upsert_faction_member_into_cache,
+)
+from utils.cache.timers_cache import remove_user_from_timer_cache, upsert_timer_cache
+from utils.cache.user_alert_cache import (
+    delete_user_alert_cache,
+    upsert_user_alert_cache,
+)
+from utils.cache.vna_members_cache import (
+    remove_vna_member_from_cache,
+    upsert_vna_member_cache,
+)
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        🛰️ Cache Change Feed (LISTEN/NOTIFY)
+# 🟣────────────────────────────────────────────
+# Postgres triggers publish every row change on CHANGE_FEED_CHANNEL as
+# {"table": ..., "op": "INSERT" | "UPDATE" | "DELETE", "row": {...}}.
+# Row-level tables are patched in place; small tables without a row handler
+# are reloaded once per burst. The hourly full reload in main.py only runs
+# while the feed is down (plus a daily safety reload).
+#
+# The triggers are a one-off install, not redone on every start:
+#   python scripts/change_feed.py install
+# (or set CACHE_FEED_INSTALL_TRIGGERS=1 to reinstall them on startup).
+# Until they exist the feed stays off and the hourly reloads keep running.
+# python scripts/change_feed.py check --dsn <local db> applies row changes in
+# a scratch schema and checks that the cache gets patched.
+CHANGE_FEED_CHANNEL = "arceus_cache_changes"
+CHANGE_FEED_TRIGGER = "arceus_cache_change"
+INSTALL_TRIGGERS_ENV = "CACHE_FEED_INSTALL_TRIGGERS"
+
+# Bigger payloads make pg_notify fail the writing transaction, so the trigger
+# falls back to a table-level reload notice above this size.
+MAX_PAYLOAD_BYTES = 7900
+
+CHANGE_FEED_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION arceus_notify_cache_change() RETURNS trigger AS $$
+DECLARE
+    payload TEXT;
+BEGIN
+    payload := json_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'row', row_to_json(CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NEW END)
+    )::text;
+    IF octet_length(payload) > {MAX_PAYLOAD_BYTES} THEN
+        payload := json_build_object(
+            'table', TG_TABLE_NAME, 'op', TG_OP, 'reload', true
+        )::text;
+    END IF;
+    PERFORM pg_notify('{CHANGE_FEED_CHANNEL}', payload);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+CHANGE_FEED_TRIGGER_SQL = f"""
+DROP TRIGGER IF EXISTS {CHANGE_FEED_TRIGGER} ON {{table}};
+CREATE TRIGGER {CHANGE_FEED_TRIGGER}
+AFTER INSERT OR UPDATE OR DELETE ON {{table}}
+FOR EACH ROW EXECUTE FUNCTION arceus_notify_cache_change();
+"""
+
+
+# 🟣────────────────────────────────────────────
+#          🧩 Row Handlers (table -> cache)
+# 🟣────────────────────────────────────────────
+def _apply_vna_members(op: str, row: dict):
+    if op == "DELETE":
+        remove_vna_member_from_cache(row["user_id"])
+        return
+    upsert_vna_member_cache(
+        user_id=row["user_id"],
+        user_name=row.get("user_name"),
+        pokemeow_name=row.get("pokemeow_name"),
+        channel_id=row.get("channel_id"),
+        perks=row.get("perks"),
+        faction=row.get("faction"),
+        clan_joined_date=row.get("clan_joined_date"),
+    )
+
+
+def _apply_timers(op: str, row: dict):
+    if op == "DELETE":
+        remove_user_from_timer_cache(row["user_id"])
+        return
+    upsert_timer_cache(
+        user_id=row["user_id"],
+        user_name=row.get("user_name"),
+        pokemon_setting=row.get("pokemon_setting"),
+        fish_setting=row.get("fish_setting"),
+        battle_setting=row.get("battle_setting"),
+    )
+
+
+def _apply_user_alerts(op: str, row: dict):
+    if op == "DELETE":
+        delete_user_alert_cache(row["user_id"], row["alert_type"])
+        return
+    upsert_user_alert_cache(
+        user_id=row["user_id"],
+        alert_type=row["alert_type"],
+        user_name=row.get("user_name"),
+        notify=row.get("notify"),
+    )
+
+
+def _apply_faction_members(op: str, row: dict):
+    if op == "DELETE":
+        remove_faction_member_from_cache(row["user_id"])
+        return
+    upsert_faction_member_into_cache(
+        user_id=row["user_id"],
+        user_name=row.get("user_name"),
+        clan_name=row.get("clan_name"),
+        faction=row.get("faction"),
+        notify=row.get("notify"),
+    )
+
+
+def _apply_market_value(op: str, row: dict):
+    pokemon_name = row["pokemon_name"]
+    if op == "DELETE":
+        market_value_cache.pop(pokemon_name, None)
+        return
+    market_value_cache[pokemon_name] = {
+        "pokemon": pokemon_name,
+        "dex_number": row.get("dex_number"),
+        "is_exclusive": row.get("is_exclusive", False),
+        "lowest_market": row.get("lowest_market"),
+        "current_listing": row.get("current_listing"),
+        "true_lowest": row.get("true_lowest"),
+        "listing_seen": row.get("listing_seen"),
+        "image_link": row.get("image_link"),
+        "rarity": row.get("rarity", "unknown"),
+    }
+
+
+ROW_HANDLERS = {
+    "vna_members": _apply_vna_members,
+    "timers": _apply_timers,
+    "user_alerts": _apply_user_alerts,
+    "faction_members": _apply_faction_members,
+    "market_value": _apply_market_value,
+}
+
+# table name -> CACHE_LOADERS key, used for tables without a row handler
+# (small tables or ones with derived indexes) and for oversized rows
+TABLE_LOADERS = {
+    "vna_members": "vna_members",
+    "timers": "timers",
+    "user_alerts": "user_alerts",
+    "faction_members": "faction_members",
+    "market_value": "market_value",
+    "market_alerts": "market_alerts",
+    "webhook_url": "webhook_urls",
+    "daily_faction_ball": "daily_faction_ball",
+    "ping_message_ids": "ping_message_ids",
+    "clan_wars_server_members": "clan_wars_server_members",
+}
+
+# Reload tasks in flight, so a burst of changes triggers a single reload
+_pending_reloads: dict[str, asyncio.Task] = {}
+RELOAD_DEBOUNCE_SECONDS = 2
+
+
+async def _reload_table(bot: discord.Client, loader_name: str):
+    await asyncio.sleep(RELOAD_DEBOUNCE_SECONDS)
+    _pending_reloads.pop(loader_name, None)
+    loader, _ = CACHE_LOADERS[loader_name]
+    try:
+        await loader(bot)
+    except Exception as e:
+        pretty_log(
+            "error",
+            f"Change feed reload of {loader_name} failed: {e}",
+            label="🛰️ CHANGE FEED",
+            include_trace=False,
+        )
+
+
+def _schedule_reload(bot: discord.Client, loader_name: str):
+    if loader_name in _pending_reloads:
+        return
+    _pending_reloads[loader_name] = asyncio.create_task(
+        _reload_table(bot, loader_name)
+    )
+
+
+def apply_change(bot: discord.Client, change: dict):
+    """
+    Applies one decoded change notification to the in-memory caches.
+    Returns True if the change was handled.
+    """
+    table = change.get("table")
+    op = change.get("op")
+    row = change.get("row")
+
+    handler = ROW_HANDLERS.get(table)
+    if handler and row is not None and not change.get("reload"):
+        handler(op, row)
+        return True
+
+    loader_name = TABLE_LOADERS.get(table)
+    if loader_name:
+        _schedule_reload(bot, loader_name)
+        return True
+    return False
+
+
+# 🟣────────────────────────────────────────────
+#            🚀 Install & Start the Feed
+# 🟣────────────────────────────────────────────
+async def install_change_feed_sql(conn, tables: list[str]):
+    """Creates (or refreshes) the notify function and triggers on tables."""
+    async with conn.transaction():
+        await conn.execute(CHANGE_FEED_FUNCTION_SQL)
+        for table in tables:
+            await conn.execute(CHANGE_FEED_TRIGGER_SQL.format(table=table))
+
+
+async def missing_change_feed_triggers(conn, tables: list[str]) -> list[str]:
+    """The tables that have no change feed trigger yet."""
+    rows = await conn.fetch(
+        """
+        SELECT c.relname
+        FROM pg_trigger t
+        JOIN pg_class c ON c.oid = t.tgrelid
+        WHERE t.tgname = $1 AND pg_table_is_visible(c.oid)
+        """,
+        CHANGE_FEED_TRIGGER,
+    )
+    installed = {row["relname"] for row in rows}
+    return [table for table in tables if table not in installed]
+
+
+async def install_change_feed_triggers(bot: discord.Client) -> bool:
+    """Installs the triggers on every table in TABLE_LOADERS."""
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            await install_change_feed_sql(conn, list(TABLE_LOADERS))
+    except Exception as e:
+        pretty_log(
+            "warn",
+            f"Could not install change feed triggers, keeping hourly full reloads: {e}",
+            label="🛰️ CHANGE FEED",
+            include_trace=False,
+        )
+        return False
+    return True
+
+
+# Set once the triggers were found (or installed) in this process
+_triggers_ready = False
+
+
+async def change_feed_triggers_ready(bot: discord.Client) -> bool:
+    """
+    Checks that every table has its trigger. Only installs them when
+    CACHE_FEED_INSTALL_TRIGGERS=1, so a normal start never rewrites them.
+    """
+    global _triggers_ready
+    if _triggers_ready:
+        return True
+    if os.getenv(INSTALL_TRIGGERS_ENV) == "1":
+        _triggers_ready = await install_change_feed_triggers(bot)
+        return _triggers_ready
+
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            missing = await missing_change_feed_triggers(conn, list(TABLE_LOADERS))
+    except Exception as e:
+        pretty_log(
+            "warn",
+            f"Could not check change feed triggers, keeping hourly full reloads: {e}",
+            label="🛰️ CHANGE FEED",
+            include_trace=False,
+        )
+        return False
+    if missing:
+        pretty_log(
+            "warn",
+            f"Change feed triggers missing on {', '.join(missing)}, keeping hourly "
+            f"full reloads. Run `python scripts/change_feed.py install` or set "
+            f"{INSTALL_TRIGGERS_ENV}=1",
+            label="🛰️ CHANGE FEED",
+            include_trace=False,
+        )
+        return False
+    _triggers_ready = True
+    return True
+
+
+async def start_cache_change_feed(bot: discord.Client) -> bool:
+    """
+    Subscribes to the change channel once the triggers are in place.
+    Safe to call again after the LISTEN connection drops.
+    """
+    pool = bot.pg_pool
+    if pool.is_listening:
+        return True
+
+    if not await change_feed_triggers_ready(bot):
+        return False
+
+    def on_notify(connection, pid, channel, payload):
+        try:
+            change = json.loads(payload)
+            if not apply_change(bot, change):
+                pretty_log(
+                    "warn",
+                    f"Unhandled change notification for table {change.get('table')}",
+                    label="🛰️ CHANGE FEED",
+                    include_trace=False,
+                )
+        except Exception as e:
+            pretty_log(
+                "error",
+                f"Failed to apply change notification: {e}",
+                label="🛰️ CHANGE FEED",
+            )
+
+    try:
+        await pool.listen(CHANGE_FEED_CHANNEL, on_notify)
+    except Exception as e:
+        pretty_log(
+            "warn",
+            f"Could not LISTEN on {CHANGE_FEED_CHANNEL}, keeping hourly full reloads: {e}",
+            label="🛰️ CHANGE FEED",
+            include_trace=False,
+        )
+        return False
+
+    pretty_log(
+        "ready",
+        f"Listening for cache changes on {CHANGE_FEED_CHANNEL}",
+        label="🛰️ CHANGE FEED",
+    )
+    return True
@@ -1,29 +1,47 @@
+from utils.cache.dedup_store import DedupStore
 from utils.logs.pretty_log import pretty_log
 
-processed_fish_spawn_message_ids = set()
-processed_faction_ball_alerts = set()
-processed_pokemon_spawn_msgs = set()
-processed_market_feed_message_ids = set()
-processed_market_feed_ids = set()
-processed_explore_messages = set()
-processed_caught_messages = set()
-processed_weekly_stats_messages = set()
-processed_monthly_stats_messages = set()
-
-
-def clear_processed_messages_cache():
-    """Clears all processed message ID caches."""
-    processed_fish_spawn_message_ids.clear()
-    processed_pokemon_spawn_msgs.clear()
-    processed_faction_ball_alerts.clear()
-    processed_market_feed_message_ids.clear()
-    processed_market_feed_ids.clear()
-    processed_explore_messages.clear()
-    processed_caught_messages.clear()
-    processed_weekly_stats_messages.clear()
-    processed_monthly_stats_messages.clear()
-
-    pretty_log(message="✅ Cleared all processed message ID caches", tag="cache")
+# 🧹 Processed message dedup stores (ttl in seconds, max entries)
+processed_fish_spawn_message_ids = DedupStore("fish_spawn", ttl=3600, max_size=5000)
+processed_faction_ball_alerts = DedupStore("faction_ball", ttl=3600, max_size=5000)
+processed_pokemon_spawn_msgs = DedupStore("pokemon_spawn", ttl=3600, max_size=10000)
+processed_market_feed_message_ids = DedupStore(
+    "market_feed_message", ttl=6 * 3600, max_size=10000
+)
+processed_market_feed_ids = DedupStore(
+    "market_feed_listing", ttl=6 * 3600, max_size=50000
+)
+processed_explore_messages = DedupStore("explore", ttl=3600, max_size=2000)
+processed_caught_messages = DedupStore("caught", ttl=3600, max_size=10000)
+processed_weekly_stats_messages = DedupStore("weekly_stats", ttl=3600, max_size=2000)
+processed_monthly_stats_messages = DedupStore("monthly_stats", ttl=3600, max_size=2000)
+
+DEDUP_STORES = [
+    processed_fish_spawn_message_ids,
+    processed_faction_ball_alerts,
+    processed_pokemon_spawn_msgs,
+    processed_market_feed_message_ids,
+    processed_market_feed_ids,
+    processed_explore_messages,
+    processed_caught_messages,
+    processed_weekly_stats_messages,
+    processed_monthly_stats_messages,
+]
+
+
+def prune_processed_messages_cache():
+    """Drops expired entries from every dedup store and logs their counters."""
+    for store in DEDUP_STORES:
+        store.prune()
+        stats = store.stats()
+        pretty_log(
+            message=(
+                f"🧹 {stats['name']}: size={stats['size']}/{stats['max_size']} "
+                f"hits={stats['hits']} misses={stats['misses']} "
+                f"expired={stats['expired']} evicted={stats['evicted']}"
+            ),
+            tag="cache",
+        )
 
 
 market_alert_cache: list[dict] = []
@@ -50,6 +68,14 @@ _market_alert_index: dict[tuple[str, int], dict] = (
 #         "role_id": 192837465
 #     },
 
+_market_alert_price_index: dict[str, list[dict]] = {}
+# key = pokemon.strip().lower()
+# value = that Pokémon's alert entries (same dicts as market_alert_cache),
+#         sorted by max_price ascending so a listing price can be bisected
+# _market_alert_price_index = {
+#     "pikachu": [ {..., "max_price": 3000}, {..., "max_price": 5000} ],
+# }
+
 webhook_url_cache: dict[tuple[int, int], dict[str, str]] = {}
 #     ...
 #
@@ -73,6 +99,9 @@ faction_members_cache: dict[int, dict[str, str]] = {}
 # "notify": str
 # },
 
+_faction_member_name_index: dict[str, set[int]] = {}
+# key = normalize_member_name(user_name) -> user_ids with that name
+
 # 🌸──────────────────────────────────────────────
 # Daily Faction Ball Cache (Global)
 # ───────────────────────────────────────────────
@@ -100,6 +129,44 @@ vna_members_cache: dict[int, dict] = {}
 # "faction": str,
 # }
 
+_vna_member_name_index: dict[str, set[int]] = {}
+_vna_member_pokemeow_name_index: dict[str, set[int]] = {}
+# key = normalize_member_name(user_name / pokemeow_name) -> user_ids with that name
+
+
+def normalize_member_name(name: str | None) -> str | None:
+    """Case-normalized key used by the member name indexes."""
+    if not name:
+        return None
+    return name.strip().casefold()
+
+
+def index_member_name(index: dict[str, set[int]], key: str | None, user_id: int):
+    """Add user_id under key in a member name index."""
+    if key:
+        index.setdefault(key, set()).add(user_id)
+
+
+def unindex_member_name(index: dict[str, set[int]], key: str | None, user_id: int):
+    """Drop user_id from under key, leaving any other members with that name."""
+    user_ids = index.get(key) if key else None
+    if user_ids:
+        user_ids.discard(user_id)
+        if not user_ids:
+            del index[key]
+
+
+def first_cached_member(cache: dict[int, dict], user_ids: set[int] | None) -> int | None:
+    """
+    The user_id a scan over cache would find first among user_ids, so shared
+    names resolve the same way the old linear lookups did.
+    """
+    if not user_ids:
+        return None
+    if len(user_ids) == 1:
+        return next(iter(user_ids))
+    return next((user_id for user_id in cache if user_id in user_ids), None)
+
 user_alerts_cache: dict[int, dict[str, dict[str, str]]] = {}
 # Structure:
 # {
@@ -162,3 +229,7 @@ clan_wars_server_members_cache: dict[int, dict[str, str | None]] = {}
 
 snipe_ga_active = False
 market_value_cache: dict[str, dict] = {}
+
+market_price_stats_cache: dict = {}
+# Structure:
+# pokemon_name (lowercase) -> PriceWindow (utils/cache/market_price_stats_cache.py)
@@ -1,12 +1,16 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
 import discord
 
 from utils.logs.pretty_log import pretty_log
 
-from .cache_list import market_alert_cache
 from .clan_wars_cache import load_clan_wars_server_members_cache
 from .daily_fa_ball_cache import load_daily_faction_ball_cache
 from .faction_members_cache import load_faction_members_cache
 from .market_alert_cache import load_market_alert_cache
+from .market_price_stats_cache import load_market_price_stats_cache
 from .monthly_goal_tracker_cache import load_monthly_goal_cache
 from .ping_message_id_cache import load_ping_message_id_cache
 from .timers_cache import load_timer_cache
@@ -16,56 +20,92 @@ from .webhook_url_cache import load_webhook_url_cache
 from .weekly_goal_tracker_cache import load_weekly_goal_cache
 from utils.db.market_value_db import load_market_cache_from_db
 
-async def load_all_cache(bot: discord.Client):
-    """
-    Loads all caches used by the bot.
-    Currently loads:
-    - Market Alert Cache
-    """
-    try:
-        # Load VNA Members Cache
-        await load_vna_members_cache(bot)
-
-        # Load Ping Message ID Cache
-        await load_ping_message_id_cache(bot)
-
-        # Load Weekly Goal Cache
-        await load_weekly_goal_cache(bot)
 
-        # Load Monthly Goal Cache
-        await load_monthly_goal_cache(bot)
+# 🟣────────────────────────────────────────────
+#        🗄️ Cache Loader Dependency Graph
+# 🟣────────────────────────────────────────────
+# name -> (loader, names of loaders that must finish first)
+# None of today's caches read each other while loading, so every loader runs
+# concurrently. Add a dependency here if a loader starts reading another cache.
+CACHE_LOADERS: dict[
+    str, tuple[Callable[[discord.Client], Awaitable], tuple[str, ...]]
+] = {
+    "vna_members": (load_vna_members_cache, ()),
+    "ping_message_ids": (load_ping_message_id_cache, ()),
+    "weekly_goals": (load_weekly_goal_cache, ()),
+    "monthly_goals": (load_monthly_goal_cache, ()),
+    "clan_wars_server_members": (load_clan_wars_server_members_cache, ()),
+    "timers": (load_timer_cache, ()),
+    "market_alerts": (load_market_alert_cache, ()),
+    "webhook_urls": (load_webhook_url_cache, ()),
+    "faction_members": (load_faction_members_cache, ()),
+    "daily_faction_ball": (load_daily_faction_ball_cache, ()),
+    "user_alerts": (load_user_alert_cache, ()),
+    "market_value": (load_market_cache_from_db, ()),
+    "market_price_stats": (load_market_price_stats_cache, ()),
+}
 
-        # Load Clan Wars Server Members Cache
-        await load_clan_wars_server_members_cache(bot)
 
-        # Load Timer Cache
-        await load_timer_cache(bot)
+async def _run_cache_loader(
+    bot: discord.Client,
+    name: str,
+    tasks: dict[str, asyncio.Task],
+    timings: dict[str, float],
+):
+    """Waits for a loader's dependencies, then runs and times it. Returns True on success."""
+    loader, depends_on = CACHE_LOADERS[name]
+    for dependency in depends_on:
+        if not await tasks[dependency]:
+            pretty_log(
+                message=f"⚠️ Skipped {name} cache because {dependency} failed to load",
+                tag="cache",
+            )
+            return False
 
-        # Load Market Alert Cache
-        await load_market_alert_cache(bot)
-
-        # Load Webhook URL Cache
-        await load_webhook_url_cache(bot)
-
-        # Load Faction Members Cache
-        await load_faction_members_cache(bot)
+    start = time.perf_counter()
+    try:
+        await loader(bot)
+        return True
+    except Exception as e:
+        pretty_log(
+            message=f"❌ Error loading {name} cache: {e}",
+            tag="cache",
+        )
+        return False
+    finally:
+        timings[name] = time.perf_counter() - start
 
-        # Load Daily Faction Ball Cache
-        await load_daily_faction_ball_cache(bot)
 
-        # Load User Alert Cache
-        await load_user_alert_cache(bot)
+async def load_all_cache(bot: discord.Client) -> dict[str, bool]:
+    """
+    Loads all caches used by the bot concurrently.
+    A failing loader only affects itself and the loaders that depend on it.
+    Logs the wall-clock time of each loader and returns {name: succeeded}.
+    """
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+    tasks: dict[str, asyncio.Task] = {}
+    for name in CACHE_LOADERS:
+        tasks[name] = asyncio.create_task(_run_cache_loader(bot, name, tasks, timings))
+    await asyncio.gather(*tasks.values())
+    results = {name: task.result() for name, task in tasks.items()}
+    total = time.perf_counter() - start
 
-        # Load Market Value Cache from database
-        await load_market_cache_from_db(bot)
+    timing_lines = ", ".join(
+        f"{name}={timings[name] * 1000:.0f}ms"
+        for name in sorted(timings, key=timings.get, reverse=True)
+    )
+    pretty_log(message=f"⏱️ Cache load timings: {timing_lines}", tag="cache")
 
-    except Exception as e:
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
         pretty_log(
-            message=f"❌ Error loading caches: {e}",
+            message=f"⚠️ Loaded {len(results) - len(failed)}/{len(results)} caches in {total:.2f}s, failed: {', '.join(failed)}",
             tag="cache",
         )
-        return
-    pretty_log(
-        message="✅ All caches loaded successfully.",
-        tag="cache",
-    )
+    else:
+        pretty_log(
+            message=f"✅ All caches loaded successfully in {total:.2f}s.",
+            tag="cache",
+        )
+    return results
@@ -0,0 +1,95 @@
+import time
+from collections import deque
+from typing import Hashable
+
+
+# 🟣────────────────────────────────────────────
+#       🧹 Bounded, Time-Expiring Dedup Store
+# 🟣────────────────────────────────────────────
+class DedupStore:
+    """
+    Remembers recently processed keys (message IDs, listing IDs, ...).
+    - Entries expire after `ttl` seconds.
+    - At most `max_size` entries are kept; the oldest are evicted first.
+    check_and_add() is O(1) amortized: a hash map holds live keys and a
+    FIFO ring of (key, inserted_at) drives expiry and eviction.
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._seen: dict[Hashable, float] = {}
+        self._order: deque[tuple[Hashable, float]] = deque()
+
+        # 📊 Counters
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def _prune(self, now: float):
+        cutoff = now - self.ttl
+        order = self._order
+        seen = self._seen
+        while order:
+            key, inserted_at = order[0]
+            if seen.get(key) != inserted_at:
+                # Stale ring entry, key was re-added or already dropped
+                order.popleft()
+                continue
+            if inserted_at <= cutoff:
+                order.popleft()
+                del seen[key]
+                self.expired += 1
+                continue
+            if len(seen) > self.max_size:
+                order.popleft()
+                del seen[key]
+                self.evicted += 1
+                continue
+            break
+
+    def check_and_add(self, key: Hashable) -> bool:
+        """
+        Returns True if the key was already processed (a duplicate).
+        Otherwise records it and returns False.
+        """
+        now = time.monotonic()
+        inserted_at = self._seen.get(key)
+        if inserted_at is not None and now - inserted_at < self.ttl:
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        self._seen[key] = now
+        self._order.append((key, now))
+        self._prune(now)
+        return False
+
+    def __contains__(self, key: Hashable) -> bool:
+        inserted_at = self._seen.get(key)
+        return inserted_at is not None and time.monotonic() - inserted_at < self.ttl
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def prune(self):
+        """Drops expired entries without inserting anything."""
+        self._prune(time.monotonic())
+
+    def clear(self):
+        self._seen.clear()
+        self._order.clear()
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "size": len(self._seen),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
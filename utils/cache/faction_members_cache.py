@@ -1,6 +1,13 @@
 import discord
 
-from utils.cache.cache_list import faction_members_cache
+from utils.cache.cache_list import (
+    _faction_member_name_index,
+    faction_members_cache,
+    first_cached_member,
+    index_member_name,
+    normalize_member_name,
+    unindex_member_name,
+)
 from utils.db.faction_members import fetch_faction_members
 from utils.logs.pretty_log import pretty_log
 
@@ -12,12 +19,38 @@ from utils.logs.pretty_log import pretty_log
 # "notify": str
 # },
 
+# 🌸──────────────────────────────────────────────
+#      🔎 Name Index Helpers
+# 🌸──────────────────────────────────────────────
+def _index_faction_member(user_id: int):
+    """Add a cached faction member's user_name to the lookup index."""
+    data = faction_members_cache.get(user_id)
+    if data:
+        index_member_name(
+            _faction_member_name_index,
+            normalize_member_name(data.get("user_name")),
+            user_id,
+        )
+
+
+def _unindex_faction_member(user_id: int):
+    """Drop a cached faction member's user_name from the lookup index."""
+    data = faction_members_cache.get(user_id)
+    if data:
+        unindex_member_name(
+            _faction_member_name_index,
+            normalize_member_name(data.get("user_name")),
+            user_id,
+        )
+
+
 # 🌸──────────────────────────────────────────────
 #      🛡️ Faction Members Cache Functions
 # 🌸──────────────────────────────────────────────
 async def load_faction_members_cache(bot: discord.Client):
     """Load the faction members cache from the database."""
     faction_members_cache.clear()
+    _faction_member_name_index.clear()
     try:
         members = await fetch_faction_members(bot=bot)
         if not members:
@@ -35,6 +68,7 @@ async def load_faction_members_cache(bot: discord.Client):
                 "faction": member["faction"],
                 "notify": member["notify"],
             }
+            _index_faction_member(user_id)
 
         pretty_log(
             message=f"✅ Loaded {len(faction_members_cache)} faction members into cache.",
@@ -63,12 +97,14 @@ def upsert_faction_member_into_cache(
     notify: str,
 ):
     """Upsert a faction member into the cache."""
+    _unindex_faction_member(user_id)
     faction_members_cache[user_id] = {
         "user_name": user_name,
         "clan_name": clan_name,
         "faction": faction,
         "notify": notify,
     }
+    _index_faction_member(user_id)
     pretty_log(
         message=f"✅ Upserted faction member into cache with user ID: {user_id}",
         tag="cache",
@@ -106,6 +142,7 @@ def remove_faction_member_from_cache(user_id: int):
     """Remove a faction member from the cache."""
     if user_id in faction_members_cache:
         user_name = faction_members_cache[user_id].get("user_name", "Unknown")
+        _unindex_faction_member(user_id)
         del faction_members_cache[user_id]
         pretty_log(
             message=f"✅ Removed faction member {user_name} from cache with user ID: {user_id}",
@@ -113,8 +150,8 @@ def remove_faction_member_from_cache(user_id: int):
         )
 
 def fetch_faction_member_id_by_username(user_name: str) -> int | None:
-    """Fetch a faction member's user_id by their user_name from the cache."""
-    for user_id, data in faction_members_cache.items():
-        if data.get("user_name") == user_name:
-            return user_id
-    return None
\ No newline at end of file
+    """Fetch a faction member's user_id by their user_name from the cache (case-insensitive)."""
+    return first_cached_member(
+        faction_members_cache,
+        _faction_member_name_index.get(normalize_member_name(user_name)),
+    )
@@ -1,14 +1,59 @@
+from bisect import bisect_left, insort
+
 import discord
 
 from utils.db.market_alert_db import fetch_all_market_alerts
 from utils.logs.pretty_log import pretty_log
 
-from .cache_list import _market_alert_index, market_alert_cache
+from .cache_list import (
+    _market_alert_index,
+    _market_alert_price_index,
+    market_alert_cache,
+)
+
+
+# 🟣────────────────────────────────────────────
+#     💰 Price-Sorted Alert Index Helpers
+# 🟣────────────────────────────────────────────
+def _alert_price_key(alert: dict) -> int:
+    return alert["max_price"] or 0
+
+
+def _index_alert_price(alert: dict):
+    name_key = alert["pokemon"].strip().lower()
+    bucket = _market_alert_price_index.setdefault(name_key, [])
+    insort(bucket, alert, key=_alert_price_key)
+
+
+def _unindex_alert_price(alert: dict):
+    name_key = alert["pokemon"].strip().lower()
+    bucket = _market_alert_price_index.get(name_key)
+    if not bucket:
+        return
+    for i, entry in enumerate(bucket):
+        if entry is alert:
+            del bucket[i]
+            break
+    if not bucket:
+        del _market_alert_price_index[name_key]
+
+
+def fetch_matching_market_alerts(pokemon: str, listed_price: int) -> list[dict]:
+    """
+    Returns the alerts for a Pokémon whose max_price is at or above the listed price.
+    Cost depends on the number of matching alerts, not the total alert count.
+    """
+    bucket = _market_alert_price_index.get(pokemon.strip().lower())
+    if not bucket:
+        return []
+    start = bisect_left(bucket, listed_price, key=_alert_price_key)
+    return bucket[start:]
 
 
 async def load_market_alert_cache(bot: discord.Client):
     market_alert_cache.clear()
     _market_alert_index.clear()
+    _market_alert_price_index.clear()
     try:
         alerts = await fetch_all_market_alerts(bot)
         if not alerts:
@@ -35,6 +80,7 @@ async def load_market_alert_cache(bot: discord.Client):
                 alert_entry["user_id"],
             )
             _market_alert_index[key] = alert_entry
+            _index_alert_price(alert_entry)
         pretty_log(
             message=f"✅ Loaded {len(market_alert_cache)} market alerts into cache.",
             tag="cache",
@@ -80,9 +126,15 @@ def insert_alert_into_cache(
         "channel_id": channel_id,
         "role_id": role_id,
     }
-    market_alert_cache.append(alert_entry)
     key = (pokemon, channel_id, user_id)
+    # Replace an alert already cached under this key, so it can't fire twice
+    old_entry = _market_alert_index.get(key)
+    if old_entry:
+        market_alert_cache.remove(old_entry)
+        _unindex_alert_price(old_entry)
+    market_alert_cache.append(alert_entry)
     _market_alert_index[key] = alert_entry
+    _index_alert_price(alert_entry)
     pretty_log(
         message=f"✅ Inserted market alert for {user_name} {pokemon} (User ID: {user_id}) into cache.",
         tag="cache",
@@ -111,6 +163,7 @@ def remove_alert_from_user_in_cache(
     if alert_entry:
         market_alert_cache.remove(alert_entry)
         del _market_alert_index[key]
+        _unindex_alert_price(alert_entry)
         pretty_log(
             message=f"✅ Removed market alert for {alert_entry['user_name']} {pokemon} (User ID: {user_id}) from cache.",
             tag="cache",
@@ -127,7 +180,8 @@ def remove_all_alerts_for_user_in_cache(user_id: int):
     for alert in to_remove:
         market_alert_cache.remove(alert)
         key = (alert["pokemon"], alert["channel_id"], user_id)
-        del _market_alert_index[key]
+        _market_alert_index.pop(key, None)
+        _unindex_alert_price(alert)
     pretty_log(
         message=f"✅ Removed all market alerts for User ID: {user_id} from cache.",
         tag="cache",
@@ -151,7 +205,10 @@ def update_user_alert_in_cache(
     if old_key:
         alert_entry = _market_alert_index[old_key]
         if new_max_price is not None:
+            # Re-slot the alert so its price bucket stays sorted
+            _unindex_alert_price(alert_entry)
             alert_entry["max_price"] = new_max_price
+            _index_alert_price(alert_entry)
         if new_channel_id is not None:
             alert_entry["channel_id"] = new_channel_id
         if new_role_id is not None:
@@ -0,0 +1,210 @@
+import math
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+
+import discord
+
+from utils.db.market_price_history_db import (
+    append_market_price_observation,
+    ensure_market_price_partitions,
+    fetch_recent_market_prices,
+    market_price_writes,
+)
+from utils.logs.pretty_log import pretty_log
+
+from .cache_list import market_price_stats_cache
+
+# 🟣────────────────────────────────────────────
+#     📈 Rolling Market Price Stats
+# 🟣────────────────────────────────────────────
+# Every market feed listing is appended to market_price_history and folded
+# into a per-Pokémon rolling window of the lowest market price it showed.
+# Each window keeps its prices sorted, so median / percentiles are a lookup,
+# and an EWMA updated on every observation. Nothing scans history at query
+# time; the DB is only read once on startup to warm the windows.
+
+WINDOW_SECONDS = 7 * 24 * 60 * 60
+MAX_SAMPLES = 200
+EWMA_HALF_LIFE_SECONDS = 6 * 60 * 60
+MIN_SAMPLES = 5  # below this, stats are not trusted and callers fall back
+
+
+class PriceWindow:
+    __slots__ = ("samples", "sorted_prices", "ewma", "last_seen")
+
+    def __init__(self):
+        self.samples: deque[tuple[float, int]] = deque()  # (UNIX seconds, price)
+        self.sorted_prices: list[int] = []
+        self.ewma: float | None = None
+        self.last_seen = 0.0
+
+    def add(self, price: int, observed_at: float):
+        self.samples.append((observed_at, price))
+        insort(self.sorted_prices, price)
+
+        # Time-decayed EWMA, so bursts of listings don't outweigh quiet days
+        if self.ewma is None:
+            self.ewma = float(price)
+        else:
+            elapsed = max(observed_at - self.last_seen, 0.0)
+            alpha = 1 - math.exp(-math.log(2) * elapsed / EWMA_HALF_LIFE_SECONDS)
+            # A floor for back-to-back listings, so they still move the average
+            alpha = max(alpha, 0.02)
+            self.ewma += alpha * (price - self.ewma)
+        self.last_seen = max(self.last_seen, observed_at)
+
+        cutoff = self.last_seen - WINDOW_SECONDS
+        while self.samples and (
+            len(self.samples) > MAX_SAMPLES or self.samples[0][0] < cutoff
+        ):
+            _, old_price = self.samples.popleft()
+            del self.sorted_prices[bisect_left(self.sorted_prices, old_price)]
+
+    def __len__(self) -> int:
+        return len(self.sorted_prices)
+
+    def percentile(self, pct: float) -> int | None:
+        """Nearest-rank percentile of the prices in the window."""
+        if not self.sorted_prices:
+            return None
+        rank = math.ceil(pct / 100 * len(self.sorted_prices))
+        return self.sorted_prices[min(max(rank, 1), len(self.sorted_prices)) - 1]
+
+    @property
+    def median(self) -> int | None:
+        return self.percentile(50)
+
+
+def _add_price(
+    windows: dict[str, PriceWindow], pokemon_name: str, price: int, observed_at: float
+):
+    window = windows.get(pokemon_name)
+    if window is None:
+        window = windows[pokemon_name] = PriceWindow()
+    window.add(price, observed_at)
+
+
+# While a reload is fetching: (pokemon, listing id, price, UNIX seconds) of
+# the listings recorded meanwhile, replayed into the reloaded windows
+_recorded_during_load: list[tuple[str, str, int, float]] | None = None
+
+
+# 🍡──────────────────────────────────────────────
+#   Record / Read
+# 🍡──────────────────────────────────────────────
+async def record_market_price(
+    bot: discord.Client,
+    pokemon_name: str,
+    listing_id: str,
+    listed_price: int,
+    lowest_market: int,
+    amount: int = 1,
+):
+    """Adds a market feed listing to the rolling stats and the history table."""
+    if lowest_market <= 0:
+        return
+    pokemon_name = pokemon_name.lower()
+    now = time.time()
+    _add_price(market_price_stats_cache, pokemon_name, lowest_market, now)
+    if _recorded_during_load is not None:
+        _recorded_during_load.append((pokemon_name, listing_id, lowest_market, now))
+    await append_market_price_observation(
+        bot, pokemon_name, listing_id, listed_price, lowest_market, amount
+    )
+
+
+def fetch_market_price_stats(pokemon_name: str) -> dict | None:
+    """
+    Rolling stats of a Pokémon's lowest market price, or None if it has
+    not been seen within the window.
+    """
+    window = market_price_stats_cache.get(pokemon_name.lower())
+    if not window:
+        return None
+    return {
+        "samples": len(window),
+        "median": window.median,
+        "p10": window.percentile(10),
+        "p90": window.percentile(90),
+        "ewma": round(window.ewma) if window.ewma is not None else None,
+        "last_seen": window.last_seen,
+    }
+
+
+def snipe_reference_price(pokemon_name: str, lowest_market: int) -> int:
+    """
+    Price a listing is compared to for snipe detection: the lower of the
+    rolling median and EWMA once enough listings were seen, so a single
+    odd lowest_market (a troll listing, a stale floor) doesn't decide it.
+    Falls back to lowest_market for rarely listed Pokémon.
+    """
+    window = market_price_stats_cache.get(pokemon_name.lower())
+    if not window or len(window) < MIN_SAMPLES:
+        return lowest_market
+    return min(window.median, round(window.ewma))
+
+
+# 🍡──────────────────────────────────────────────
+#   Startup Load
+# 🍡──────────────────────────────────────────────
+async def load_market_price_stats_cache(bot: discord.Client):
+    """
+    Rebuilds the windows from market_price_history. The current windows are
+    only replaced once the history was read, and kept if that fails.
+    """
+    global _recorded_during_load
+    _recorded_during_load = recorded = []
+    try:
+        # So the reload sees every listing recorded so far
+        await market_price_writes.flush()
+        try:
+            await ensure_market_price_partitions(bot)
+        except Exception as e:
+            pretty_log(
+                tag="error",
+                message=f"Failed to prepare market price history partitions: {e}",
+            )
+
+        rows = await fetch_recent_market_prices(
+            bot, days=WINDOW_SECONDS // 86400, per_pokemon=MAX_SAMPLES
+        )
+    finally:
+        _recorded_during_load = None
+
+    if rows is None:
+        pretty_log(
+            tag="warn",
+            message="Kept the current market price stats, history could not be read",
+        )
+        return
+
+    windows: dict[str, PriceWindow] = {}
+    now = time.time()
+    offset = now - datetime.utcnow().timestamp()  # observed_at is naive UTC
+    for row in rows:
+        _add_price(
+            windows,
+            row["pokemon_name"],
+            row["lowest_market"],
+            row["observed_at"].timestamp() + offset,
+        )
+    # Listings recorded during the fetch that it did not return
+    fetched_ids = {row["listing_id"] for row in rows}
+    for pokemon_name, listing_id, price, observed_at in recorded:
+        if listing_id not in fetched_ids:
+            _add_price(windows, pokemon_name, price, observed_at)
+
+    # Swapped in place, the dict is shared by import
+    market_price_stats_cache.clear()
+    market_price_stats_cache.update(windows)
+
+    pretty_log(
+        message=(
+            f"Loaded {len(rows)} market price observations for "
+            f"{len(market_price_stats_cache)} Pokémon into cache"
+        ),
+        label="📈 MARKET PRICE CACHE",
+        tag="cache",
+    )
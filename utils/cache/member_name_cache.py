@@ -0,0 +1,101 @@
+import discord
+
+from utils.cache.cache_list import normalize_member_name
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#       🔎 Per-Guild Member Name Index
+# 🟣────────────────────────────────────────────
+# Resolves a PokéMeow trainer name to a guild member without scanning
+# guild.members. Kept up to date by cogs/events/member_name_index.py.
+
+member_name_index: dict[int, dict[str, set[int]]] = {}
+# Structure:
+# guild_id -> {
+#   normalize_member_name(name): {member_id, ...},
+#   ...
+# }
+
+_member_name_keys: dict[tuple[int, int], tuple[str, ...]] = {}
+# (guild_id, member_id) -> keys this member is indexed under, for O(1) removal
+
+
+def _member_keys(member: discord.Member) -> tuple[str | None, ...]:
+    return (
+        normalize_member_name(member.name),
+        normalize_member_name(member.display_name),
+        normalize_member_name(getattr(member, "global_name", None)),
+    )
+
+
+def index_member(member: discord.Member):
+    """Add (or refresh) a member's names in their guild's index."""
+    unindex_member(member.guild.id, member.id)
+    index = member_name_index.setdefault(member.guild.id, {})
+    keys = tuple(dict.fromkeys(key for key in _member_keys(member) if key))
+    for key in keys:
+        index.setdefault(key, set()).add(member.id)
+    _member_name_keys[(member.guild.id, member.id)] = keys
+
+
+def unindex_member(guild_id: int, member_id: int):
+    """Remove a member from every name they are indexed under."""
+    keys = _member_name_keys.pop((guild_id, member_id), ())
+    index = member_name_index.get(guild_id)
+    if not index:
+        return
+    for key in keys:
+        member_ids = index.get(key)
+        if member_ids:
+            member_ids.discard(member_id)
+            if not member_ids:
+                del index[key]
+
+
+def build_guild_member_index(guild: discord.Guild):
+    """(Re)build the whole name index for a guild."""
+    for key in [k for k in _member_name_keys if k[0] == guild.id]:
+        del _member_name_keys[key]
+    member_name_index[guild.id] = {}
+    for member in guild.members:
+        index_member(member)
+    pretty_log(
+        "cache",
+        f"Indexed {len(guild.members)} member names for guild {guild.name}",
+    )
+
+
+def find_member_by_name(guild: discord.Guild, name: str) -> discord.Member | None:
+    """
+    Case-insensitive lookup of a member by username, display name or global name.
+    When several members share the name, the one whose username it is wins,
+    then the first in guild.members. Builds the guild's index on first use.
+    """
+    key = normalize_member_name(name)
+    if not key or not guild:
+        return None
+    index = member_name_index.get(guild.id)
+    if index is None:
+        build_guild_member_index(guild)
+        index = member_name_index[guild.id]
+
+    member_ids = index.get(key)
+    if not member_ids:
+        return None
+    members = []
+    for member_id in list(member_ids):
+        member = guild.get_member(member_id)
+        if member is None:
+            # Member left without an event reaching us, drop the stale entry
+            unindex_member(guild.id, member_id)
+        else:
+            members.append(member)
+    if len(members) <= 1:
+        return members[0] if members else None
+
+    # Shared name: usernames are unique, so an exact username match wins
+    for member in members:
+        if normalize_member_name(member.name) == key:
+            return member
+    member_ids = {member.id for member in members}
+    return next((m for m in guild.members if m.id in member_ids), members[0])
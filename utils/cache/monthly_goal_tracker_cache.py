@@ -1,9 +1,30 @@
+import time
+
 import discord
 
 from utils.cache.cache_list import monthly_goal_cache
+from utils.db.get_pg_pool import register_statement
 from utils.db.monthly_goal_tracker import fetch_all_monthly_goals
 from utils.logs.pretty_log import pretty_log
 
+MONTHLY_GOAL_UPSERT = register_statement(
+    "monthly_goal.upsert",
+    """
+    INSERT INTO monthly_goal_tracker (
+        user_id, user_name, channel_id, pokemon_caught, fish_caught, battles_won,
+        monthly_requirement_mark
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT(user_id) DO UPDATE SET
+        user_name = EXCLUDED.user_name,
+        channel_id = EXCLUDED.channel_id,
+        pokemon_caught = EXCLUDED.pokemon_caught,
+        fish_caught = EXCLUDED.fish_caught,
+        battles_won = EXCLUDED.battles_won,
+        monthly_requirement_mark = EXCLUDED.monthly_requirement_mark
+    """,
+)
+
 
 # Load monthly goals into cache
 async def load_monthly_goal_cache(bot: discord.Client):
@@ -181,59 +202,80 @@ def increment_monthly_battles_won(user_name: str, user_id: int, amount: int = 1)
 monthly_goal_cache_dirty: dict[int, bool] = {}
 
 
-async def flush_monthly_goal_cache(bot: discord.Client):
+def _monthly_goal_row(bot: discord.Client, user_id: int) -> tuple:
+    """Builds the DB row for a user's cached monthly stats."""
+    stats = monthly_goal_cache[user_id]
+    user_obj = bot.get_user(user_id)
+    user_name = stats.get("user_name") or (
+        user_obj.name if user_obj else f"User {user_id}"
+    )
+    return (
+        user_id,
+        user_name,
+        stats.get("channel_id"),
+        stats.get("pokemon_caught", 0),
+        stats.get("fish_caught", 0),
+        stats.get("battles_won", 0),
+        stats.get("monthly_requirement_mark", False),
+    )
+
+
+async def flush_monthly_goal_cache(bot: discord.Client) -> int:
     """
-    Bulk upsert only dirty entries from monthly_goal_cache into the database.
-    Call periodically (e.g., every 5 minutes) to persist cache.
+    Bulk upsert only dirty entries from monthly_goal_cache into the database,
+    in one executemany inside a single transaction. Dirty flags are cleared
+    only after commit, and only for users whose stats did not change while
+    the flush was in flight. Returns the number of rows flushed.
     """
     if not monthly_goal_cache:
-        return  # nothing to flush
+        return 0  # nothing to flush
 
     # Filter only dirty users
     dirty_users = [uid for uid, dirty in monthly_goal_cache_dirty.items() if dirty]
 
     # ── Exit early if nothing changed ──
     if not dirty_users:
-        return  # nothing to flush
-
-    query = """
-        INSERT INTO monthly_goal_tracker (
-            user_id, user_name, channel_id, pokemon_caught, fish_caught, battles_won,
-            monthly_requirement_mark
+        return 0  # nothing to flush
+
+    rows = []
+    for user_id in dirty_users:
+        if user_id not in monthly_goal_cache:
+            # Dropped from the cache (e.g. reset), nothing left to write
+            monthly_goal_cache_dirty.pop(user_id, None)
+            continue
+        rows.append(_monthly_goal_row(bot, user_id))
+    if not rows:
+        return 0
+
+    start = time.perf_counter()
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany_named(MONTHLY_GOAL_UPSERT, rows)
+    except Exception as e:
+        # Rows stay dirty and are retried next tick
+        pretty_log(
+            "error",
+            f"Failed to flush {len(rows)} monthly goal rows: {e}",
+            label="💠 MONTHLY GOAL CACHE",
+            bot=bot,
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
-        ON CONFLICT(user_id) DO UPDATE SET
-            user_name = EXCLUDED.user_name,
-            channel_id = EXCLUDED.channel_id,
-            pokemon_caught = EXCLUDED.pokemon_caught,
-            fish_caught = EXCLUDED.fish_caught,
-            battles_won = EXCLUDED.battles_won,
-            monthly_requirement_mark = EXCLUDED.monthly_requirement_mark
-    """
+        return 0
+    elapsed_ms = (time.perf_counter() - start) * 1000
 
-    async with bot.pg_pool.acquire() as conn:
-        for user_id in dirty_users:
-            stats = monthly_goal_cache[user_id]
-            user_obj = bot.get_user(user_id)
-            user_name = stats.get("user_name") or (
-                user_obj.name if user_obj else f"User {user_id}"
-            )
-            channel_id = stats.get("channel_id")
-
-            await conn.execute(
-                query,
-                user_id,
-                user_name,
-                channel_id,
-                stats.get("pokemon_caught", 0),
-                stats.get("fish_caught", 0),
-                stats.get("battles_won", 0),
-                stats.get("monthly_requirement_mark", False),
-            )
-
-            # Clear dirty flag after writing
+    # Clear dirty flags after commit, unless the stats moved on mid-flush
+    for row in rows:
+        user_id = row[0]
+        if user_id in monthly_goal_cache and _monthly_goal_row(bot, user_id) == row:
             monthly_goal_cache_dirty[user_id] = False
 
+    pretty_log(
+        "db",
+        f"Flushed {len(rows)} monthly goal rows in {elapsed_ms:.1f} ms",
+        label="💠 MONTHLY GOAL CACHE",
+    )
+    return len(rows)
+
 
 # ── Helper to mark a user as dirty whenever stats change ──
 def mark_monthly_goal_dirty(user_id: int):
@@ -1,16 +1,59 @@
 import discord
 
-from utils.cache.cache_list import vna_members_cache
+from utils.cache.cache_list import (
+    _vna_member_name_index,
+    _vna_member_pokemeow_name_index,
+    first_cached_member,
+    index_member_name,
+    normalize_member_name,
+    unindex_member_name,
+    vna_members_cache,
+)
 from utils.db.vna_members_db_func import fetch_all_members
 from utils.logs.pretty_log import pretty_log
 
 
+# 🟣────────────────────────────────────────────
+#       🔎 Name Index Helpers
+# 🟣────────────────────────────────────────────
+def _index_vna_member(user_id: int):
+    """Add a cached member's names to the lookup indexes."""
+    data = vna_members_cache.get(user_id)
+    if not data:
+        return
+    index_member_name(
+        _vna_member_name_index, normalize_member_name(data.get("user_name")), user_id
+    )
+    index_member_name(
+        _vna_member_pokemeow_name_index,
+        normalize_member_name(data.get("pokemeow_name")),
+        user_id,
+    )
+
+
+def _unindex_vna_member(user_id: int):
+    """Drop a cached member's names from the lookup indexes."""
+    data = vna_members_cache.get(user_id)
+    if not data:
+        return
+    unindex_member_name(
+        _vna_member_name_index, normalize_member_name(data.get("user_name")), user_id
+    )
+    unindex_member_name(
+        _vna_member_pokemeow_name_index,
+        normalize_member_name(data.get("pokemeow_name")),
+        user_id,
+    )
+
+
 # Load all vna_members into cache
 async def load_vna_members_cache(bot):
     """
     Load all vna_members from the database into the cache.
     """
     vna_members_cache.clear()
+    _vna_member_name_index.clear()
+    _vna_member_pokemeow_name_index.clear()
     try:
         members = await fetch_all_members(bot)
         if members:
@@ -24,6 +67,7 @@ async def load_vna_members_cache(bot):
                     "faction": member["faction"],
                     "clan_joined_date": member.get("clan_joined_date"),
                 }
+                _index_vna_member(user_id)
             pretty_log(
                 "cache", f"Loaded {len(vna_members_cache)} vna_members into cache."
             )
@@ -48,6 +92,7 @@ def upsert_vna_member_cache(
     """
     Upsert a vna_member into the cache.
     """
+    _unindex_vna_member(user_id)
     vna_members_cache[user_id] = {
         "user_name": user_name,
         "pokemeow_name": pokemeow_name,
@@ -56,6 +101,7 @@ def upsert_vna_member_cache(
         "faction": faction,
         "clan_joined_date": clan_joined_date,
     }
+    _index_vna_member(user_id)
     pretty_log("cache", f"Upserted vna_member {user_name} ({user_id}) into cache.")
 
 def fetch_vna_member_channel_id_from_cache(user_id: int) -> int | None:
@@ -80,6 +126,7 @@ def update_vna_member_multiple_fields_cache(
     Update multiple fields for a vna_member in the cache.
     """
     if user_id in vna_members_cache:
+        _unindex_vna_member(user_id)
         if user_name is not None:
             vna_members_cache[user_id]["user_name"] = user_name
         if pokemeow_name is not None:
@@ -92,6 +139,7 @@ def update_vna_member_multiple_fields_cache(
             vna_members_cache[user_id]["faction"] = faction
         if clan_joined_date is not None:
             vna_members_cache[user_id]["clan_joined_date"] = clan_joined_date
+        _index_vna_member(user_id)
         pretty_log(
             "cache",
             f"Updated multiple fields for vna_member ({user_id}) in cache.",
@@ -151,7 +199,9 @@ def update_vna_member_pokemeow_name_cache(user_id: int, pokemeow_name: str):
     Update the pokemeow_name of a vna_member in the cache.
     """
     if user_id in vna_members_cache:
+        _unindex_vna_member(user_id)
         vna_members_cache[user_id]["pokemeow_name"] = pokemeow_name
+        _index_vna_member(user_id)
         pretty_log(
             "cache",
             f"Updated pokemeow_name for vna_member ({user_id}) to {pokemeow_name} in cache.",
@@ -163,7 +213,9 @@ def update_vna_member_user_name_cache(user_id: int, user_name: str):
     Update the user_name of a vna_member in the cache.
     """
     if user_id in vna_members_cache:
+        _unindex_vna_member(user_id)
         vna_members_cache[user_id]["user_name"] = user_name
+        _index_vna_member(user_id)
         pretty_log(
             "cache",
             f"Updated user_name for vna_member ({user_id}) to {user_name} in cache.",
@@ -172,32 +224,33 @@ def update_vna_member_user_name_cache(user_id: int, user_name: str):
 
 def fetch_vna_member_id_by_username(user_name: str) -> int | None:
     """
-    Fetch a vna_member's user_id by their user_name from the cache.
+    Fetch a vna_member's user_id by their user_name from the cache (case-insensitive).
     """
-    for user_id, data in vna_members_cache.items():
-        if data["user_name"] == user_name:
-            return user_id
-    return None
+    return first_cached_member(
+        vna_members_cache, _vna_member_name_index.get(normalize_member_name(user_name))
+    )
 
 
 def fetch_vna_member_id_by_pokemeow_name(pokemeow_name: str) -> int | None:
     """
-    Fetch a vna_member's user_id by their pokemeow_name from the cache.
+    Fetch a vna_member's user_id by their pokemeow_name from the cache (case-insensitive).
     """
-    for user_id, data in vna_members_cache.items():
-        if data["pokemeow_name"] == pokemeow_name:
-            return user_id
-    return None
+    return first_cached_member(
+        vna_members_cache,
+        _vna_member_pokemeow_name_index.get(normalize_member_name(pokemeow_name)),
+    )
 
 
 def fetch_vna_member_id_by_username_or_pokemeow_name(name: str) -> int | None:
     """
     Fetch a vna_member's user_id by their user_name or pokemeow_name from the cache.
     """
-    for user_id, data in vna_members_cache.items():
-        if data["user_name"] == name or data["pokemeow_name"] == name:
-            return user_id
-    return None
+    key = normalize_member_name(name)
+    by_user_name = _vna_member_name_index.get(key)
+    by_pokemeow_name = _vna_member_pokemeow_name_index.get(key)
+    if by_user_name and by_pokemeow_name:
+        return first_cached_member(vna_members_cache, by_user_name | by_pokemeow_name)
+    return first_cached_member(vna_members_cache, by_user_name or by_pokemeow_name)
 
 
 def remove_vna_member_from_cache(user_id: int):
@@ -205,6 +258,7 @@ def remove_vna_member_from_cache(user_id: int):
     Remove a vna_member from the cache by user_id.
     """
     if user_id in vna_members_cache:
+        _unindex_vna_member(user_id)
         del vna_members_cache[user_id]
         pretty_log("cache", f"Removed vna_member ({user_id}) from cache.")
 
@@ -1,5 +1,6 @@
 import discord
 
+from utils.background_task.reminder_scheduler import schedule_reminder
 from utils.logs.pretty_log import pretty_log
 import time
 # SQL TABLE
@@ -224,6 +225,8 @@ async def upsert_berry_reminder(
                 notified,
                 moisture_dries_on,
             )
+        schedule_reminder("berry_growth", grows_on)
+        schedule_reminder("berry_moisture", moisture_dries_on)
         pretty_log(
             "db",
             f"Upserted berry reminder for {user_name} (user_id: {user_id}) in slot {slot_number}, "
@@ -305,6 +308,7 @@ async def update_growth_stage(
                 user_id,
                 slot_number,
             )
+        schedule_reminder("berry_growth", grows_on)
         pretty_log(
             "db",
             f"Updated growth stage to {stage} and grows_on to {grows_on} for user_id {user_id} in slot {slot_number}",
@@ -464,6 +468,7 @@ async def update_moisture_dries_on(
                 user_id,
                 slot_number,
             )
+        schedule_reminder("berry_moisture", moisture_dries_on)
         pretty_log(
             "db",
             f"Updated moisture_dries_on to {moisture_dries_on} for user_id {user_id} in slot {slot_number}",
@@ -1,5 +1,6 @@
 import discord
 
+from utils.db.write_behind import WriteBehindBuffer
 from utils.logs.pretty_log import pretty_log
 
 # SQL SCRIPT
@@ -42,33 +43,43 @@ async def fetch_all_faction_balls(bot) -> dict:
 # 🍥──────────────────────────────────────────────
 #   Update a Specific Faction Ball Value
 # 🍥──────────────────────────────────────────────
+async def _write_faction_balls(bot, rows: list[tuple[str, str | None]]):
+    """Writes the latest ball of every changed faction in one UPDATE."""
+    assignments = ", ".join(
+        f"{faction} = ${i}" for i, (faction, _) in enumerate(rows, start=1)
+    )
+    async with bot.pg_pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                "INSERT INTO daily_faction_ball (aqua) SELECT NULL "
+                "WHERE NOT EXISTS (SELECT 1 FROM daily_faction_ball)"
+            )
+            await conn.execute(
+                f"UPDATE daily_faction_ball SET {assignments}",
+                *(ball_type for _, ball_type in rows),
+            )
+    pretty_log(
+        tag="db",
+        message="Updated "
+        + ", ".join(f"{faction} ball to {ball_type}" for faction, ball_type in rows),
+        bot=bot,
+    )
+
+
+faction_ball_writes = WriteBehindBuffer("daily_faction_ball", _write_faction_balls)
+
+
 async def update_faction_ball(bot, faction: str, ball_type: str | None):
-    """Update the value for a specific faction ball (TEXT)."""
+    """
+    Update the value for a specific faction ball (TEXT).
+    The cache is updated right away, the DB write is batched (write-behind).
+    """
     if faction not in FACTIONS:
         raise ValueError(f"Invalid faction: {faction}")
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM daily_faction_ball")
-            if not row:
-                await conn.execute("INSERT INTO daily_faction_ball DEFAULT VALUES")
-            await conn.execute(
-                f"UPDATE daily_faction_ball SET {faction} = $1", ball_type
-            )
-        pretty_log(
-            tag="db",
-            message=f"Updated {faction} ball to {ball_type}",
-            bot=bot,
-        )
-        # Also update the cache
-        from utils.cache.daily_fa_ball_cache import update_daily_faction_ball_cache
+    from utils.cache.daily_fa_ball_cache import update_daily_faction_ball_cache
 
-        update_daily_faction_ball_cache(faction, ball_type)
-    except Exception as e:
-        pretty_log(
-            tag="error",
-            message=f"Failed to update {faction} ball: {e}",
-            bot=bot,
-        )
+    update_daily_faction_ball_cache(faction, ball_type)
+    await faction_ball_writes.submit(bot, faction, (faction, ball_type))
 
 
 # 🍭──────────────────────────────────────────────
@@ -76,6 +87,9 @@ async def update_faction_ball(bot, faction: str, ball_type: str | None):
 # 🍭──────────────────────────────────────────────
 async def clear_daily_faction_ball(bot):
     """Set all faction ball values to NULL."""
+    # Drop buffered updates instead of writing them, so neither a pending
+    # nor a failed-and-requeued write can land after the clear
+    await faction_ball_writes.discard(FACTIONS)
     try:
         async with bot.pg_pool.acquire() as conn:
             await conn.execute(
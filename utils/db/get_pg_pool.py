@@ -1,14 +1,49 @@
 import os
 import ssl
+import sys
 import asyncio
+import time
+from typing import Callable
+
 import asyncpg
 from asyncpg.pool import Pool
+from utils.db.query_stats import (
+    pool_counters,
+    query_key,
+    record_pool_wait,
+    record_query,
+    row_count,
+)
 from utils.logs.pretty_log import pretty_log
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+# -------------------- [💙 NAMED PREPARED STATEMENTS] --------------------
+# name -> SQL. asyncpg prepares each distinct SQL text once per connection and
+# reuses it; registering a statement gives it a stable name (for /dbstats and
+# the *_named methods) and sizes the per-connection statement cache so
+# registered statements are never evicted by one-off queries.
+PREPARED_STATEMENTS: dict[str, str] = {}
+_STATEMENT_NAMES: dict[str, str] = {}  # SQL -> name
+STATEMENT_CACHE_HEADROOM = 256  # asyncpg's default cache is only 100
+
+
+def register_statement(name: str, sql: str) -> str:
+    """Registers SQL under a name (call at import time). Returns the name."""
+    existing = PREPARED_STATEMENTS.get(name)
+    if existing is not None and existing != sql:
+        raise ValueError(f"Prepared statement {name!r} is already registered")
+    PREPARED_STATEMENTS[name] = sql
+    _STATEMENT_NAMES[sql] = name
+    return name
+
+
+def _caller_module(depth: int) -> str:
+    return sys._getframe(depth + 1).f_globals.get("__name__", "?")
+
+
 # -------------------- [💙 SAFE POOL WRAPPER WITH RETRY] --------------------
 class SafePool:
     def __init__(
@@ -25,26 +60,35 @@ class SafePool:
         self.max_size = max_size
         self.retry_count = retry_count
         self._pool: Pool | None = None
+        # Dedicated LISTEN connection, kept outside the pool so it never starves queries
+        self._listen_conn: asyncpg.Connection | None = None
+        self._listeners: dict[str, Callable] = {}
 
-    async def connect(self):
-        self._pool = await asyncpg.create_pool(
+    async def _create_pool(self) -> Pool:
+        return await asyncpg.create_pool(
             dsn=self.dsn,
             ssl=self.ssl_context,
             min_size=self.min_size,
             max_size=self.max_size,
+            statement_cache_size=len(PREPARED_STATEMENTS) + STATEMENT_CACHE_HEADROOM,
         )
 
+    async def connect(self):
+        self._pool = await self._create_pool()
+
     def acquire(self):
         if not self._pool:
             raise RuntimeError("SafePool not connected. Call connect() first.")
-        return SafeConnection(self._pool)
+        return SafeConnection(self._pool, _caller_module(1))
 
-    async def _retry(self, method, *args, **kwargs):
+    async def _retry(self, method: str, module: str, *args, **kwargs):
         last_exc = None
         for attempt in range(1, self.retry_count + 2):
             try:
-                async with self.acquire() as conn:
-                    return await method(conn, *args, **kwargs)
+                if not self._pool:
+                    raise RuntimeError("SafePool not connected. Call connect() first.")
+                async with SafeConnection(self._pool, module) as conn:
+                    return await getattr(conn, method)(*args, **kwargs)
             except (
                 asyncpg.exceptions.ConnectionDoesNotExistError,
                 ConnectionResetError,
@@ -52,9 +96,10 @@ class SafePool:
                 asyncio.TimeoutError,  # <— added
             ) as e:
                 last_exc = e
+                pool_counters["retries"] += 1
                 pretty_log(
                     tag="warn",
-                    message=f"[Retry {attempt}/{self.retry_count + 1}] {method.__name__} failed: {e}. Reconnecting...",
+                    message=f"[Retry {attempt}/{self.retry_count + 1}] {method} from {module} failed: {e}. Reconnecting...",
                     include_trace=False,
                 )
                 await asyncio.sleep(0.5)
@@ -62,47 +107,98 @@ class SafePool:
         raise last_exc
 
     async def _reconnect(self):
+        pool_counters["reconnects"] += 1
         if self._pool:
             try:
                 await self._pool.close()
             except Exception:
                 pass
-        self._pool = await asyncpg.create_pool(
-            dsn=self.dsn,
-            ssl=self.ssl_context,
-            min_size=self.min_size,
-            max_size=self.max_size,
-        )
+        self._pool = await self._create_pool()
 
     async def fetch(self, *args, **kwargs):
+        return await self._retry("fetch", _caller_module(1), *args, **kwargs)
+
+    async def fetchrow(self, *args, **kwargs):
+        return await self._retry("fetchrow", _caller_module(1), *args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await self._retry("execute", _caller_module(1), *args, **kwargs)
+
+    async def fetchval(self, *args, **kwargs):
+        row = await self._retry("fetchrow", _caller_module(1), *args, **kwargs)
+        return row[0] if row else None
+
+    # Same as above, by registered statement name
+    async def fetch_named(self, name: str, *args, **kwargs):
+        return await self._retry("fetch_named", _caller_module(1), name, *args, **kwargs)
+
+    async def fetchrow_named(self, name: str, *args, **kwargs):
         return await self._retry(
-            lambda conn, *a, **k: conn.fetch(*a, **k), *args, **kwargs
+            "fetchrow_named", _caller_module(1), name, *args, **kwargs
         )
 
-    async def fetchrow(self, *args, **kwargs):
+    async def fetchval_named(self, name: str, *args, **kwargs):
         return await self._retry(
-            lambda conn, *a, **k: conn.fetchrow(*a, **k), *args, **kwargs
+            "fetchval_named", _caller_module(1), name, *args, **kwargs
         )
 
-    async def execute(self, *args, **kwargs):
+    async def execute_named(self, name: str, *args, **kwargs):
         return await self._retry(
-            lambda conn, *a, **k: conn.execute(*a, **k), *args, **kwargs
+            "execute_named", _caller_module(1), name, *args, **kwargs
         )
 
-    async def fetchval(self, *args, **kwargs):
-        row = await self.fetchrow(*args, **kwargs)
-        return row[0] if row else None
+    # -------------------- [💛 LISTEN / NOTIFY] --------------------
+    @property
+    def is_listening(self) -> bool:
+        """True while the dedicated LISTEN connection is open."""
+        return self._listen_conn is not None and not self._listen_conn.is_closed()
+
+    async def listen(self, channel: str, callback: Callable):
+        """
+        Subscribe to a Postgres NOTIFY channel.
+        callback(connection, pid, channel, payload) runs for every notification.
+        """
+        if not self.is_listening:
+            self._listen_conn = await asyncpg.connect(
+                dsn=self.dsn, ssl=self.ssl_context
+            )
+            self._listen_conn.add_termination_listener(self._on_listen_terminated)
+            # Re-subscribe channels from a previous connection
+            for existing_channel, existing_callback in self._listeners.items():
+                await self._listen_conn.add_listener(
+                    existing_channel, existing_callback
+                )
+
+        if channel not in self._listeners:
+            await self._listen_conn.add_listener(channel, callback)
+        self._listeners[channel] = callback
+
+    async def unlisten(self, channel: str):
+        callback = self._listeners.pop(channel, None)
+        if callback and self.is_listening:
+            await self._listen_conn.remove_listener(channel, callback)
+
+    def _on_listen_terminated(self, connection):
+        self._listen_conn = None
+        pretty_log(
+            tag="warn",
+            message="LISTEN connection closed, change feed paused until it reconnects.",
+            include_trace=False,
+        )
 
 
 # -------------------- [💜 SAFE CONNECTION CONTEXT] --------------------
 class SafeConnection:
-    def __init__(self, pool: Pool):
+    def __init__(self, pool: Pool, module: str = "?"):
         self.pool = pool
+        self.module = module
         self.conn = None
 
     async def __aenter__(self):
+        start = time.perf_counter()
         self.conn = await self.pool.acquire()
-        return self.conn
+        record_pool_wait((time.perf_counter() - start) * 1000)
+        return InstrumentedConnection(self.conn, self.module)
 
     async def __aexit__(self, exc_type, exc, tb):
         try:
@@ -112,6 +208,83 @@ class SafeConnection:
             pass
 
 
+# -------------------- [💜 INSTRUMENTED CONNECTION] --------------------
+class InstrumentedConnection:
+    """
+    Wraps a pooled asyncpg connection: query methods are timed and counted
+    per (module, statement) for /dbstats, everything else (transaction(),
+    copy_*, ...) goes straight to the connection.
+    """
+
+    __slots__ = ("_conn", "_module")
+
+    def __init__(self, conn: asyncpg.Connection, module: str):
+        self._conn = conn
+        self._module = module
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    async def _timed(self, method: str, key: str, query: str, args, kwargs):
+        start = time.perf_counter()
+        result = None
+        failed = True
+        try:
+            result = await getattr(self._conn, method)(query, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            record_query(
+                self._module,
+                key,
+                (time.perf_counter() - start) * 1000,
+                0 if failed else row_count(method, result, args),
+                failed,
+            )
+
+    def _key(self, query: str) -> str:
+        return _STATEMENT_NAMES.get(query) or query_key(query)
+
+    async def execute(self, query: str, *args, **kwargs):
+        return await self._timed("execute", self._key(query), query, args, kwargs)
+
+    async def executemany(self, query: str, args, **kwargs):
+        return await self._timed(
+            "executemany", self._key(query), query, (args,), kwargs
+        )
+
+    async def fetch(self, query: str, *args, **kwargs):
+        return await self._timed("fetch", self._key(query), query, args, kwargs)
+
+    async def fetchrow(self, query: str, *args, **kwargs):
+        return await self._timed("fetchrow", self._key(query), query, args, kwargs)
+
+    async def fetchval(self, query: str, *args, **kwargs):
+        return await self._timed("fetchval", self._key(query), query, args, kwargs)
+
+    # 🏷️ By registered statement name
+    async def execute_named(self, name: str, *args, **kwargs):
+        return await self._timed("execute", name, PREPARED_STATEMENTS[name], args, kwargs)
+
+    async def executemany_named(self, name: str, args, **kwargs):
+        return await self._timed(
+            "executemany", name, PREPARED_STATEMENTS[name], (args,), kwargs
+        )
+
+    async def fetch_named(self, name: str, *args, **kwargs):
+        return await self._timed("fetch", name, PREPARED_STATEMENTS[name], args, kwargs)
+
+    async def fetchrow_named(self, name: str, *args, **kwargs):
+        return await self._timed(
+            "fetchrow", name, PREPARED_STATEMENTS[name], args, kwargs
+        )
+
+    async def fetchval_named(self, name: str, *args, **kwargs):
+        return await self._timed(
+            "fetchval", name, PREPARED_STATEMENTS[name], args, kwargs
+        )
+
+
 # -------------------- [💧 GET PG POOL] --------------------
 async def get_pg_pool():
     internal_url = os.getenv("DATABASE_URL")
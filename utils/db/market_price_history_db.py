@@ -0,0 +1,188 @@
+from datetime import datetime, timedelta
+
+import discord
+
+from utils.db.get_pg_pool import register_statement
+from utils.db.write_behind import WriteBehindBuffer
+from utils.logs.pretty_log import pretty_log
+
+# SQL SCRIPT (run by ensure_market_price_partitions, no manual setup needed)
+MARKET_PRICE_HISTORY_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS market_price_history (
+        pokemon_name TEXT NOT NULL,
+        listing_id TEXT NOT NULL,
+        listed_price BIGINT NOT NULL,
+        lowest_market BIGINT NOT NULL,
+        amount INT NOT NULL DEFAULT 1,
+        observed_at TIMESTAMP NOT NULL
+    ) PARTITION BY RANGE (observed_at)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS market_price_history_name_observed_idx
+    ON market_price_history (pokemon_name, observed_at)
+    """,
+)
+
+# Monthly partitions (market_price_history_YYYY_MM) are created on the fly by
+# ensure_market_price_partitions and dropped once older than KEEP_MONTHS, so
+# the table stays append-only: no UPDATEs, no row-by-row DELETEs.
+
+# 🌸──────────────────────────────────────────────
+#      📈 Market Price History DB Functions
+# 🌸──────────────────────────────────────────────
+KEEP_MONTHS = 3
+PARTITION_PREFIX = "market_price_history_"
+
+MARKET_PRICE_INSERT = register_statement(
+    "market_price_history.insert",
+    """
+    INSERT INTO market_price_history (
+        pokemon_name, listing_id, listed_price, lowest_market, amount, observed_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6)
+    """,
+)
+
+# Set once the parent table is known to exist
+_parent_ready = False
+# Months whose partition is known to exist
+_ready_months: set[tuple[int, int]] = set()
+
+
+def _month_start(year: int, month: int) -> datetime:
+    return datetime(year + (month - 1) // 12, (month - 1) % 12 + 1, 1)
+
+
+def _partition_name(month_start: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month_start:%Y_%m}"
+
+
+# 🍡──────────────────────────────────────────────
+#   Partition Upkeep
+# 🍡──────────────────────────────────────────────
+async def ensure_market_price_partitions(bot, now: datetime | None = None):
+    """
+    Creates the partitioned table, this month's and next month's partitions
+    if missing, and drops partitions older than KEEP_MONTHS.
+    """
+    global _parent_ready
+    now = now or datetime.utcnow()
+    months = [_month_start(now.year, now.month + i) for i in (0, 1)]
+    oldest_kept = _month_start(now.year, now.month - KEEP_MONTHS + 1)
+    async with bot.pg_pool.acquire() as conn:
+        if not _parent_ready:
+            for statement in MARKET_PRICE_HISTORY_DDL:
+                await conn.execute(statement)
+            _parent_ready = True
+
+        for start in months:
+            if (start.year, start.month) in _ready_months:
+                continue
+            end = _month_start(start.year, start.month + 1)
+            await conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {_partition_name(start)} "
+                f"PARTITION OF market_price_history "
+                f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+            )
+            _ready_months.add((start.year, start.month))
+
+        partitions = await conn.fetch(
+            """
+            SELECT child.relname AS name
+            FROM pg_inherits
+            JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+            JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+            WHERE parent.relname = 'market_price_history'
+            """
+        )
+        for row in partitions:
+            name = row["name"]
+            if name.startswith(PARTITION_PREFIX) and name < _partition_name(oldest_kept):
+                await conn.execute(f"DROP TABLE IF EXISTS {name}")
+                pretty_log(
+                    tag="db",
+                    message=f"Dropped old market price partition {name}",
+                )
+
+
+# 🍡──────────────────────────────────────────────
+#   Append Observations (write-behind)
+# 🍡──────────────────────────────────────────────
+async def _write_market_prices(bot, rows: list[tuple]):
+    months = {(row[5].year, row[5].month) for row in rows}
+    if not months <= _ready_months:
+        await ensure_market_price_partitions(bot, max(row[5] for row in rows))
+    async with bot.pg_pool.acquire() as conn:
+        await conn.executemany_named(MARKET_PRICE_INSERT, rows)
+
+
+# Keyed by listing id, so a listing reposted in the same burst is stored once
+market_price_writes = WriteBehindBuffer(
+    "market_price_history.append", _write_market_prices, flush_interval=5.0
+)
+
+
+async def append_market_price_observation(
+    bot: discord.Client,
+    pokemon_name: str,
+    listing_id: str,
+    listed_price: int,
+    lowest_market: int,
+    amount: int = 1,
+    observed_at: datetime | None = None,
+):
+    """Queues one market feed listing for the history table."""
+    await market_price_writes.submit(
+        bot,
+        listing_id,
+        (
+            pokemon_name.lower(),
+            listing_id,
+            listed_price,
+            lowest_market,
+            amount,
+            observed_at or datetime.utcnow(),
+        ),
+    )
+
+
+# 🍡──────────────────────────────────────────────
+#   Fetch Recent History
+# 🍡──────────────────────────────────────────────
+async def fetch_recent_market_prices(
+    bot, days: int, per_pokemon: int
+) -> list[dict] | None:
+    """
+    The latest per_pokemon observations of each Pokémon from the last days,
+    oldest first, or None if the query failed. Only the recent partitions
+    are scanned.
+    """
+    since = datetime.utcnow() - timedelta(days=days)
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT pokemon_name, listing_id, lowest_market, observed_at
+                FROM (
+                    SELECT pokemon_name, listing_id, lowest_market, observed_at,
+                           row_number() OVER (
+                               PARTITION BY pokemon_name ORDER BY observed_at DESC
+                           ) AS rn
+                    FROM market_price_history
+                    WHERE observed_at >= $1
+                ) recent
+                WHERE rn <= $2
+                ORDER BY observed_at
+                """,
+                since,
+                per_pokemon,
+            )
+            return [dict(row) for row in rows]
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to fetch market price history: {e}",
+            bot=bot,
+        )
+        return None
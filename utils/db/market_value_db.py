@@ -1,11 +1,14 @@
 # 🟣────────────────────────────────────────────
 #        Market Value DB Functions for Mew (bot.pg_pool)
 # 🟣────────────────────────────────────────────
+import time
 from datetime import datetime
 
 import discord
 
 from utils.cache.cache_list import market_value_cache
+from utils.db.get_pg_pool import register_statement
+from utils.db.write_behind import WriteBehindBuffer
 from utils.logs.pretty_log import pretty_log
 
 async def update_rarity(bot, pokemon_name: str, rarity: str):
@@ -13,28 +16,26 @@ async def update_rarity(bot, pokemon_name: str, rarity: str):
     Update the rarity for a Pokémon in the market value table.
     """
     pokemon_name = pokemon_name.lower()
+    cached = market_value_cache.get(pokemon_name)
+    if cached and cached.get("rarity") == rarity:
+        return
     try:
-        async with bot.pg_pool.acquire() as conn:
-            # Only update if row exists
-            row = await conn.fetchrow(
-                "SELECT pokemon_name FROM market_value WHERE pokemon_name = $1",
-                pokemon_name,
-            )
-            if not row:
-                pretty_log(
-                    tag="db",
-                    message=f"No market value row found for {pokemon_name}, skipping rarity update.",
-                )
-                return
-            await conn.execute(
-                "UPDATE market_value SET rarity = $1, last_updated = $2 WHERE pokemon_name = $3",
-                rarity,
-                datetime.utcnow(),
-                pokemon_name,
+        # Only updates an existing row; "UPDATE 0" means there was none
+        status = await bot.pg_pool.execute(
+            "UPDATE market_value SET rarity = $1, last_updated = $2 WHERE pokemon_name = $3",
+            rarity,
+            datetime.utcnow(),
+            pokemon_name,
+        )
+        if status == "UPDATE 0":
+            pretty_log(
+                tag="db",
+                message=f"No market value row found for {pokemon_name}, skipping rarity update.",
             )
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["rarity"] = rarity
+            return
+        # Update in cache as well
+        if cached:
+            cached["rarity"] = rarity
 
         pretty_log(
             tag="db",
@@ -233,6 +234,90 @@ def fetch_image_link_cache(pokemon_name: str):
     return None
 
 
+# 🟣────────────────────────────────────────────
+#   Market listener writes: cache first, batched upsert
+# 🟣────────────────────────────────────────────
+# One upsert for every listener write. NULL image_link / is_exclusive mean
+# "keep what the row has" (COALESCE), so the old four variants collapse
+# into this one statement.
+MARKET_VALUE_LISTENER_UPSERT = register_statement(
+    "market_value.listener_upsert",
+    """
+    INSERT INTO market_value (
+        pokemon_name, lowest_market, listing_seen, last_updated,
+        current_listing, image_link, is_exclusive
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, COALESCE($7, FALSE))
+    ON CONFLICT (pokemon_name) DO UPDATE SET
+        lowest_market = EXCLUDED.lowest_market,
+        listing_seen = EXCLUDED.listing_seen,
+        last_updated = EXCLUDED.last_updated,
+        current_listing = EXCLUDED.current_listing,
+        image_link = COALESCE($6, market_value.image_link),
+        is_exclusive = COALESCE($7, market_value.is_exclusive)
+    """,
+)
+
+# Unchanged listings are not rewritten, but last_updated is still refreshed
+# this often so cleanup_old_market_data never drops a live Pokémon
+MARKET_VALUE_TOUCH_SECONDS = 60 * 60
+_market_value_written_at: dict[str, float] = {}
+
+
+async def _write_market_values(bot, rows: list[tuple]):
+    async with bot.pg_pool.acquire() as conn:
+        await conn.executemany_named(MARKET_VALUE_LISTENER_UPSERT, rows)
+    # Only stamped once the rows are in, so a failed flush never makes
+    # later identical listings look already written
+    written_at = time.monotonic()
+    for row in rows:
+        _market_value_written_at[row[0]] = written_at
+    pretty_log(
+        tag="db",
+        message=f"Upserted {len(rows)} market values from the market listener",
+    )
+
+
+def _merge_market_value_rows(old: tuple, new: tuple) -> tuple:
+    """Newest price / listing fields, keeping a pending image_link / is_exclusive."""
+    return new[:5] + (
+        new[5] if new[5] is not None else old[5],
+        new[6] if new[6] is not None else old[6],
+    )
+
+
+# Gathers the writes of a market feed burst into one executemany
+market_value_writes = WriteBehindBuffer(
+    "market_value.listener",
+    _write_market_values,
+    flush_interval=1.0,
+    merge=_merge_market_value_rows,
+)
+
+
+def _market_value_unchanged(
+    pokemon_name: str,
+    lowest_market: int,
+    listing_seen: str,
+    current_listing: int,
+    image_link: str | None,
+    is_exclusive: bool | None,
+) -> bool:
+    cached = market_value_cache.get(pokemon_name)
+    if not cached:
+        return False
+    written_at = _market_value_written_at.get(pokemon_name)
+    if written_at is None or time.monotonic() - written_at > MARKET_VALUE_TOUCH_SECONDS:
+        return False
+    return (
+        cached.get("lowest_market") == lowest_market
+        and cached.get("listing_seen") == listing_seen
+        and cached.get("current_listing") == current_listing
+        and (image_link is None or cached.get("image_link") == image_link)
+        and (is_exclusive is None or cached.get("is_exclusive") == is_exclusive)
+    )
+
+
 async def update_market_value_via_listener(
     bot,
     pokemon_name: str,
@@ -243,139 +328,65 @@ async def update_market_value_via_listener(
     is_exclusive: bool = None,
 ):
     """
-    Update market value data for a Pokémon based on market view listener input.if exists, else insert new record with minimal data
-    Only updates lowest_market and listing_seen fields.
+    Update market value data for a Pokémon from market view listener input,
+    inserting a minimal row if it does not exist yet.
+    image_link / is_exclusive are only changed when given.
+    The cache is updated right away; the DB write is skipped if nothing
+    changed, otherwise batched with the rest of the feed (write-behind).
     """
     pokemon_name = pokemon_name.lower()
     if current_listing is None:
         current_listing = lowest_market
-    try:
-        async with bot.pg_pool.acquire() as conn:
-            if image_link is not None and is_exclusive is not None:
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (
-                        pokemon_name, lowest_market, listing_seen, last_updated, current_listing, image_link, is_exclusive
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        lowest_market = $2,
-                        listing_seen = $3,
-                        last_updated = $4,
-                        current_listing = $5,
-                        image_link = $6,
-                        is_exclusive = $7
-                    """,
-                    pokemon_name,
-                    lowest_market,
-                    listing_seen,
-                    datetime.utcnow(),
-                    current_listing,
-                    image_link,
-                    is_exclusive,
-                )
-            elif image_link is not None:
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (
-                        pokemon_name, lowest_market, listing_seen, last_updated, current_listing, image_link
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        lowest_market = $2,
-                        listing_seen = $3,
-                        last_updated = $4,
-                        current_listing = $5,
-                        image_link = $6
-                    """,
-                    pokemon_name,
-                    lowest_market,
-                    listing_seen,
-                    datetime.utcnow(),
-                    current_listing,
-                    image_link,
-                )
-            elif is_exclusive is not None:
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (
-                        pokemon_name, lowest_market, listing_seen, last_updated, current_listing, is_exclusive
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        lowest_market = $2,
-                        listing_seen = $3,
-                        last_updated = $4,
-                        current_listing = $5,
-                        is_exclusive = $6
-                    """,
-                    pokemon_name,
-                    lowest_market,
-                    listing_seen,
-                    datetime.utcnow(),
-                    current_listing,
-                    is_exclusive,
-                )
-            else:
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (
-                        pokemon_name, lowest_market, listing_seen, last_updated, current_listing
-                    )
-                    VALUES ($1, $2, $3, $4, $5)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        lowest_market = $2,
-                        listing_seen = $3,
-                        last_updated = $4,
-                        current_listing = $5
-                    """,
-                    pokemon_name,
-                    lowest_market,
-                    listing_seen,
-                    datetime.utcnow(),
-                    current_listing,
-                )
-            # Update in cache as well
-            if pokemon_name in market_value_cache:
-                market_value_cache[pokemon_name]["lowest_market"] = lowest_market
-                market_value_cache[pokemon_name]["listing_seen"] = listing_seen
-                market_value_cache[pokemon_name]["current_listing"] = current_listing
-                if image_link is not None:
-                    market_value_cache[pokemon_name]["image_link"] = image_link
-                if is_exclusive is not None:
-                    market_value_cache[pokemon_name]["is_exclusive"] = is_exclusive
-                pretty_log(
-                    tag="cache",
-                    message=f"Updated market value for {pokemon_name} via listener: lowest_market={lowest_market:,}, listing_seen={listing_seen}, current_listing={current_listing:,}"
-                    + (f", image_link updated" if image_link is not None else "")
-                    + (f", is_exclusive updated" if is_exclusive is not None else ""),
-                )
-            else:
-                market_value_cache[pokemon_name] = {
-                    "pokemon": pokemon_name,
-                    "lowest_market": lowest_market,
-                    "listing_seen": listing_seen,
-                    "current_listing": current_listing,
-                    "image_link": image_link if image_link is not None else None,
-                    "is_exclusive": is_exclusive if is_exclusive is not None else False,
-                }
-                pretty_log(
-                    tag="cache",
-                    message=f"Added new market value for {pokemon_name} via listener: lowest_market={lowest_market:,}, listing_seen={listing_seen}, current_listing={current_listing:,}"
-                    + (f", image_link set" if image_link is not None else "")
-                    + (f", is_exclusive set" if is_exclusive is not None else ""),
-                )
-        pretty_log(
-            tag="db",
-            message=f"Updated market value for {pokemon_name} via listener: lowest_market={lowest_market:,}, listing_seen={listing_seen}, current_listing={current_listing:,}"
-            + (f", image_link updated" if image_link is not None else "")
-            + (f", is_exclusive updated" if is_exclusive is not None else ""),
-        )
-    except Exception as e:
-        pretty_log(
-            tag="error",
-            message=f"Failed to update market value for {pokemon_name} via listener: {e}",
-        )
+
+    if _market_value_unchanged(
+        pokemon_name,
+        lowest_market,
+        listing_seen,
+        current_listing,
+        image_link,
+        is_exclusive,
+    ):
+        return
+
+    # Update in cache as well
+    entry = market_value_cache.get(pokemon_name)
+    if entry is None:
+        entry = market_value_cache[pokemon_name] = {
+            "pokemon": pokemon_name,
+            "image_link": None,
+            "is_exclusive": False,
+        }
+    entry["lowest_market"] = lowest_market
+    entry["listing_seen"] = listing_seen
+    entry["current_listing"] = current_listing
+    if image_link is not None:
+        entry["image_link"] = image_link
+    if is_exclusive is not None:
+        entry["is_exclusive"] = is_exclusive
+
+    await market_value_writes.submit(
+        bot,
+        pokemon_name,
+        (
+            pokemon_name,
+            lowest_market,
+            listing_seen,
+            datetime.utcnow(),
+            current_listing,
+            image_link,
+            is_exclusive,
+        ),
+    )
+    pretty_log(
+        tag="cache",
+        message=lambda: (
+            f"Updated market value for {pokemon_name} via listener: "
+            f"lowest_market={lowest_market:,}, listing_seen={listing_seen}, "
+            f"current_listing={current_listing:,}"
+            + (", image_link updated" if image_link is not None else "")
+            + (", is_exclusive updated" if is_exclusive is not None else "")
+        ),
+    )
 
 
 async def update_dex_number(bot, pokemon_name: str, dex_number: int):
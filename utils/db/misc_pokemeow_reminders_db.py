@@ -2,6 +2,7 @@ from time import time
 
 import discord
 
+from utils.background_task.reminder_scheduler import schedule_reminder
 from utils.logs.pretty_log import pretty_log
 
 # SQL SCRIPT
@@ -36,6 +37,7 @@ async def upsert_secret_santa_reminder(
                 remind_on,
                 channel_id,
             )
+            schedule_reminder("secret_santa", remind_on)
             pretty_log(
                 "info",
                 f"Upserted secret santa reminder for {user_name}, reminds on {remind_on}, channel {channel_id}",
@@ -64,6 +66,7 @@ async def insert_secret_santa_reminder(
                 remind_on,
                 channel_id,
             )
+            schedule_reminder("secret_santa", remind_on)
             pretty_log(
                 "info",
                 f"Inserted secret santa reminder for {user_name}, reminds on {remind_on}, channel {channel_id}",
@@ -92,6 +95,7 @@ async def update_secret_santa_reminder(
                 remind_on,
                 type,
             )
+            schedule_reminder("secret_santa", remind_on)
             pretty_log(
                 "info",
                 f"Updated secret santa reminder for {user_name}, reminds on {remind_on}",
@@ -0,0 +1,136 @@
+import re
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+# 🟣────────────────────────────────────────────
+#        📊 Query Latency / Pool Stats
+# 🟣────────────────────────────────────────────
+# Filled in by SafePool / its connections for every query, shown by /dbstats.
+# Queries are keyed by their registered statement name, or by their first
+# ~60 chars of SQL, and attributed to the utils/db (or other) module that ran
+# them so we can see which modules dominate.
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+SQL_KEY_LENGTH = 60
+MAX_CACHED_KEYS = 4096
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class LatencyStats:
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    def record(self, elapsed_ms: float, rows: int = 0, error: bool = False):
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        if error:
+            self.errors += 1
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def merge(self, other: "LatencyStats"):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.rows += other.rows
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def percentile_ms(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th percentile."""
+        if not self.calls:
+            return 0.0
+        target = self.calls * pct / 100
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return (
+                    LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+                )
+        return self.max_ms
+
+
+# (module, query key) -> stats
+query_stats: dict[tuple[str, str], LatencyStats] = {}
+pool_wait_stats = LatencyStats()
+pool_counters = {"retries": 0, "reconnects": 0}
+stats_since = time.time()
+_key_cache: dict[str, str] = {}
+
+
+def query_key(sql: str) -> str:
+    """Short, whitespace-collapsed SQL used as the stats key of unnamed queries."""
+    key = _key_cache.get(sql)
+    if key is None:
+        key = _WHITESPACE.sub(" ", sql).strip()
+        if len(key) > SQL_KEY_LENGTH:
+            key = key[: SQL_KEY_LENGTH - 1] + "…"
+        # SQL is almost always a constant; don't let dynamic SQL grow this forever
+        if len(_key_cache) < MAX_CACHED_KEYS:
+            _key_cache[sql] = key
+    return key
+
+
+def row_count(method: str, result, args: tuple = ()) -> int:
+    """Rows returned or affected, from an asyncpg result."""
+    if method == "fetch":
+        return len(result)
+    if method in ("fetchrow", "fetchval"):
+        return 0 if result is None else 1
+    if method == "executemany":
+        try:
+            return len(args[0])
+        except (IndexError, TypeError):
+            return 0  # e.g. a generator of rows
+    # execute returns a status like "UPDATE 3" / "INSERT 0 1"
+    if isinstance(result, str):
+        tail = result.rsplit(" ", 1)[-1]
+        if tail.isdigit():
+            return int(tail)
+    return 0
+
+
+def record_query(
+    module: str, key: str, elapsed_ms: float, rows: int = 0, error: bool = False
+):
+    stats = query_stats.get((module, key))
+    if stats is None:
+        stats = query_stats[(module, key)] = LatencyStats()
+    stats.record(elapsed_ms, rows, error)
+
+
+def record_pool_wait(elapsed_ms: float):
+    pool_wait_stats.record(elapsed_ms)
+
+
+def stats_by_module() -> dict[str, LatencyStats]:
+    totals: dict[str, LatencyStats] = {}
+    for (module, _), stats in query_stats.items():
+        totals.setdefault(module, LatencyStats()).merge(stats)
+    return totals
+
+
+def reset_db_stats():
+    global stats_since
+    query_stats.clear()
+    pool_wait_stats.__init__()
+    for name in pool_counters:
+        pool_counters[name] = 0
+    stats_since = time.time()
@@ -2,6 +2,7 @@ import time
 
 import discord
 
+from utils.background_task.reminder_scheduler import schedule_reminder
 from utils.logs.pretty_log import pretty_log
 
 # SQL Script
@@ -33,6 +34,7 @@ async def upsert_shiny_bonus(
                 started_on,
                 ends_on,
             )
+            schedule_reminder("shiny_bonus", ends_on)
             pretty_log(
                 "info",
                 f"Upserted shiny bonus message ID {message_id}",
@@ -60,6 +62,7 @@ async def update_shiny_bonus_ends_on(
                 ends_on,
                 message_id,
             )
+            schedule_reminder("shiny_bonus", ends_on)
             pretty_log(
                 "info",
                 f"Updated shiny bonus ends_on for message ID {message_id}",
@@ -129,14 +132,16 @@ async def extend_shiny_bonus(
 ):
     try:
         async with bot.pg_pool.acquire() as conn:
-            await conn.execute(
+            ends_on = await conn.fetchval(
                 """
                 UPDATE shiny_bonus
                 SET ends_on = ends_on + $1
                 WHERE id = 1
+                RETURNING ends_on
                 """,
                 seconds,
             )
+            schedule_reminder("shiny_bonus", ends_on)
             pretty_log(
                 "info",
                 f"Extended shiny bonus by {seconds} seconds",
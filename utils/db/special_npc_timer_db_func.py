@@ -1,5 +1,6 @@
 import asyncpg
 
+from utils.background_task.reminder_scheduler import schedule_reminder
 from utils.logs.pretty_log import pretty_log
 
 
@@ -22,6 +23,7 @@ async def upsert_special_battle_timer(
                 ends_on,
                 channel_id,
             )
+            schedule_reminder("special_battle", ends_on)
             pretty_log(
                 "info",
                 f"Upserted special battle timer for {user_name}, npc {npc_name}, ends_on {ends_on}",
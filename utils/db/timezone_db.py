@@ -2,6 +2,7 @@ import discord
 import pytz
 from discord import app_commands
 
+from utils.essentials.autocomplete_index import MAX_RESULTS, AutocompleteIndex
 from utils.logs.pretty_log import pretty_log
 
 # ==================================================
@@ -24,11 +25,13 @@ def is_valid_timezone(tz: str) -> bool:
 
 
 # -------------------- [💙 AUTOCOMPLETE LIST] --------------------
+TIMEZONE_INDEX = AutocompleteIndex((tz, tz) for tz in pytz.all_timezones)
+
+
 def autocomplete_timezones(current: str) -> list[str]:
     """Return a list of matching timezones for autocomplete."""
-    current_lower = current.lower()
-    matches = [tz for tz in pytz.all_timezones if current_lower in tz.lower()]
-    return matches[:25]  # Discord limits autocomplete to 25 suggestions
+    # Discord limits autocomplete to 25 suggestions
+    return TIMEZONE_INDEX.search(current or "", limit=MAX_RESULTS)
 
 
 # -------------------- [💙 SET/UPDATE] --------------------
@@ -5,6 +5,7 @@ import discord
 # 🟣 Reminder ID Autocomplete
 from discord import app_commands
 
+from utils.background_task.reminder_scheduler import schedule_reminder
 from utils.logs.pretty_log import pretty_log
 
 # 🔮────────────────────────────────────────────
@@ -91,6 +92,7 @@ async def upsert_user_reminder(
                 repeat_interval,
                 target_channel,
             )
+        schedule_reminder("user_reminders", remind_on)
 
         pretty_log(
             tag="ready",
@@ -164,6 +166,8 @@ async def update_user_reminder(
                     message=f"[Reminder Update] No rows matched for user_id={user_id}, reminder_id={user_reminder_id}",
                 )
             else:
+                if "remind_on" in fields:
+                    schedule_reminder("user_reminders", fields["remind_on"])
                 pretty_log(
                     tag="success",
                     message=f"[Reminder Update] Success: {result} for user_id={user_id}, reminder_id={user_reminder_id}",
@@ -1,5 +1,6 @@
 import discord
 
+from utils.db.write_behind import WriteBehindBuffer
 from utils.logs.pretty_log import pretty_log
 
 # SQL Script to create the vna_members table
@@ -280,29 +281,38 @@ async def update_member_perks(bot, user: discord.Member, perks: str):
 
 
 # Update member pokemeow_name for a user
-async def update_member_pokemeow_name(bot, user: discord.Member, pokemeow_name: str):
-    """
-    Update the pokemeow_name for a user in vna_members.
-    """
-    user_id = user.id
+async def _write_pokemeow_names(bot, rows: list[tuple[str, int]]):
     async with bot.pg_pool.acquire() as conn:
-        await conn.execute(
+        await conn.executemany(
             """
             UPDATE vna_members
             SET pokemeow_name = $1
             WHERE user_id = $2;
             """,
-            pokemeow_name,
-            user_id,
-        )
-        pretty_log(
-            "info",
-            f"Updated pokemeow_name for {user.name} to {pokemeow_name} in vna_members.",
+            rows,
         )
-        # Update cache as well
-        from utils.cache.vna_members_cache import update_vna_member_pokemeow_name_cache
+    pretty_log("db", f"Wrote {len(rows)} pokemeow_name updates to vna_members.")
+
+
+pokemeow_name_writes = WriteBehindBuffer(
+    "vna_members.pokemeow_name", _write_pokemeow_names
+)
 
-        update_vna_member_pokemeow_name_cache(user_id, pokemeow_name)
+
+async def update_member_pokemeow_name(bot, user: discord.Member, pokemeow_name: str):
+    """
+    Update the pokemeow_name for a user in vna_members.
+    The cache is updated right away, the DB write is batched (write-behind).
+    """
+    user_id = user.id
+    from utils.cache.vna_members_cache import update_vna_member_pokemeow_name_cache
+
+    update_vna_member_pokemeow_name_cache(user_id, pokemeow_name)
+    await pokemeow_name_writes.submit(bot, user_id, (pokemeow_name, user_id))
+    pretty_log(
+        "info",
+        f"Updated pokemeow_name for {user.name} to {pokemeow_name} in vna_members.",
+    )
 
 
 # Update member user_name for a user
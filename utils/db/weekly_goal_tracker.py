@@ -24,45 +24,23 @@ async def upsert_weekly_goal(
     battles_won: int = 0,
     weekly_requirement_mark: bool = False,
 ):
-    """Upserts a weekly goal record for a user in the database."""
-    async with bot.pg_pool.acquire() as conn:
-        query = """
-        INSERT INTO weekly_goal_tracker (
-            user_id, user_name, channel_id,
-            pokemon_caught, fish_caught,
-            battles_won, weekly_requirement_mark
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-        ON CONFLICT (user_id) DO UPDATE SET
-            user_name = EXCLUDED.user_name,
-            channel_id = EXCLUDED.channel_id,
-            pokemon_caught = EXCLUDED.pokemon_caught,
-            fish_caught = EXCLUDED.fish_caught,
-            battles_won = EXCLUDED.battles_won,
-            weekly_requirement_mark = EXCLUDED.weekly_requirement_mark;
-        """
-        await conn.execute(
-            query,
-            user_id,
-            user_name,
-            channel_id,
-            pokemon_caught,
-            fish_caught,
-            battles_won,
-            weekly_requirement_mark,
-        )
-        pretty_log("db", f"Upserted weekly goal for user: {user_name}")
-        # Upsert in cache as well
-        from utils.cache.weekly_goal_tracker_cache import upsert_weekly_goal_cache
-
-        upsert_weekly_goal_cache(
-            user_id=user_id,
-            user_name=user_name,
-            channel_id=channel_id,
-            pokemon_caught=pokemon_caught,
-            fish_caught=fish_caught,
-            battles_won=battles_won,
-            weekly_requirement_mark=weekly_requirement_mark,
-        )
+    """
+    Upserts a weekly goal record for a user. Only the cache is written here;
+    the entry is marked dirty and reaches the database with the next
+    flush_weekly_goal_cache tick (or shutdown), so listeners don't wait on
+    Postgres.
+    """
+    from utils.cache.weekly_goal_tracker_cache import upsert_weekly_goal_cache
+
+    upsert_weekly_goal_cache(
+        user_id=user_id,
+        user_name=user_name,
+        channel_id=channel_id,
+        pokemon_caught=pokemon_caught,
+        fish_caught=fish_caught,
+        battles_won=battles_won,
+        weekly_requirement_mark=weekly_requirement_mark,
+    )
 
 
 async def fetch_all_weekly_goals(bot: discord.Client) -> list[dict]:
@@ -0,0 +1,215 @@
+import asyncio
+import itertools
+import time
+from typing import Awaitable, Callable, Hashable, Iterable
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        ✍️ Write-Behind Buffers
+# 🟣────────────────────────────────────────────
+# For DB writes made from listeners: the caller updates its cache, puts the
+# row here and returns without waiting on Postgres. Rows are coalesced by
+# key (only the latest row per key is written) and flushed in one bulk call
+# every flush_interval seconds, or sooner once max_pending keys pile up.
+#
+# Memory is bounded: past max_pending, submit() waits for a flush
+# (backpressure) instead of growing. Failed flushes keep their rows (unless
+# a newer row for the key arrived meanwhile) and retry with exponential
+# backoff. While the last flush failed, submit() never waits on Postgres;
+# past max_buffered keys the oldest rows are dropped and counted instead.
+# flush_all_write_behind() writes everything out on shutdown.
+
+WRITE_BEHIND_LABEL = "✍️ WRITE BEHIND"
+MAX_RETRY_BACKOFF_SECONDS = 60
+
+FlushFunc = Callable[[discord.Client, list], Awaitable[None]]
+MergeFunc = Callable[[object, object], object]
+
+# name -> buffer, for the shutdown flush and stats
+WRITE_BEHIND_BUFFERS: dict[str, "WriteBehindBuffer"] = {}
+
+
+class WriteBehindBuffer:
+    def __init__(
+        self,
+        name: str,
+        flush_func: FlushFunc,
+        *,
+        flush_interval: float = 2.0,
+        max_pending: int = 1000,
+        max_buffered: int | None = None,
+        merge: MergeFunc | None = None,
+    ):
+        """
+        flush_func(bot, rows) writes a list of rows in one go (e.g. one
+        executemany); it is never called with an empty list.
+        max_buffered (default 10x max_pending) is the hard cap on pending
+        keys while flushes are failing.
+        merge(old_row, new_row), if given, combines a newer row with the
+        one still pending for its key; otherwise the newer row replaces it.
+        """
+        self.name = name
+        self.flush_func = flush_func
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_buffered = max_buffered or max_pending * 10
+        self.merge = merge
+        # Oldest submit first, so trimming drops the stalest rows
+        self._pending: dict[Hashable, object] = {}
+        self._bot: discord.Client | None = None
+        self._worker: asyncio.Task | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._failed_streak = 0
+
+        # 📊 Counters
+        self.submitted = 0
+        self.coalesced = 0
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.failures = 0
+        self.dropped = 0
+        self.last_flush_ms = 0.0
+
+        WRITE_BEHIND_BUFFERS[name] = self
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # 📥 Queue a row
+    async def submit(self, bot: discord.Client, key: Hashable, row):
+        """
+        Replaces (or merges into) any pending row for key. Only waits if
+        the buffer is full and the last flush succeeded.
+        """
+        self._bot = bot
+        self.submitted += 1
+        old = self._pending.pop(key, None)
+        if old is not None:
+            self.coalesced += 1
+            if self.merge:
+                row = self.merge(old, row)
+        self._pending[key] = row
+        self._ensure_worker()
+        if self._failed_streak:
+            self._trim()
+        elif len(self._pending) >= self.max_pending:
+            await self.flush()
+
+    async def discard(self, keys: Iterable[Hashable]) -> int:
+        """
+        Drops the pending rows for keys, after any flush in flight has
+        finished (so a failed flush can't re-queue them afterwards).
+        Returns how many were dropped.
+        """
+        if self._flush_lock is None:
+            return 0
+        async with self._flush_lock:
+            return sum(self._pending.pop(key, None) is not None for key in keys)
+
+    def _trim(self):
+        """Drops the oldest rows past max_buffered."""
+        over = len(self._pending) - self.max_buffered
+        if over <= 0:
+            return
+        for key in list(itertools.islice(self._pending, over)):
+            del self._pending[key]
+        self.dropped += over
+        pretty_log(
+            "warn",
+            f"{self.name}: dropped {over} unwritten rows, buffer full while flushes fail",
+            label=WRITE_BEHIND_LABEL,
+            bot=self._bot,
+        )
+
+    def _retry_delay(self) -> float:
+        if not self._failed_streak:
+            return self.flush_interval
+        return min(
+            self.flush_interval * 2**self._failed_streak, MAX_RETRY_BACKOFF_SECONDS
+        )
+
+    def _ensure_worker(self):
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        # Exits once a flush leaves nothing behind
+        while self._pending:
+            await asyncio.sleep(self._retry_delay())
+            await self.flush()
+
+    # 💾 Write everything pending
+    async def flush(self) -> int:
+        """Writes all pending rows now. Returns how many were written."""
+        if self._flush_lock is None:
+            return 0
+        # Also waits for a flush already in flight
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            start = time.perf_counter()
+            try:
+                await self.flush_func(self._bot, list(batch.values()))
+            except asyncio.CancelledError:
+                self._pending = batch | self._pending
+                raise
+            except Exception as e:
+                self.failures += 1
+                self._failed_streak += 1
+                # Keep the rows for the next try, newer submits win
+                requeued = batch | self._pending
+                if self.merge:
+                    for key in batch.keys() & self._pending.keys():
+                        requeued[key] = self.merge(batch[key], self._pending[key])
+                self._pending = requeued
+                self._trim()
+                pretty_log(
+                    "error",
+                    f"{self.name}: failed to flush {len(batch)} rows, "
+                    f"retrying in {self._retry_delay():.0f}s: {e}",
+                    label=WRITE_BEHIND_LABEL,
+                    bot=self._bot,
+                )
+                return 0
+            self._failed_streak = 0
+            self.last_flush_ms = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.flushed_rows += len(batch)
+            return len(batch)
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "pending": len(self._pending),
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "flushed_rows": self.flushed_rows,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "dropped": self.dropped,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+        }
+
+
+async def flush_all_write_behind():
+    """Flushes every buffer (call on shutdown)."""
+    for buffer in WRITE_BEHIND_BUFFERS.values():
+        written = await buffer.flush()
+        if buffer._worker and not buffer._worker.done():
+            buffer._worker.cancel()
+        if written:
+            pretty_log(
+                "db",
+                f"{buffer.name}: flushed {written} rows on shutdown",
+                label=WRITE_BEHIND_LABEL,
+            )
+
+
+def fetch_write_behind_stats() -> list[dict]:
+    return [buffer.stats() for buffer in WRITE_BEHIND_BUFFERS.values()]
@@ -0,0 +1,151 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+# 🟣────────────────────────────────────────────
+#        🔎 Prebuilt Autocomplete Index
+# 🟣────────────────────────────────────────────
+# Built once from a fixed list of (text, payload) pairs, then every keystroke
+# is answered from the index instead of scanning the whole list:
+#   1. prefix of the whole name, then prefix of any later word
+#      (shallow prefixes come from a precomputed table, deeper ones from a
+#      bisect into the sorted word suffixes)
+#   2. substring, narrowed down with the trigram index
+#   3. typo tolerant trigram similarity, only if still short of `limit`
+# Payloads (e.g. ready-made app_commands.Choice objects) are returned as is,
+# so nothing is formatted per keystroke.
+
+MAX_RESULTS = 25  # Discord's autocomplete limit
+SHALLOW_PREFIX_LEN = 3
+FUZZY_THRESHOLD = 0.5  # share of the query's trigrams that must match
+
+_STRIP = re.compile(r"[\W_]+")
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase with spaces/punctuation removed: "Mega-Charizard X" -> "megacharizardx"."""
+    return _STRIP.sub("", (text or "").lower())
+
+
+def _word_starts(text: str) -> list[int]:
+    """Offsets in the normalized text where each word of text begins."""
+    starts, offset = [], 0
+    for word in _STRIP.split(text.lower()):
+        if word:
+            starts.append(offset)
+            offset += len(word)
+    return starts
+
+
+def _trigrams(key: str, words: Iterable[str] = ()) -> set[str]:
+    """Padded trigrams of the key and of each of its words."""
+    grams = set()
+    for part in (key, *words):
+        padded = f"  {part} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class AutocompleteIndex(Generic[T]):
+    def __init__(self, entries: Iterable[tuple[str, T]]):
+        self._payloads: list[T] = []
+        self._keys: list[str] = []
+        # (suffix, rank, entry id): rank 0 = whole name, 1 = later word
+        suffixes: list[tuple[str, int, int]] = []
+        self._postings: dict[str, set[int]] = {}
+
+        for text, payload in entries:
+            key = normalize_query(text)
+            if not key:
+                continue
+            entry_id = len(self._keys)
+            self._payloads.append(payload)
+            self._keys.append(key)
+            starts = _word_starts(text)
+            for start in starts:
+                suffixes.append((key[start:], 0 if start == 0 else 1, entry_id))
+            words = [key[a:b] for a, b in zip(starts, starts[1:] + [len(key)])]
+            for gram in _trigrams(key, words if len(words) > 1 else ()):
+                self._postings.setdefault(gram, set()).add(entry_id)
+
+        suffixes.sort()
+        self._suffixes = suffixes
+        self._suffix_keys = [suffix for suffix, _, _ in suffixes]
+
+        # Ranked top hits for every short prefix, so 1-3 letter queries
+        # (the ones matching hundreds of names) never walk the suffix list
+        shallow: dict[str, dict[int, tuple]] = {}
+        for suffix, rank, entry_id in suffixes:
+            sort_key = (rank, len(self._keys[entry_id]), entry_id)
+            for n in range(1, min(len(suffix), SHALLOW_PREFIX_LEN) + 1):
+                best = shallow.setdefault(suffix[:n], {})
+                if sort_key < best.get(entry_id, (2,)):
+                    best[entry_id] = sort_key
+        self._shallow = {
+            prefix: tuple(
+                entry_id for *_, entry_id in sorted(hits.values())[:MAX_RESULTS]
+            )
+            for prefix, hits in shallow.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # 🔤 Tier 1: whole-name prefix, then word prefix
+    def _prefix_ids(self, query: str, limit: int) -> list[int]:
+        if len(query) <= SHALLOW_PREFIX_LEN and limit <= MAX_RESULTS:
+            return list(self._shallow.get(query, ())[:limit])
+
+        best: dict[int, tuple] = {}
+        i = bisect_left(self._suffix_keys, query)
+        while i < len(self._suffixes):
+            suffix, rank, entry_id = self._suffixes[i]
+            if not suffix.startswith(query):
+                break
+            sort_key = (rank, len(self._keys[entry_id]), entry_id)
+            if sort_key < best.get(entry_id, (2,)):
+                best[entry_id] = sort_key
+            i += 1
+        return [entry_id for *_, entry_id in sorted(best.values())[:limit]]
+
+    # 🧩 Tier 2: substring anywhere in the name
+    def _substring_ids(self, query: str) -> list[int]:
+        if len(query) < 3:
+            return [i for i, key in enumerate(self._keys) if query in key]
+        postings = sorted(
+            (self._postings.get(query[i : i + 3], set()) for i in range(len(query) - 2)),
+            key=len,
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return sorted(i for i in candidates if query in self._keys[i])
+
+    # 🩹 Tier 3: typos, by the share of the query's trigrams an entry has
+    def _fuzzy_ids(self, query: str) -> list[int]:
+        grams = _trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        min_shared = FUZZY_THRESHOLD * len(grams)
+        scored = sorted(
+            (-common, len(self._keys[entry_id]), entry_id)
+            for entry_id, common in shared.items()
+            if common >= min_shared
+        )
+        return [entry_id for *_, entry_id in scored]
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[T]:
+        """Best `limit` payloads for the typed text, best match first."""
+        query = normalize_query(query)
+        if not query:
+            return self._payloads[:limit]
+
+        ids = self._prefix_ids(query, limit)
+        for tier in (self._substring_ids, self._fuzzy_ids):
+            if len(ids) >= limit or (tier is self._fuzzy_ids and len(query) < 3):
+                break
+            seen = set(ids)
+            ids.extend(i for i in tier(query) if i not in seen)
+        return [self._payloads[i] for i in ids[:limit]]
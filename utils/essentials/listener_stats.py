@@ -0,0 +1,137 @@
+import functools
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, TypeVar
+
+from utils.db.query_stats import LatencyStats
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        ⏱ Listener Hot-Path Stats
+# 🟣────────────────────────────────────────────
+# Every message listener in utils/listener_func is wrapped with
+# @instrument_listener. Calls and errors are always counted (two int adds);
+# latency is only timed for one in every SAMPLE_EVERY calls, and not at all
+# when sampling is off (0), so the wrapper costs next to nothing on spikes.
+#
+# Stats live in this process (one dict), are shown by /listener-stats and
+# dumped to the console every DUMP_INTERVAL_SECONDS by the central loop.
+
+DUMP_INTERVAL_SECONDS = 15 * 60
+DUMP_TOP = 10
+LISTENER_STATS_LABEL = "⏱ LISTENER STATS"
+
+F = TypeVar("F", bound=Callable[..., Awaitable])
+
+
+@dataclass
+class HandlerStats:
+    calls: int = 0
+    errors: int = 0
+    last_error: str | None = None
+    # Sampled calls only
+    latency: LatencyStats = field(default_factory=LatencyStats)
+
+    @property
+    def est_total_ms(self) -> float:
+        """Sampled average scaled up to every call."""
+        return self.latency.avg_ms * self.calls
+
+
+# handler name -> stats
+listener_stats: dict[str, HandlerStats] = {}
+stats_since = time.time()
+_sampling = {"every": int(os.getenv("LISTENER_SAMPLE_EVERY", "1"))}
+_last_dump = {"at": time.monotonic(), "calls": 0}
+
+
+def set_listener_sampling(every: int):
+    """Time one in every `every` calls; 0 turns latency sampling off."""
+    _sampling["every"] = max(every, 0)
+
+
+def listener_sample_every() -> int:
+    return _sampling["every"]
+
+
+def instrument_listener(func: F) -> F:
+    """Counts calls / errors of an async listener and samples its latency."""
+    name = func.__name__
+    if name in listener_stats:
+        name = f"{func.__module__.rsplit('.', 1)[-1]}.{name}"
+    stats = listener_stats[name] = HandlerStats()
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        stats.calls += 1
+        every = _sampling["every"]
+        if not every or stats.calls % every:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                stats.errors += 1
+                stats.last_error = repr(e)
+                raise
+
+        start = time.perf_counter()
+        error = False
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            error = True
+            stats.errors += 1
+            stats.last_error = repr(e)
+            raise
+        finally:
+            stats.latency.record((time.perf_counter() - start) * 1000, error=error)
+
+    return wrapper
+
+
+def reset_listener_stats():
+    global stats_since
+    for stats in listener_stats.values():
+        stats.__init__()
+    _last_dump["calls"] = 0
+    stats_since = time.time()
+
+
+def sorted_listener_stats(sort: str = "total") -> list[tuple[str, HandlerStats]]:
+    """Handlers that ran at least once, slowest (by sort) first."""
+    keys = {
+        "total": lambda item: item[1].est_total_ms,
+        "p95": lambda item: item[1].latency.percentile_ms(95),
+        "calls": lambda item: item[1].calls,
+        "errors": lambda item: item[1].errors,
+    }
+    rows = [item for item in listener_stats.items() if item[1].calls]
+    rows.sort(key=keys[sort], reverse=True)
+    return rows
+
+
+# 🟣────────────────────────────────────────────
+#        📜 Periodic Dump (central loop)
+# 🟣────────────────────────────────────────────
+async def dump_listener_stats(bot=None):
+    """Logs the top handlers every DUMP_INTERVAL_SECONDS if anything ran."""
+    now = time.monotonic()
+    if now - _last_dump["at"] < DUMP_INTERVAL_SECONDS:
+        return
+    total_calls = sum(stats.calls for stats in listener_stats.values())
+    if total_calls == _last_dump["calls"]:
+        return
+    _last_dump["at"] = now
+    _last_dump["calls"] = total_calls
+
+    for name, stats in sorted_listener_stats()[:DUMP_TOP]:
+        pretty_log(
+            "info",
+            name,
+            label=LISTENER_STATS_LABEL,
+            calls=stats.calls,
+            errors=stats.errors,
+            avg_ms=round(stats.latency.avg_ms, 2),
+            p95_ms=stats.latency.percentile_ms(95),
+            max_ms=round(stats.latency.max_ms, 1),
+        )
@@ -8,6 +8,7 @@ from zoneinfo import ZoneInfo
 
 from utils.db.timezone_db import is_valid_timezone
 
+from Constants.pokedex_index import POKEDEX
 from Constants.vn_allstars_constants import VN_ALLSTARS_EMOJIS
 from Constants.weakness_chart import weakness_chart
 from utils.logs.debug_log import debug_log, enable_debug
@@ -41,27 +42,13 @@ def resolve_pokemon_input(pokemon_input: str):
     # ── Numeric Dex input ──
     if pokemon_input.isdigit():
         dex_int = int(pokemon_input)
+        prefix, base_dex = POKEDEX.split_dex_input(pokemon_input)
 
-        first_digit = pokemon_input[0]
-        prefix = ""
-        if first_digit == "9" and len(pokemon_input) > 3:
-            base_dex = int(pokemon_input[1:])
-            prefix = "Golden "
-        elif first_digit == "1" and len(pokemon_input) > 3:
-            base_dex = int(pokemon_input[1:])
-            prefix = "Shiny "
-        else:
-            base_dex = int(pokemon_input)
-
-        # Lookup in weakness chart
-        for name, data in weakness_chart.items():
-            chart_dex = int(str(data.get("dex")).lstrip("0"))
-            if chart_dex == base_dex:
-                display_name = prefix + format_mega_pokemon_name(name)
-
-                return display_name, dex_int
-
-        raise ValueError(f"No Pokemon found with Dex #{dex_int}")
+        name = POKEDEX.chart_name_by_dex.get(base_dex)
+        if name is None:
+            raise ValueError(f"No Pokemon found with Dex #{dex_int}")
+        display_name = prefix + format_mega_pokemon_name(name)
+        return display_name, dex_int
 
     # ── Name input ──
     else:
@@ -75,27 +62,15 @@ def resolve_pokemon_input(pokemon_input: str):
         else:
             base_name = normalize_mega_input(pokemon_input)
 
-        chart_data = weakness_chart.get(base_name)
-        if not chart_data or "dex" not in chart_data:
+        chart_dex_int = POKEDEX.chart_dex_by_name.get(base_name)
+        if chart_dex_int is None:
 
             raise ValueError(f"No Pokemon found with name {base_name}")
 
         display_name = prefix + format_mega_pokemon_name(base_name)
 
-        #
         # Calculate Dex with offsets, but skip for 7xxx forms
-        chart_dex_int = int(chart_data["dex"])
-        if chart_dex_int >= 7000:
-            dex_number = chart_dex_int  # already a form, skip Shiny/Golden offsets
-
-        else:
-            if prefix == "Shiny ":
-                dex_number = chart_dex_int + 1000
-            elif prefix == "Golden ":
-                dex_number = chart_dex_int + 9000
-            else:
-                dex_number = chart_dex_int
-
+        dex_number = POKEDEX.apply_prefix_offset(chart_dex_int, prefix)
         return display_name, dex_number
 
 
@@ -1,10 +1,9 @@
-import re
-
 import discord
-from Constants.weakness_chart import weakness_chart as WEAKNESS_CHART
+from Constants.pokedex_index import POKEDEX
 from discord import app_commands
 
 from utils.db.market_alert_db import fetch_market_alerts_for_user
+from utils.essentials.autocomplete_index import MAX_RESULTS, AutocompleteIndex
 from utils.logs.pretty_log import pretty_log
 
 
@@ -17,43 +16,11 @@ def format_price(n: int) -> str:
     return str(n)
 
 
-# ==================== 🗂 Build Weakness Indexes ==================== #
-def build_weakness_indexes(weakness_chart: dict):
-    dex_to_key = {}
-    key_normalized = {}
-    for key, data in weakness_chart.items():
-        dex_raw = data.get("dex")
-        try:
-            dex_int = int(dex_raw) if dex_raw is not None else None
-        except Exception:
-            dex_int = None
-
-        if dex_int is not None:
-            dex_to_key[dex_int] = key
-
-        norm = key.lower().replace("-", " ").replace("_", " ").strip()
-        key_normalized[norm] = key
-        simple = re.sub(r"[^\w\s]", "", norm)
-        key_normalized[simple] = key
-
-    return dex_to_key, key_normalized
-
-
-DEX_TO_KEY, KEY_NORMALIZED = build_weakness_indexes(WEAKNESS_CHART)
-
 # Pre-build clean list
 POKEMON_LIST: list[tuple[str, int]] = [
-    (key.title(), int(data.get("dex", 0)))
-    for key, data in WEAKNESS_CHART.items()
-    if data.get("dex") is not None
+    (key.title(), dex) for key, dex in POKEDEX.chart_dex_by_name.items()
 ]
 
-# ==================== 🐉 Unified Mega/Golden/Shiny Formatter ==================== #
-POKEMON_NORMALIZED: list[tuple[str, str, int]] = []
-for name, dex in POKEMON_LIST:
-    norm = re.sub(r"[^\w\s]", "", name.lower()).replace(" ", "")
-    POKEMON_NORMALIZED.append((name, norm, dex))
-
 
 def old_format_display_name(raw_name: str) -> str:
     """
@@ -131,63 +98,82 @@ def format_display_name(raw_name: str) -> str:
     return display_name
 
 
+# ==================== 🗂 Prebuilt Pokemon Choices ==================== #
+# One ready-made Choice per chart entry ("Display Name #Dex"), indexed once
+POKEMON_CHOICES: dict[str, app_commands.Choice[str]] = {}
+_seen_displays = set()
+for name, dex in POKEMON_LIST:
+    display = f"{format_display_name(name)} #{dex}"
+    if display not in _seen_displays:
+        POKEMON_CHOICES[name] = app_commands.Choice(name=display, value=name)
+        _seen_displays.add(display)
+del _seen_displays
+
+POKEMON_INDEX = AutocompleteIndex(
+    (name, choice) for name, choice in POKEMON_CHOICES.items()
+)
+
+
 # ==================== 🔍 Pokemon Autocomplete ==================== #
 async def pokemon_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
     """
     Autocomplete Pokemon names with #Dex display.
-    Matches both names and dex numbers.
+    Matches both names and dex numbers; prefix matches rank first
+    and small typos still find the Pokemon.
     """
-    current_simple = re.sub(r"[^\w\s]", "", (current or "").lower()).replace(" ", "")
+    current = (current or "").strip()
     results: list[app_commands.Choice[str]] = []
-    seen = set()
-
-    # Check if input looks numeric (dex search)
-    dex_query = None
-    if current_simple.isdigit():
-        try:
-            dex_query = int(current_simple)
-        except ValueError:
-            dex_query = None
-
-    for name, norm, dex in POKEMON_NORMALIZED:
-        # Match by name
-        if not current_simple or current_simple in norm:
-            display_name = format_display_name(name)
-            display = f"{display_name} #{dex}"
-            if display not in seen:
-                results.append(app_commands.Choice(name=display, value=name))
-                seen.add(display)
-
-        # Match by dex number
-        if dex_query is not None and dex_query == dex:
-            display_name = format_display_name(name)
-            display = f"{display_name} #{dex}"
-            if display not in seen:
-                results.append(app_commands.Choice(name=display, value=name))
-                seen.add(display)
-
-        if len(results) >= 25:
+
+    # Exact dex number matches come first (O(1) via the Pokédex index)
+    if current.isdigit():
+        for key in POKEDEX.chart_names_by_dex.get(int(current), ())[:MAX_RESULTS]:
+            choice = POKEMON_CHOICES.get(key.title())
+            if choice and choice not in results:
+                results.append(choice)
+
+    for choice in POKEMON_INDEX.search(current):
+        if len(results) >= MAX_RESULTS:
             break
+        if choice not in results:
+            results.append(choice)
 
     if not results:
-        results.append(
-            app_commands.Choice(name="No matches found", value=current or "")
-        )
+        results.append(app_commands.Choice(name="No matches found", value=current))
 
     return results
 
 
 # ==================== 🔔 User Alert Autocomplete ==================== #
+# user_id -> (alerts the index was built from, index); rebuilt only when
+# that user's alerts change
+_user_alert_indexes: dict[int, tuple[tuple, AutocompleteIndex]] = {}
+
+
+def _user_alert_index(user_id: int, rows: list[dict]) -> AutocompleteIndex:
+    signature = tuple((row["pokemon"], row.get("dex")) for row in rows)
+    cached = _user_alert_indexes.get(user_id)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    entries = []
+    for raw_name, dex in dict.fromkeys(signature):
+        display = f"{format_display_name(raw_name)} #{dex}"
+        entries.append((display, app_commands.Choice(name=display, value=raw_name)))
+    index = AutocompleteIndex(entries)
+    _user_alert_indexes[user_id] = (signature, index)
+    return index
+
+
 async def user_alerts_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
     """
     Autocomplete for the user's own market alerts from cache.
-    Choice.name = "Name #Dex — price"
+    Choice.name = "Name #Dex"
     Choice.value = "Name" only
-    Matches both names and dex numbers.
+    Matches both names and dex numbers, ranked like pokemon_autocomplete.
     """
     from utils.cache.market_alert_cache import fetch_user_alerts_from_cache
 
@@ -197,37 +183,10 @@ async def user_alerts_autocomplete(
     except Exception:
         rows = []
 
-    current = (current or "").lower().strip()
-    results: list[app_commands.Choice[str]] = []
-
-    # Check if input is numeric
-    dex_query = None
-    if current.isdigit():
-        try:
-            dex_query = int(current)
-        except ValueError:
-            dex_query = None
-
-    for row in rows:
-        raw_name = row["pokemon"]
-        name = format_display_name(raw_name)
-        dex = row.get("dex")
-        max_price = row.get("max_price", 0)
-
-        display = f"{name} #{dex}"
-
-        if (
-            not current
-            or current in name.lower()
-            or (dex is not None and current in str(dex))
-            or (dex_query is not None and dex_query == dex)
-        ):
-            results.append(app_commands.Choice(name=display, value=raw_name))
-
-        if len(results) >= 25:
-            break
-
+    results = _user_alert_index(user_id, rows).search(current or "")
     if not results:
-        results.append(app_commands.Choice(name="No matches found", value=current))
+        results.append(
+            app_commands.Choice(name="No matches found", value=(current or "").strip())
+        )
 
     return results
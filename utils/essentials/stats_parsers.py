@@ -1,10 +1,16 @@
-import re
-import time
 from typing import Dict, List, Optional, Tuple
 
 import discord
 
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import (
+    ClanMemberStats,
+    RankedClanMemberStats,
+    clean_clan_username,
+    parse_clan_stats,
+    parse_clan_stats_ranked,
+    trim_clan_stats_header,
+)
 
 
 async def fetch_message_obj_from_link(
@@ -99,28 +105,7 @@ def trim_header(message: str) -> str:
     Removes header lines like timestamps, totals, and "You're Rank" before the first actual member line.
     Returns the trimmed message starting from the first detected user entry line.
     """
-    lines = message.splitlines()
-    start_idx = 0
-
-    for i, line in enumerate(lines):
-        line = line.strip()
-        # Detect rank line e.g. **1** username
-        if re.match(r"\*\*\d+\*\*\s+.+", line):
-            start_idx = i
-            break
-        # Or detect a non-empty line not starting with known emojis or rank header
-        if (
-            line
-            and not line.startswith(":dexcaught:")
-            and not line.startswith("<:dexcaught:")
-            and "You're Rank" not in line
-            and not line.startswith(":calendar:")
-            and not line.startswith(":bar_chart:")
-        ):
-            start_idx = i
-            break  # <-- Added break here to stop after first valid line found
-
-    return "\n".join(lines[start_idx:])
+    return "\n".join(trim_clan_stats_header(message))
 
 
 def should_parse(embed_title: Optional[str]) -> bool:
@@ -138,52 +123,11 @@ def should_parse(embed_title: Optional[str]) -> bool:
 
 def clean_username(username: str) -> str:
     # Strip any leading/trailing ** from username cleanly
-    return re.sub(r"^\*+|\*+$", "", username).strip()
+    return clean_clan_username(username)
 
 
-def parse_clan_stats_message(message: str) -> Optional[List[Tuple[str, int, int]]]:
-    message = trim_header(message)
-    lines = message.splitlines()
-
-    members = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Make detection smarter: skip any line containing "You're Rank"
-        if "You're Rank" in line:
-            i += 1
-            continue
-
-        rank_match = re.match(r"\*\*(\d+)\*\*\s+(.+)", line)
-        if rank_match:
-            rank_number = int(rank_match.group(1))
-            username = clean_username(rank_match.group(2))
-            # You can now use rank_number as needed, e.g. store it with the member tuple
-            i += 1
-        elif not line.startswith(":dexcaught:") and not line.startswith("<:dexcaught:"):
-            username = clean_username(line)
-            i += 1
-        else:
-            i += 1
-            continue
-
-        if i < len(lines):
-            stats_line = lines[i].strip()
-
-            catch_match = re.search(
-                r"(?:<:dexcaught:\d+>|:dexcaught:)\s*([\d,]+)", stats_line
-            )
-            fish_match = re.search(r"(?:<:oldrod:\d+>|:oldrod:)\s*([\d,]+)", stats_line)
-
-            catches = int(catch_match.group(1).replace(",", "")) if catch_match else 0
-            fishes = int(fish_match.group(1).replace(",", "")) if fish_match else 0
-
-            members.append((username, catches, fishes))
-
-        i += 1
-    return members
+def parse_clan_stats_message(message: str) -> Optional[List[ClanMemberStats]]:
+    return parse_clan_stats(message)
 
 
 def print_clean_stats(members: List[Tuple[str, int, int]]) -> None:
@@ -213,50 +157,8 @@ def print_clean_stats(members: List[Tuple[str, int, int]]) -> None:
 
 def parse_clan_stats_message_with_rank_number(
     message: str,
-) -> Optional[List[Tuple[int, str, int, int]]]:
-    message = trim_header(message)
-    lines = message.splitlines()
-
-    members = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Make detection smarter: skip any line containing "You're Rank"
-        if "You're Rank" in line:
-            i += 1
-            continue
-
-        rank_match = re.match(r"\*\*(\d+)\*\*\s+(.+)", line)
-        if rank_match:
-            rank_number = int(rank_match.group(1))
-            username = clean_username(rank_match.group(2))
-            # You can now use rank_number as needed, e.g. store it with the member tuple
-            i += 1
-        elif not line.startswith(":dexcaught:") and not line.startswith("<:dexcaught:"):
-            username = clean_username(line)
-            i += 1
-        else:
-            i += 1
-            continue
-
-        if i < len(lines):
-            stats_line = lines[i].strip()
-
-            catch_match = re.search(
-                r"(?:<:dexcaught:\d+>|:dexcaught:)\s*([\d,]+)", stats_line
-            )
-            fish_match = re.search(r"(?:<:oldrod:\d+>|:oldrod:)\s*([\d,]+)", stats_line)
-
-            catches = int(catch_match.group(1).replace(",", "")) if catch_match else 0
-            fishes = int(fish_match.group(1).replace(",", "")) if fish_match else 0
-
-            members.append((rank_number, username, catches, fishes))
-
-        i += 1
-
-    return members
+) -> Optional[List[RankedClanMemberStats]]:
+    return parse_clan_stats_ranked(message)
 
 
 async def split_known_and_unknown_members(
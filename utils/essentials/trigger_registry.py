@@ -0,0 +1,290 @@
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        ⚔️ Message Fields a Trigger Can Scan
+# 🟣────────────────────────────────────────────
+FIELDS = ("content", "description", "title", "author", "footer")
+
+TriggerHandler = Callable[[discord.Client, discord.Message], Awaitable[None]]
+
+
+def extract_message_fields(message: discord.Message) -> dict[str, str]:
+    """
+    Pulls every scannable text field out of a message exactly once.
+    Missing fields come back as empty strings.
+    """
+    first_embed = message.embeds[0] if message.embeds else None
+    if not first_embed:
+        return {
+            "content": message.content or "",
+            "description": "",
+            "title": "",
+            "author": "",
+            "footer": "",
+        }
+    return {
+        "content": message.content or "",
+        "description": first_embed.description or "",
+        "title": first_embed.title or "",
+        "author": (first_embed.author.name or "") if first_embed.author else "",
+        "footer": (first_embed.footer.text or "") if first_embed.footer else "",
+    }
+
+
+# 🟣────────────────────────────────────────────
+#              ⚡ Trigger Definition ⚡
+# 🟣────────────────────────────────────────────
+@dataclass
+class Trigger:
+    """
+    One message trigger.
+    - field/needles: which text to scan and the phrases to look for.
+      No field means the trigger matches every message in its scope.
+    - require_all: all needles must appear (otherwise any one is enough).
+    - guild_id/channel_id: scope, None means any.
+    - any_author: also fire for messages from non-PokéMeow bots.
+    """
+
+    name: str
+    handler: TriggerHandler
+    field: str | None = None
+    needles: tuple[str, ...] = ()
+    require_all: bool = True
+    ignore_case: bool = False
+    guild_id: int | None = None
+    channel_id: int | None = None
+    any_author: bool = False
+    log: str | None = None
+    label: str | None = None
+    order: int = 0
+
+
+# 🟣────────────────────────────────────────────
+#        ⚡ Compiled Per-Scope Field Scanner ⚡
+# 🟣────────────────────────────────────────────
+class _FieldScanner:
+    """
+    Finds every registered needle that occurs in a text with one regex pass.
+    Needles are joined into a single lookahead alternation (longest first), so
+    overlapping needles are all reported. A needle that is a prefix of a longer
+    one starting at the same position is recovered through prefix_closure.
+    """
+
+    def __init__(self, needles: list[str]):
+        self.needles = needles
+        ordered = sorted(set(needles), key=len, reverse=True)
+        self.pattern = re.compile(
+            "(?=(" + "|".join(re.escape(n) for n in ordered) + "))"
+        )
+        self.needle_index = {n: i for i, n in enumerate(needles)}
+        self.prefix_closure: dict[str, tuple[int, ...]] = {
+            n: tuple(
+                self.needle_index[p] for p in needles if n.startswith(p)
+            )
+            for n in needles
+        }
+
+    def scan(self, text: str) -> set[int]:
+        found: set[int] = set()
+        seen: set[str] = set()
+        for match in self.pattern.finditer(text):
+            hit = match.group(1)
+            if hit in seen:
+                continue
+            seen.add(hit)
+            found.update(self.prefix_closure[hit])
+        return found
+
+
+class _CompiledScope:
+    """All triggers sharing one (guild_id, channel_id) key."""
+
+    def __init__(self, triggers: list[Trigger]):
+        self.always: list[Trigger] = []
+        # id(trigger) -> needle ids it requires within its field scanner
+        self.needle_ids: dict[int, tuple[int, ...]] = {}
+        # (field, ignore_case) -> (scanner, {needle_id: [trigger, ...]})
+        self.scanners: dict[
+            tuple[str, bool], tuple[_FieldScanner, dict[int, list[Trigger]]]
+        ] = {}
+
+        grouped: dict[tuple[str, bool], list[Trigger]] = {}
+        for trigger in triggers:
+            if not trigger.field or not trigger.needles:
+                self.always.append(trigger)
+                continue
+            grouped.setdefault((trigger.field, trigger.ignore_case), []).append(
+                trigger
+            )
+
+        for key, group in grouped.items():
+            needles: list[str] = []
+            for trigger in group:
+                for needle in trigger.needles:
+                    if needle not in needles:
+                        needles.append(needle)
+            scanner = _FieldScanner(needles)
+            by_needle: dict[int, list[Trigger]] = {}
+            for trigger in group:
+                needle_ids = tuple(scanner.needle_index[n] for n in trigger.needles)
+                self.needle_ids[id(trigger)] = needle_ids
+                for needle_id in set(needle_ids):
+                    by_needle.setdefault(needle_id, []).append(trigger)
+            self.scanners[key] = (scanner, by_needle)
+
+    def match(self, fields: dict[str, str], lowered: dict[str, str]) -> list[Trigger]:
+        matched: list[Trigger] = list(self.always)
+        for (field_name, ignore_case), (scanner, by_needle) in self.scanners.items():
+            if ignore_case:
+                text = lowered.get(field_name)
+                if text is None:
+                    text = lowered[field_name] = fields[field_name].lower()
+            else:
+                text = fields[field_name]
+            if not text:
+                continue
+
+            found = scanner.scan(text)
+            if not found:
+                continue
+
+            candidates: dict[int, Trigger] = {}
+            for needle_id in found:
+                for trigger in by_needle.get(needle_id, ()):
+                    candidates[id(trigger)] = trigger
+            for trigger in candidates.values():
+                if trigger.require_all:
+                    if all(n in found for n in self.needle_ids[id(trigger)]):
+                        matched.append(trigger)
+                else:
+                    matched.append(trigger)
+        return matched
+
+
+# 🟣────────────────────────────────────────────
+#             ⚡ Trigger Registry ⚡
+# 🟣────────────────────────────────────────────
+class TriggerRegistry:
+    """
+    Table-driven message router.
+    Triggers are grouped by (guild_id, channel_id) and compiled into one
+    scanner per field, so each message costs one regex pass per field in
+    scope no matter how many listeners are registered.
+    Matched handlers run in registration order.
+    """
+
+    def __init__(self):
+        self._triggers: list[Trigger] = []
+        self._scopes: dict[tuple[int | None, int | None], _CompiledScope] | None = (
+            None
+        )
+        # Same table restricted to any_author triggers, used for other bots' messages
+        self._untrusted_scopes: dict[
+            tuple[int | None, int | None], _CompiledScope
+        ] = {}
+
+    def register(
+        self,
+        name: str,
+        handler: TriggerHandler,
+        *,
+        field: str | None = None,
+        needles: str | tuple[str, ...] = (),
+        require_all: bool = True,
+        ignore_case: bool = False,
+        guild_id: int | None = None,
+        channel_id: int | None = None,
+        any_author: bool = False,
+        log: str | None = None,
+        label: str | None = None,
+    ):
+        """Adds a trigger. Registering after the first dispatch recompiles the table."""
+        if field is not None and field not in FIELDS:
+            raise ValueError(f"Unknown trigger field '{field}' for trigger '{name}'")
+        if isinstance(needles, str):
+            needles = (needles,)
+        if ignore_case:
+            needles = tuple(n.lower() for n in needles)
+
+        self._triggers.append(
+            Trigger(
+                name=name,
+                handler=handler,
+                field=field,
+                needles=tuple(needles),
+                require_all=require_all,
+                ignore_case=ignore_case,
+                guild_id=guild_id,
+                channel_id=channel_id,
+                any_author=any_author,
+                log=log,
+                label=label,
+                order=len(self._triggers),
+            )
+        )
+        self._scopes = None
+
+    def compile(self):
+        """Builds the per-scope scanners."""
+        grouped: dict[tuple[int | None, int | None], list[Trigger]] = {}
+        untrusted: dict[tuple[int | None, int | None], list[Trigger]] = {}
+        for trigger in self._triggers:
+            key = (trigger.guild_id, trigger.channel_id)
+            grouped.setdefault(key, []).append(trigger)
+            if trigger.any_author:
+                untrusted.setdefault(key, []).append(trigger)
+        self._scopes = {key: _CompiledScope(group) for key, group in grouped.items()}
+        self._untrusted_scopes = {
+            key: _CompiledScope(group) for key, group in untrusted.items()
+        }
+        pretty_log(
+            "ready",
+            f"Compiled {len(self._triggers)} message triggers across {len(self._scopes)} scopes",
+            label="TRIGGER REGISTRY",
+        )
+
+    def match(
+        self, message: discord.Message, *, trusted_author: bool = True
+    ) -> list[Trigger]:
+        """Returns the triggers that fire for this message, in registration order."""
+        if self._scopes is None:
+            self.compile()
+        table = self._scopes if trusted_author else self._untrusted_scopes
+
+        guild_id = message.guild.id if message.guild else None
+        channel_id = message.channel.id
+        keys = {(None, None), (guild_id, None), (guild_id, channel_id), (None, channel_id)}
+
+        fields = extract_message_fields(message)
+        lowered: dict[str, str] = {}
+        matched: list[Trigger] = []
+        for key in keys:
+            scope = table.get(key)
+            if scope:
+                matched.extend(scope.match(fields, lowered))
+
+        matched.sort(key=lambda t: t.order)
+        return matched
+
+    async def dispatch(
+        self,
+        bot: discord.Client,
+        message: discord.Message,
+        *,
+        trusted_author: bool = True,
+    ):
+        """Runs every matching handler for the message."""
+        for trigger in self.match(message, trusted_author=trusted_author):
+            if trigger.log:
+                pretty_log(
+                    "info",
+                    f"{trigger.log}: Message ID {message.id}",
+                    label=trigger.label,
+                )
+            await trigger.handler(bot, message)
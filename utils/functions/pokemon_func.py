@@ -1,4 +1,5 @@
-from Constants.paldea_galar_dict import dex, rarity_meta
+from Constants.paldea_galar_dict import rarity_meta
+from Constants.pokedex_index import POKEDEX
 from Constants.pokemons import *
 from Constants.vn_allstars_constants import VN_ALLSTARS_EMOJIS
 from utils.db.market_value_db import (
@@ -17,9 +18,9 @@ def get_dex_number_by_name(name: str) -> int | None:
     Returns None if not found.
     """
 
-    for num, poke_name in dex.items():
-        if poke_name == name:
-            return num
+    dex_number = POKEDEX.dex_by_name.get(name)
+    if dex_number is not None:
+        return dex_number
 
     # Fallback: try formatted name
     formatted_name = format_names_for_market_value_lookup(name)
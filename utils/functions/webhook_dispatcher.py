@@ -0,0 +1,239 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# 🟣────────────────────────────────────────────
+#        📮 Webhook Dispatcher (pooled + batched)
+# 🟣────────────────────────────────────────────
+# One queue + worker per (bot_id, channel_id). Embed sends that pile up
+# while a webhook is busy or rate limited are merged into a single execute
+# call (Discord allows up to 10 embeds / 6000 embed chars), as long as they
+# carry the same content (or none), so a ping always sits with its own embeds.
+# Everything else goes out one by one. Callers still await their own send
+# and get its error, if any.
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+MAX_RATE_LIMIT_RETRIES = 5
+MAX_BACKOFF_SECONDS = 30
+WORKER_IDLE_SECONDS = 300
+QUEUE_DEPTH_WARN = 25
+
+WEBHOOK_LABEL = "🌐 WEBHOOK SEND"
+
+# Global 429s pause every channel until this monotonic timestamp
+_global_backoff_until = 0.0
+
+
+@dataclass
+class _PendingSend:
+    content: str | None
+    embed: discord.Embed | None
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class _ChannelDispatcher:
+    """Queue, worker and counters for one webhook."""
+
+    def __init__(self, bot: discord.Client, key: tuple[int, int], url: str):
+        self.bot = bot
+        self.key = key
+        self.url = url
+        self.webhook = discord.Webhook.from_url(url, client=bot)
+        self.queue: asyncio.Queue[_PendingSend] = asyncio.Queue()
+        # A send taken off the queue that didn't fit the previous batch
+        self._carry: _PendingSend | None = None
+        self._worker: asyncio.Task | None = None
+        self._backoff_until = 0.0
+
+        # 📊 Counters
+        self.sent_messages = 0
+        self.sent_items = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.max_depth = 0
+
+    def set_url(self, url: str):
+        if url != self.url:
+            self.url = url
+            self.webhook = discord.Webhook.from_url(url, client=self.bot)
+
+    def submit(self, content: str | None, embed: discord.Embed | None) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait(_PendingSend(content, embed, future))
+
+        depth = self.depth()
+        if depth > self.max_depth:
+            self.max_depth = depth
+            if depth % QUEUE_DEPTH_WARN == 0:
+                pretty_log(
+                    "warn",
+                    f"Webhook queue for channel {self.key[1]} is {depth} deep",
+                    label=WEBHOOK_LABEL,
+                    include_trace=False,
+                )
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return future
+
+    def depth(self) -> int:
+        return self.queue.qsize() + (1 if self._carry else 0)
+
+    # 🧺 Take the next send plus whatever else fits in the same message
+    def _next_batch(self, first: _PendingSend) -> list[_PendingSend]:
+        batch = [first]
+        if not first.embed:
+            return batch
+        embeds = 1
+        embed_chars = len(first.embed)
+
+        while not self.queue.empty():
+            nxt = self.queue.get_nowait()
+            if (
+                not nxt.embed
+                or (nxt.content or None) != (first.content or None)
+                or embeds + 1 > MAX_EMBEDS_PER_MESSAGE
+                or embed_chars + len(nxt.embed) > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                # Goes first in the next batch
+                self._carry = nxt
+                break
+            batch.append(nxt)
+            embeds += 1
+            embed_chars += len(nxt.embed)
+        return batch
+
+    async def _wait_for_backoff(self):
+        while True:
+            delay = max(self._backoff_until, _global_backoff_until) - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _on_rate_limited(self, e: discord.HTTPException, attempt: int):
+        global _global_backoff_until
+        self.rate_limited += 1
+        headers = getattr(e.response, "headers", None) or {}
+        try:
+            retry_after = float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = 2**attempt
+        retry_after = min(retry_after, MAX_BACKOFF_SECONDS)
+
+        until = time.monotonic() + retry_after
+        if headers.get("X-RateLimit-Global"):
+            _global_backoff_until = max(_global_backoff_until, until)
+        self._backoff_until = max(self._backoff_until, until)
+        pretty_log(
+            "warn",
+            f"Webhook for channel {self.key[1]} rate limited, retrying in {retry_after:.1f}s",
+            label=WEBHOOK_LABEL,
+            include_trace=False,
+        )
+
+    async def _send(self, batch: list[_PendingSend]):
+        # Every send in a batch has the same content
+        embeds = [p.embed for p in batch if p.embed]
+        kwargs = {"wait": True}
+        if batch[0].content:
+            kwargs["content"] = batch[0].content
+        if embeds:
+            kwargs["embeds"] = embeds
+
+        attempt = 0
+        while True:
+            await self._wait_for_backoff()
+            try:
+                return await self.webhook.send(**kwargs)
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt >= MAX_RATE_LIMIT_RETRIES:
+                    raise
+                attempt += 1
+                self._on_rate_limited(e, attempt)
+
+    async def _run(self):
+        while True:
+            first, self._carry = self._carry, None
+            if first is None:
+                try:
+                    first = await asyncio.wait_for(
+                        self.queue.get(), WORKER_IDLE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    # Idle, let the task end; submit() starts a new one on demand
+                    self._worker = None
+                    return
+
+            batch = self._next_batch(first)
+            try:
+                message = await self._send(batch)
+            except asyncio.CancelledError:
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.cancel()
+                raise
+            except Exception as e:
+                self.failures += 1
+                if isinstance(e, discord.NotFound):
+                    # Webhook was deleted, don't keep reusing the dead object
+                    _dispatchers.pop(self.key, None)
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                continue
+
+            self.sent_messages += 1
+            self.sent_items += len(batch)
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_result(message)
+
+    def stats(self) -> dict:
+        return {
+            "bot_id": self.key[0],
+            "channel_id": self.key[1],
+            "queue_depth": self.depth(),
+            "max_depth": self.max_depth,
+            "sent_messages": self.sent_messages,
+            "sent_items": self.sent_items,
+            "rate_limited": self.rate_limited,
+            "failures": self.failures,
+        }
+
+
+_dispatchers: dict[tuple[int, int], _ChannelDispatcher] = {}
+
+
+async def dispatch_webhook(
+    bot: discord.Client,
+    key: tuple[int, int],
+    url: str,
+    content: str = None,
+    embed: discord.Embed = None,
+) -> discord.WebhookMessage:
+    """
+    Queues a webhook send for (bot_id, channel_id) and waits until it has been
+    delivered, possibly merged with other pending sends for the same channel.
+    """
+    dispatcher = _dispatchers.get(key)
+    if dispatcher is None:
+        dispatcher = _dispatchers[key] = _ChannelDispatcher(bot, key, url)
+    else:
+        dispatcher.set_url(url)
+    return await dispatcher.submit(content, embed)
+
+
+def fetch_webhook_dispatch_stats() -> list[dict]:
+    """Per-channel queue depth and send counters, deepest queue first (/webhook-stats)."""
+    return sorted(
+        (d.stats() for d in _dispatchers.values()),
+        key=lambda s: s["queue_depth"],
+        reverse=True,
+    )
@@ -1,11 +1,16 @@
+import asyncio
 from datetime import datetime
 
 import discord
 
 from utils.cache.cache_list import webhook_url_cache
 from utils.db.webhook_db_url import upsert_webhook_url
+from utils.functions.webhook_dispatcher import dispatch_webhook
 from utils.logs.pretty_log import pretty_log
 
+# (bot_id, channel_id) -> lock held while that channel's webhook is created
+_webhook_create_locks: dict[tuple[int, int], asyncio.Lock] = {}
+
 
 async def create_webhook_func(
     bot, channel: discord.TextChannel, name: str
@@ -41,28 +46,32 @@ async def send_webhook(
     webhook_url_row = webhook_url_cache.get(key)
     # Handle legacy cache value (string) and correct dict structure
     if webhook_url_row is None:
-        channel_name = channel.name
-        if "log" in channel_name.lower():
-            webhook_name = "Arceus Logs 📜"
-        else:
-            webhook_name = "Arceus"
-        webhook_url = await create_webhook_func(bot, channel, webhook_name)
-        if not webhook_url:
-            pretty_log(
-                tag="info",
-                message=f"⚠️ Falling back to direct channel send for channel '{channel.name}' (ID: {channel.id}) due to webhook creation failure",
-                label="🌐 WEBHOOK SEND",
-            )
-            await channel.send(content=content, embed=embed)
-            return
-        # Update cache for immediate use
-        webhook_url_cache[key] = {
-            "channel_name": channel_name,
-            "url": webhook_url,
-        }
-        webhook_url_row = webhook_url_cache[key]
+        # Concurrent first sends to a channel wait for one webhook creation
+        async with _webhook_create_locks.setdefault(key, asyncio.Lock()):
+            webhook_url_row = webhook_url_cache.get(key)
+            if webhook_url_row is None:
+                channel_name = channel.name
+                if "log" in channel_name.lower():
+                    webhook_name = "Arceus Logs 📜"
+                else:
+                    webhook_name = "Arceus"
+                webhook_url = await create_webhook_func(bot, channel, webhook_name)
+                if not webhook_url:
+                    pretty_log(
+                        tag="info",
+                        message=f"⚠️ Falling back to direct channel send for channel '{channel.name}' (ID: {channel.id}) due to webhook creation failure",
+                        label="🌐 WEBHOOK SEND",
+                    )
+                    await channel.send(content=content, embed=embed)
+                    return
+                # Update cache for immediate use
+                webhook_url_cache[key] = {
+                    "channel_name": channel_name,
+                    "url": webhook_url,
+                }
+                webhook_url_row = webhook_url_cache[key]
     # If cache value is a string (legacy), convert to dict
-    elif isinstance(webhook_url_row, str):
+    if isinstance(webhook_url_row, str):
         webhook_url_cache[key] = {
             "channel_name": channel.name,
             "url": webhook_url_row,
@@ -71,5 +80,5 @@ async def send_webhook(
 
     webhook_url = webhook_url_row["url"]
     if webhook_url:
-        webhook = discord.Webhook.from_url(webhook_url, client=bot)
-        await webhook.send(content=content, embed=embed, wait=True)
+        # Pooled webhook + per-channel queue, bursts get batched into one send
+        await dispatch_webhook(bot, key, webhook_url, content=content, embed=embed)
@@ -1,5 +1,4 @@
 import asyncio
-import re
 from datetime import datetime
 
 import discord
@@ -8,8 +7,11 @@ from discord.ext import commands
 from Constants.timer_settings import *
 from Constants.vn_allstars_constants import ARCEUS_EMBED_COLOR
 from utils.cache.cache_list import timer_cache
+from utils.cache.member_name_cache import find_member_by_name
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import extract_enemy_id, parse_battle_challenge
 
 # enable_debug(f"{__name__}.detect_pokemeow_battle")
 # enable_debug(f"{__name__}.grab_enemy_id")
@@ -27,6 +29,7 @@ def find_key_by_npc_id(npc_id: int):
 # 💜────────────────────────────────────────────
 #   Function: detect_pokemeow_battle (with debug)
 # 💜────────────────────────────────────────────
+@instrument_listener
 async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
     try:
         debug_log("Entered detect_pokemeow_battle()", disabled=True)
@@ -48,27 +51,19 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
         debug_log(f"Embed description: {description}")
 
         # Format: "**Alice** challenged **Bob** to a battle!"
-        match = re.search(
-            r"(?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\* challenged (?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\*",
-            description,
-        )
-        if not match:
+        challenge = parse_battle_challenge(description)
+        if not challenge:
             debug_log("Regex failed: no challenger/opponent match")
             return
 
-        challenger_name = match.group(1).strip()
-        opponent_name = match.group(2).strip()
+        challenger_name, opponent_name = challenge
         debug_log(
             f"Challenger: {challenger_name}, Opponent: {opponent_name}", disabled=True
         )
 
         # ✅ Match challenger in guild
         guild = message.guild
-        challenger = discord.utils.find(
-            lambda m: m.name.lower() == challenger_name.lower()
-            or m.display_name.lower() == challenger_name.lower(),
-            guild.members,
-        )
+        challenger = find_member_by_name(guild, challenger_name)
         if not challenger:
             debug_log("Challenger not found in guild members")
             return
@@ -128,9 +123,9 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
                 footer_text = emb.footer.text if emb.footer else ""
                 debug_log(f"Follow-up footer text: {footer_text}")
 
-                enemy_match = re.search(r"Enemy ID:\s*(\d+)", footer_text)
-                if enemy_match:
-                    enemy_id_holder["id"] = enemy_match.group(1)
+                enemy_id = extract_enemy_id(footer_text)
+                if enemy_id:
+                    enemy_id_holder["id"] = enemy_id
                     debug_log(
                         f"Enemy ID captured: {enemy_id_holder['id']} 🎯",
                         highlight=True,
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from Constants.vn_allstars_constants import VN_ALLSTARS_TEXT_CHANNELS
@@ -16,51 +14,20 @@ from utils.db.watering_can_db import (
     update_already_asked,
     upsert_watering_can,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import (
+    parse_berry_slots,
+    parse_mulch_application,
+    parse_watering_action,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 # enable_debug(f"{__name__}.berry_listener")
 
 
-def extract_mulch_application(line: str):
-    """
-    Extracts the mulch emoji name, mulch label, and slot number from a mulch application line.
-    Example: "### <:damp_mulch:1486261015657185281> Applied **Damp Mulch** to Slot 1 (<:sprouted:1486510462416851014> Aspear Tree)!"
-    Returns a dict with keys: mulch_name, mulch_label, slot_number
-    """
-    pattern = re.compile(
-        r"<:(\w+):\d+>\s+Applied\s+\*\*(.+?)\*\*\s+to Slot (\d+)", re.IGNORECASE
-    )
-    match = pattern.search(line)
-    if match:
-        return {
-            "mulch_name": match.group(1),
-            "mulch_label": match.group(2),
-            "slot_number": int(match.group(3)),
-        }
-    return None
-
-
-def extract_watering_action(line: str):
-    """
-    Extracts the watering can emoji name, berry name, and slot number from a watering action line.
-    Example: "<:wailmer_pail:1486261601622425680> Watered **Aspear Berry** in Slot 3!"
-    Returns a dict with keys: water_can_emoji, berry_name, slot_number
-    """
-    pattern = re.compile(
-        r"<:(\w+):\d+>\s+Watered\s+\*\*(.+?)\*\*\s+in Slot (\d+)!", re.IGNORECASE
-    )
-    match = pattern.search(line)
-    if match:
-        return {
-            "water_can_emoji": match.group(1),
-            "berry_name": match.group(2),
-            "slot_number": int(match.group(3)),
-        }
-    return None
-
-
+@instrument_listener
 async def berry_listener(
     bot: discord.Client, before_message: discord.Message, message: discord.Message
 ):
@@ -120,7 +87,7 @@ async def berry_listener(
     debug_log(
         f"Extracting berry reminder details from embed description: {embed_description}"
     )
-    berry_slots = extract_berry_slots(embed_description)
+    berry_slots = parse_berry_slots(embed_description)
     pretty_log(
         "debug",
         f"Extracted berry slots from embed description: {berry_slots}",
@@ -130,14 +97,14 @@ async def berry_listener(
         return
 
     for slot in berry_slots:
-        slot_number = slot["slot_number"]
-        berry_name = slot["berry_name"]
-        berry_status = slot["status"]
-        growth_stage = slot["growth_stage"]
-        next_stage_time = slot["next_stage_time"]
-        has_growth_paused = slot["has_growth_paused"]
-        mulch_name = slot["mulch_name"]
-        has_ready_to_harvest = slot.get("has_ready_to_harvest", False)
+        slot_number = slot.slot_number
+        berry_name = slot.berry_name
+        berry_status = slot.status
+        growth_stage = slot.growth_stage
+        next_stage_time = slot.next_stage_time
+        has_growth_paused = slot.has_growth_paused
+        mulch_name = slot.mulch_name
+        has_ready_to_harvest = slot.has_ready_to_harvest
 
         # Upsert the berry reminder in the database
         if not are_new_reminders:
@@ -202,7 +169,7 @@ async def berry_listener(
         "watered" in embed_description.lower()
         and "in slot" in embed_description.lower()
     ):
-        watering_action = extract_watering_action(embed_description)
+        watering_action = parse_watering_action(embed_description)
         if watering_action:
             debug_log(
                 f"Extracted watering action from embed description: {watering_action}"
@@ -210,8 +177,8 @@ async def berry_listener(
             await update_moisture_dries_on_func(
                 bot,
                 user_id,
-                watering_action["slot_number"],
-                watering_action["berry_name"],
+                watering_action.slot_number,
+                watering_action.berry_name,
             )
         else:
             debug_log("Failed to extract watering action from embed description.")
@@ -231,7 +198,7 @@ async def berry_listener(
             )
 
     if "applied **damp mulch** to slot" in embed_description.lower():
-        mulch_application = extract_mulch_application(embed_description)
+        mulch_application = parse_mulch_application(embed_description)
         if mulch_application:
             debug_log(
                 f"Extracted mulch application from embed description: {mulch_application}"
@@ -240,95 +207,9 @@ async def berry_listener(
             await update_moisture_dries_on(
                 bot=bot,
                 user_id=user_id,
-                slot_number=mulch_application["slot_number"],
+                slot_number=mulch_application.slot_number,
                 moisture_dries_on=None,
             )
         else:
             debug_log("Failed to extract mulch application from embed description.")
 
-
-def extract_berry_slots(embed_description: str):
-    """
-    Extracts slot_number, berry_name, mulch_name, status, growth_stage, next_stage_time, and has_growth_paused
-    for each berry slot from the embed description.
-    Skips slots that are empty or locked (padlock emoji).
-    """
-    import re
-
-    slot_pattern = re.compile(r"\*\*Slot (\d+)\*\* — (.+?)(?:\n|$)")
-    next_stage_pattern = re.compile(r"Next stage <t:(\d+):R>")
-    berry_name_pattern = re.compile(r"— <:\w+:\d+> ([A-Za-z ]+?)(?:\s*<|\s*•|$)")
-    mulch_pattern = re.compile(r"<:(\w+_mulch):\d+>")
-    status_pattern = re.compile(r"• 💧 \*\*(.*?)\*\*")
-
-    # Growth stage regex: matches emoji, stage name, and [STAGE x/y] with optional backticks
-    growth_stage_pattern = re.compile(
-        r"<:[^:]+:\d+>\s*([^`\[]+?)\s*`?\[STAGE \d+/\d+\]`?", re.IGNORECASE
-    )
-    growth_paused_pattern = re.compile(r"growth paused", re.IGNORECASE)
-    ready_to_harvest_pattern = re.compile(r"ready to harvest", re.IGNORECASE)
-    has_ready_to_harvest = False
-    results = []
-    lines = embed_description.splitlines()
-    for i, line in enumerate(lines):
-        slot_match = slot_pattern.search(line)
-        if slot_match:
-            slot_number = int(slot_match.group(1))
-            slot_content = slot_match.group(2).strip()
-
-            # Skip empty or locked slots
-            normalized = slot_content.lower()
-            if (
-                "empty" in normalized
-                or "slot locked" in normalized
-                or "🔒" in slot_content
-            ):
-                continue
-
-            # Berry name
-            berry_name_match = berry_name_pattern.search(line)
-            berry_name = berry_name_match.group(1).strip() if berry_name_match else None
-
-            # Mulch name
-            mulch_name = None
-            mulch_match = mulch_pattern.search(line)
-            if mulch_match:
-                mulch_name = mulch_match.group(1).replace("_", " ").title()
-
-            # Next stage time
-            next_stage_time = None
-            for j in range(i, min(i + 2, len(lines))):
-                next_stage_match = next_stage_pattern.search(lines[j])
-                if next_stage_match:
-                    next_stage_time = int(next_stage_match.group(1))
-                    break
-
-            # Status, growth stage, growth paused
-            status = None
-            growth_stage = None
-            has_growth_paused = False
-            for j in range(i, min(i + 3, len(lines))):
-                status_match = status_pattern.search(lines[j])
-                if status_match:
-                    status = status_match.group(1).strip()
-                growth_stage_match = growth_stage_pattern.search(lines[j])
-                if growth_stage_match:
-                    growth_stage = growth_stage_match.group(1).strip()
-                if growth_paused_pattern.search(lines[j]):
-                    has_growth_paused = True
-                if ready_to_harvest_pattern.search(lines[j]):
-                    has_ready_to_harvest = True
-
-            results.append(
-                {
-                    "slot_number": slot_number,
-                    "berry_name": berry_name,
-                    "mulch_name": mulch_name,
-                    "status": status,
-                    "growth_stage": growth_stage,
-                    "next_stage_time": next_stage_time,
-                    "has_growth_paused": has_growth_paused,
-                    "has_ready_to_harvest": has_ready_to_harvest,
-                }
-            )
-    return results
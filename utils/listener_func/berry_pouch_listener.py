@@ -9,6 +9,7 @@ from utils.db.berry_reminder import (
     update_water_can_type_for_slot,
 )
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.db.watering_can_db import upsert_watering_can, get_watering_can
@@ -59,6 +60,7 @@ def extract_best_watering_tool_from_embed(embed) -> str:
         return None
 
 
+@instrument_listener
 async def handle_berry_pouch_message(bot: discord.Client, before: discord.Message, message: discord.Message):
     embed = message.embeds[0] if message.embeds else None
     if not embed:
@@ -13,6 +13,7 @@ from utils.db.berry_reminder import (
     update_water_can_type_for_slot,
     upsert_berry_reminder,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
@@ -69,6 +70,7 @@ def parse_berry_water_message(message: str):
     return {"watering_can_emoji": watering_can_emoji, "berries": results}
 
 
+@instrument_listener
 async def handle_berry_water_message(bot: discord.Client, message: discord.Message):
 
     debug_log(f"Handling berry water message: {message.content}")
@@ -198,6 +200,7 @@ async def handle_berry_water_message(bot: discord.Client, message: discord.Messa
             debug_log(f"Failed to add reaction to message ID {replied_message.id}: {e}")
 
 
+@instrument_listener
 async def handle_mulch_message(bot, message):
     debug_log(f"Handling mulch message: {message.content}")
     member = await get_pokemeow_reply_member(message)
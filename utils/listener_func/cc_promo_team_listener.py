@@ -4,12 +4,14 @@ from Constants.vn_allstars_constants import VN_ALLSTARS_ROLES, VN_ALLSTARS_TEXT_
 from utils.AR.promo import build_promo_embed
 from utils.db.promo_team import delete_promo_team, get_promo_mon, upsert_promo_team
 from utils.functions.pokemon_func import get_display_name
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 
 enable_debug(f"{__name__}.promo_team_listener")
 
 
+@instrument_listener
 async def promo_team_listener(bot: discord.Client, message: discord.Message):
     debug_log(f"Received message in promo_team_listener: {message.id}")
     embed = message.embeds[0] if message.embeds else None
@@ -1,6 +1,5 @@
 import json
 import os
-import re
 import time
 
 import discord
@@ -15,8 +14,17 @@ from Constants.vn_allstars_constants import (
     VN_ALLSTARS_TEXT_CHANNELS,
     VNA_SERVER_ID,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import (
+    WB_BATTLE_BEGINS_RE,
+    WB_CHALLENGE_STARTS_RE,
+    WB_SPAWNED_BY_RE,
+    parse_eternatus_votes,
+    parse_wb_boss_variant,
+    strip_emojis,
+)
 
 Reg_EE = "https://play.pokemonshowdown.com/sprites/xyani/eternatus-eternamax.gif"
 Shiny_EE = "https://play.pokemonshowdown.com/sprites/ani-shiny/eternatus-eternamax.gif"
@@ -43,14 +51,14 @@ def extract_battle_begins_time_from_wb_command(description: str):
     Extracts the 'Battle begins in' time from the embed description.
     Returns the time string if found, else None.
     """
-    match = re.search(r"The battle begins <t:(\d+):R>", description)
+    match = WB_BATTLE_BEGINS_RE.search(description)
     if match:
         return match.group(1).strip()
     return None
 
 
 def extract_timestamp_from_wb_spawn_command(description: str):
-    match = re.search(r"Challenge starts <t:(\d+):R>", description)
+    match = WB_CHALLENGE_STARTS_RE.search(description)
     if match:
         return match.group(1).strip()
     return None
@@ -95,6 +103,7 @@ def save_vote_cache():
         )
 
 
+@instrument_listener
 async def check_cc_bump_reminder(bot: commands.Bot, message: discord.Message):
     debug_log(
         f"Called for message.id: {getattr(message, 'id', None)} | bot: {getattr(bot, 'user', None)}"
@@ -216,6 +225,7 @@ async def send_cc_bump_reminder(
 
 
 # -------------------- EE Near Spawn Checker --------------------
+@instrument_listener
 async def check_ee_near_spawn_alert(bot: commands.Bot, message: discord.Message):
     """
     Checks WB embeds for Eternamax-Eternatus vote counts.
@@ -233,26 +243,17 @@ async def check_ee_near_spawn_alert(bot: commands.Bot, message: discord.Message)
                 )
                 continue
 
-            # Remove all custom emojis & trim whitespace
-            clean_desc = re.sub(r"<:[\w\d]+:\d+>", "", description).strip()
-
-            # Match Eternamax-Eternatus spawn line
-            vote_match = re.search(
-                r"Eternamax-Eternatus\s+spawn:\s*([\d,]+)\s*/\s*([\d,]+)",
-                clean_desc,
-                re.IGNORECASE,
-            )
-            if not vote_match:
+            # Match Eternamax-Eternatus spawn line (custom emojis removed)
+            votes = parse_eternatus_votes(strip_emojis(description))
+            if not votes:
                 pretty_log(
                     "info",
                     f"Skipping embed {message.id}: no Eternamax-Eternatus spawn line found",
                 )
                 continue
 
-            current_votes, total_votes = vote_match.groups()
-            current_votes = int(current_votes.replace(",", ""))
-            total_votes = int(total_votes.replace(",", ""))
-            votes_left = total_votes - current_votes
+            current_votes, total_votes = votes
+            votes_left = votes.votes_left
 
             boss_key = "eternamax-eternatus"
 
@@ -318,6 +319,7 @@ async def check_ee_near_spawn_alert(bot: commands.Bot, message: discord.Message)
 guild_cooldowns: dict[int, float] = {}  # {guild_id: last_post_time}
 
 
+@instrument_listener
 async def extract_boss_from_wb_spawn_command(
     bot: commands.Bot, message: discord.Message
 ):
@@ -335,18 +337,10 @@ async def extract_boss_from_wb_spawn_command(
             if not description:
                 continue
 
-            # --- Remove emojis for clean parsing ---
-            clean_desc = re.sub(r"<:[\w\d]+:\d+>", "", description)
-
-            # --- Extract boss name & variant ---
-            boss_match = re.search(
-                r"(Shiny\s+)?(?:Gigantamax|Eternamax)-([\w-]+)",
-                clean_desc,
-                re.IGNORECASE,
-            )
-            if boss_match:
-                shiny_prefix, boss_name = boss_match.groups()
-                variant = "shiny" if shiny_prefix else "regular"
+            # --- Extract boss name & variant (emojis removed) ---
+            boss = parse_wb_boss_variant(strip_emojis(description))
+            if boss:
+                boss_name, variant = boss
             else:
                 return  # Exit if not eternatus spawn
 
@@ -354,11 +348,11 @@ async def extract_boss_from_wb_spawn_command(
             battle_begins_time = extract_timestamp_from_wb_spawn_command(description)
 
             # --- Extract spawned by user ---
-            spawn_match = re.search(r"Spawned by:\s*(.+)", description)
+            spawn_match = WB_SPAWNED_BY_RE.search(description)
             if spawn_match:
                 spawned_by_raw = spawn_match.group(1).strip()
                 # Remove any emojis if included
-                spawned_by_raw = re.sub(r"<:[\w\d]+:\d+>", "", spawned_by_raw).strip()
+                spawned_by_raw = strip_emojis(spawned_by_raw).strip()
                 # Take only the username part before the # if present
                 spawned_by_name = spawned_by_raw.split("#")[0].strip()
                 spawned_by_member = message.guild.get_member_named(spawned_by_name)
@@ -389,6 +383,7 @@ async def extract_boss_from_wb_spawn_command(
     """
 
 
+@instrument_listener
 async def extract_boss_from_wb_command_embed(
     bot: commands.Bot, message: discord.Message
 ):
@@ -402,22 +397,14 @@ async def extract_boss_from_wb_command_embed(
             if not description:
                 continue
 
-            # Remove all custom emojis for clean parsing
-            clean_desc = re.sub(r"<:[\w\d]+:\d+>", "", description)
-
-            # --- Extract boss name & variant ---
-            boss_match = re.search(
-                r"(Shiny\s+)?(?:Gigantamax|Eternamax)-([\w-]+)",
-                clean_desc,
-                re.IGNORECASE,
-            )
+            # --- Extract boss name & variant (emojis removed) ---
+            boss = parse_wb_boss_variant(strip_emojis(description))
 
             # Extract battle begins time
             battle_begins_time = extract_battle_begins_time_from_wb_command(description)
 
-            if boss_match:
-                shiny_prefix, boss_name = boss_match.groups()
-                variant = "shiny" if shiny_prefix else "regular"
+            if boss:
+                boss_name, variant = boss
 
                 # Trigger auto ping only for etrnamax-eternatus
                 if boss_name.lower() == "eternatus":
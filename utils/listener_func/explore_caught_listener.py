@@ -11,20 +11,21 @@ from Constants.vn_allstars_constants import (
 from utils.cache.cache_list import processed_explore_messages, vna_members_cache
 from utils.db.monthly_goal_tracker import upsert_monthly_goal
 from utils.db.weekly_goal_tracker import upsert_weekly_goal
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 from .pokemon_caught_listener import goal_checker
 
 
+@instrument_listener
 async def explore_caught_listener(
     bot: discord.Client, before_message: discord.Message, after_message: discord.Message
 ):
     """Listener function to track processed explore messages."""
 
-    if after_message.id in processed_explore_messages:
+    if processed_explore_messages.check_and_add(after_message.id):
         return
-    processed_explore_messages.add(after_message.id)
 
     # Get member info
     member: discord.Member = await get_pokemeow_reply_member(before_message)
@@ -6,6 +6,7 @@ from Constants.faction_data import FACTION_LOGO_EMOJIS, get_faction_by_emoji
 from utils.cache.cache_list import daily_faction_ball_cache, faction_members_cache
 from utils.db.daily_faction_ball import update_faction_ball
 from utils.db.faction_members import update_faction_member_faction
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 from Constants.vn_allstars_constants import VN_ALLSTARS_ROLES
@@ -13,6 +14,7 @@ from Constants.vn_allstars_constants import VN_ALLSTARS_ROLES
 # 🛡️────────────────────────────────────────────
 #      🛡️ Extract Faction Ball from Faction Command
 # 🛡️────────────────────────────────────────────
+@instrument_listener
 async def extract_faction_ball_from_fa(bot, message: discord.Message):
     # Extract faction from author line (e.g. "Team Magma — Headquarters")
     embed = message.embeds[0] if message.embeds else None
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from Constants.aesthetic import Emojis_Balls, Emojis_Factions
@@ -13,12 +11,13 @@ from utils.cache.cache_list import (
 from utils.db.daily_faction_ball import update_faction_ball
 from utils.db.faction_members import update_faction_member_faction
 from utils.listener_func.pokemon_spawn_listener import (
-    extract_trainer_name_from_description,
     faction_ball_alert,
     get_faction_member_via_trainer_name,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import extract_trainer_name_from_description
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 FISHING_COLOR = 0x87CEFA
@@ -27,6 +26,7 @@ from utils.logs.debug_log import debug_log, enable_debug
 # enable_debug(f"{__name__}.fish_spawn_listener")
 
 
+@instrument_listener
 async def fish_spawn_listener(
     bot, before_message: discord.Message, after_message: discord.Message
 ):
@@ -46,10 +46,9 @@ async def fish_spawn_listener(
         debug_log(" 'fished a wild' not in embed description, exiting.")
         return
 
-    if after_message.id in processed_fish_spawn_message_ids:
+    if processed_fish_spawn_message_ids.check_and_add(after_message.id):
         debug_log(f" Message ID {after_message.id} already processed, exiting.")
         return
-    processed_fish_spawn_message_ids.add(after_message.id)
 
     guild = after_message.guild
     debug_log(f" Guild: {guild}")
@@ -1,12 +1,14 @@
 import asyncio
-import re
 from datetime import datetime
 
 import discord
 
 from Constants.timer_settings import *
 from utils.cache.cache_list import timer_cache  # 💜 import your cache
+from utils.cache.member_name_cache import find_member_by_name
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import extract_fishing_trainer_name
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 
@@ -14,21 +16,11 @@ from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 fish_ready_tasks = {}
 
 
-def extract_fishing_trainer_name(description: str) -> str | None:
-    """
-    Extracts the trainer name (e.g. 'khy.09') from a PokéMeow fishing embed description.
-    Example: '<:irida:...> **khy.09** cast a ...'
-    """
-    match = re.search(r"\*\*(.+?)\*\* cast a", description)
-    if match:
-        return match.group(1).strip()
-    return None
-
-
 # 💜────────────────────────────────────────────
 #   Function: detect_pokemeow_reply
 #   Handles Pokemon timer notifications per user settings
 # 💜────────────────────────────────────────────
+@instrument_listener
 async def fish_timer_handler(message: discord.Message):
     """
     Triggered on any message.
@@ -51,14 +43,16 @@ async def fish_timer_handler(message: discord.Message):
             user_name = extract_fishing_trainer_name(embed_description)
             if not user_name:
                 return
-            from utils.cache.timers_cache import fetch_id_by_user_name
-
-            user_id = fetch_id_by_user_name(user_name)
-            if not user_id:
-                return
-            member = guild.get_member(user_id)
+            member = find_member_by_name(guild, user_name)
             if not member:
-                return
+                from utils.cache.timers_cache import fetch_id_by_user_name
+
+                user_id = fetch_id_by_user_name(user_name)
+                if not user_id:
+                    return
+                member = guild.get_member(user_id)
+                if not member:
+                    return
 
         # -------------------------------
         # 💜 Check timer_cache settings
@@ -15,6 +15,7 @@ from utils.db.ping_message_ids_db import (
     get_ping_message_id,
     upsert_ping_message_id,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
@@ -101,6 +102,7 @@ def build_incense_embed(
     return embed
 
 
+@instrument_listener
 async def incense_use_handler(
     bot: discord.Client,
     message: discord.Message,
@@ -155,6 +157,7 @@ async def incense_use_handler(
     )
 
 
+@instrument_listener
 async def server_has_incense_handler(
     bot: discord.Client,
     message: discord.Message,
@@ -212,6 +215,7 @@ async def server_has_incense_handler(
     )
 
 
+@instrument_listener
 async def incense_command_handler(
     bot: discord.Client,
     message: discord.Message,
@@ -344,6 +348,7 @@ async def incense_command_handler(
         )
 
 
+@instrument_listener
 async def incense_depleted_handler(
     bot: discord.Client,
     message: discord.Message,
@@ -1,5 +1,6 @@
 import asyncio
-import re
+from functools import partial
+from typing import Awaitable, Callable
 
 import discord
 
@@ -12,14 +13,21 @@ from Constants.paldea_galar_dict import (
     rarity_meta,
 )
 from utils.cache.cache_list import (
-    _market_alert_index,
     market_alert_cache,
     processed_market_feed_ids,
     processed_market_feed_message_ids,
 )
+from utils.cache.market_alert_cache import fetch_matching_market_alerts
+from utils.cache.market_price_stats_cache import (
+    record_market_price,
+    snipe_reference_price,
+)
+from utils.db.market_value_db import update_market_value_via_listener
 from utils.functions.webhook_func import send_webhook
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import MarketListing, parse_market_listing
 from Constants.vn_allstars_constants import (
     VN_ALLSTARS_EMOJIS,
     VN_ALLSTARS_ROLES,
@@ -53,6 +61,11 @@ SNIPE_MAP = {
 }
 
 SNIPE_CHANNEL_ID = VN_ALLSTARS_TEXT_CHANNELS.snipe_channel
+SNIPE_PRICE_RATIO = 0.7  # 30% or more below the reference price
+
+# Snipe / alert sends in flight at once, across all feed messages
+MARKET_NOTIFY_CONCURRENCY = 8
+_market_notify_slots = asyncio.BoundedSemaphore(MARKET_NOTIFY_CONCURRENCY)
 
 
 # 🟣────────────────────────────────────────────
@@ -60,21 +73,19 @@ SNIPE_CHANNEL_ID = VN_ALLSTARS_TEXT_CHANNELS.snipe_channel
 # 🟣────────────────────────────────────────────
 async def market_snipe_handler(
     bot: discord.Client,
-    poke_name: str,
-    listed_price: int,
-    id: str,
-    lowest_market: int,
-    amount: int,
-    listing_seen: str,
+    listing: MarketListing,
     guild: discord.Guild,
     embed: discord.Embed,
 ):
+    poke_name = listing.poke_name
+    listed_price = listing.listed_price
+    id = listing.listing_id
     debug_log(f"Handling market snipe for {poke_name} with ID {id}")
     embed_color = embed.color.value
     debug_log(f"Embed color: {embed_color}")
     rarity = get_rarity_by_color(embed_color)
     debug_log(f"Initial rarity: {rarity}")
-    display_pokemon_name = poke_name.title()
+    display_pokemon_name = listing.display_name
 
     if rarity == "unknown":
         debug_log(f"Rarity unknown, checking name and author for special cases.")
@@ -143,16 +154,16 @@ async def market_snipe_handler(
             value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,}",
             inline=True,
         )
-        new_embed.add_field(name="Amount", value=str(amount), inline=True)
+        new_embed.add_field(name="Amount", value=str(listing.amount), inline=True)
         new_embed.add_field(
             name="Lowest Market",
-            value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {lowest_market:,}",
+            value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listing.lowest_market:,}",
             inline=True,
         )
 
         new_embed.add_field(
             name="Listing Seen",
-            value=listing_seen,
+            value=listing.listing_seen,
             inline=True,
         )
 
@@ -165,16 +176,12 @@ async def market_snipe_handler(
         )
         # await snipe_channel.send(content=content, embed=new_embed)
         debug_log(f"Sending webhook for snipe notification.")
-        try:
-            await send_webhook(
-                bot=bot,
-                channel=snipe_channel,
-                content=content,
-                embed=new_embed,
-            )
-        except Exception as e:
-            debug_log(f"Exception in send_webhook for snipe: {e}", highlight=True)
-            return
+        await send_webhook(
+            bot=bot,
+            channel=snipe_channel,
+            content=content,
+            embed=new_embed,
+        )
 
         pretty_log(
             "sent",
@@ -189,16 +196,14 @@ async def handle_market_alert(
     bot: discord.Client,
     user_name: str,
     guild: discord.Guild,
-    original_id: str,
-    poke_name: str,
-    listed_price: int,
+    listing: MarketListing,
     channel_id: int,
     role_id: int,
-    amount: int,
-    lowest_market: int,
-    listing_seen: str,
     embed: discord.Embed,
 ):
+    original_id = listing.listing_id
+    listed_price = listing.listed_price
+    display_pokemon_name = listing.display_name
 
     alert_channel = guild.get_channel(channel_id)
     if not alert_channel:
@@ -226,15 +231,15 @@ async def handle_market_alert(
         value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,}",
         inline=True,
     )
-    alert_embed.add_field(name="Amount", value=amount, inline=True)
+    alert_embed.add_field(name="Amount", value=str(listing.amount), inline=True)
     alert_embed.add_field(
         name="Lowest Market",
-        value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {lowest_market:,}",
+        value=f"{VN_ALLSTARS_EMOJIS.vna_pokecoin} {listing.lowest_market:,}",
         inline=True,
     )
     alert_embed.add_field(
         name="Listing Seen",
-        value=listing_seen,
+        value=listing.listing_seen,
         inline=True,
     )
     alert_embed.set_footer(
@@ -242,9 +247,9 @@ async def handle_market_alert(
         icon_url=guild.icon.url if guild else None,
     )
     if role_id:
-        content = f"<@&{role_id}> {poke_name.title()} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,} each!"
+        content = f"<@&{role_id}> {display_pokemon_name} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,} each!"
     else:
-        content = f"{poke_name.title()} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,} each!"
+        content = f"{display_pokemon_name} listed for {VN_ALLSTARS_EMOJIS.vna_pokecoin} {listed_price:,} each!"
     # await alert_channel.send(content=content, embed=alert_embed)
     await send_webhook(
         bot=bot,
@@ -255,16 +260,62 @@ async def handle_market_alert(
 
     pretty_log(
         "sent",
-        f"Market alert sent in channel {alert_channel.name} for {user_name} {poke_name.title()} at {listed_price:,}",
+        f"Market alert sent in channel {alert_channel.name} for {user_name} {display_pokemon_name} at {listed_price:,}",
+    )
+
+
+# 🟣────────────────────────────────────────────
+#        📣 Notification Fan-out
+# 🟣────────────────────────────────────────────
+async def _run_market_notification(
+    label: str, send: Callable[[], Awaitable]
+) -> Exception | None:
+    async with _market_notify_slots:
+        try:
+            await send()
+            return None
+        except Exception as e:
+            debug_log(f"Exception in {label}: {e}", highlight=True)
+            return e
+
+
+async def fan_out_market_notifications(
+    notifications: list[tuple[str, Callable[[], Awaitable]]],
+) -> int:
+    """
+    Runs the snipe / alert sends of one feed message concurrently, at most
+    MARKET_NOTIFY_CONCURRENCY at a time. A failing send only affects itself.
+    Returns how many failed.
+    """
+    if not notifications:
+        return 0
+    errors = await asyncio.gather(
+        *(_run_market_notification(label, send) for label, send in notifications)
     )
+    failed = [
+        f"{label} ({error!r})"
+        for (label, _), error in zip(notifications, errors)
+        if error is not None
+    ]
+    if failed:
+        pretty_log(
+            "warn",
+            f"{len(failed)}/{len(notifications)} market notifications failed: "
+            + ", ".join(failed[:5]),
+        )
+    return len(failed)
 
 
 # 🟣────────────────────────────────────────────
 #           👂 Market Feeds Listener
 # 🟣────────────────────────────────────────────
+@instrument_listener
 async def market_feeds_listener(bot: discord.Client, message: discord.Message):
     """
     Listens for market listings and detects potential snipes.
+    Every listing is parsed and recorded (price history and market_value)
+    first; the snipe and alert sends they trigger then go out together
+    (see fan_out_market_notifications).
     """
     debug_log(
         f"Received message with ID: {message.id} from webhook: {message.webhook_id}"
@@ -277,129 +328,122 @@ async def market_feeds_listener(bot: discord.Client, message: discord.Message):
         debug_log("Message has no embeds")
         return
 
-    if message.id in processed_market_feed_message_ids:
+    if processed_market_feed_message_ids.check_and_add(message.id):
         debug_log(f"Message ID {message.id} already processed")
         return
-    processed_market_feed_message_ids.add(message.id)
 
+    notifications: list[tuple[str, Callable[[], Awaitable]]] = []
     for embed in message.embeds:
         try:
             embed_author_name = embed.author.name if embed.author else ""
             debug_log(f"Processing embed with author: {embed_author_name}")
 
-            match = re.match(r"(.+?)\s+#(\d+)", embed_author_name)
-            if not match:
+            listing = parse_market_listing(
+                embed_author_name, ((f.name, f.value) for f in embed.fields)
+            )
+            if not listing:
                 debug_log(f"Could not parse embed author name: {embed_author_name}")
                 continue
+            debug_log(f"Parsed listing: {listing}")
 
-            poke_name = match.group(1)
-            poke_dex = int(match.group(2))
-            debug_log(f"Parsed poke_name: {poke_name}, poke_dex: {poke_dex}")
-
-            fields = {f.name: f.value for f in embed.fields}
-            debug_log(f"Embed fields: {fields}")
-
-            # Extract Listed Price and Lowest Market, removing any emojis
-            listed_price_str = re.sub(
-                r"<a?:\w+:\d+>", "", fields.get("Listed Price", "0")
-            )
-            match_price = re.search(r"(\d[\d,]*)", listed_price_str)
-            listed_price = (
-                int(match_price.group(1).replace(",", "")) if match_price else 0
-            )
-            debug_log(f"Parsed listed_price: {listed_price}")
-
-            lowest_market_str = re.sub(
-                r"<a?:\w+:\d+>", "", fields.get("Lowest Market", "0")
-            )
-            lowest_market_match = re.search(r"(\d[\d,]*)", lowest_market_str)
-            lowest_market = (
-                int(lowest_market_match.group(1).replace(",", ""))
-                if lowest_market_match
-                else 0
-            )
-            debug_log(f"Parsed lowest_market: {lowest_market}")
-
-            listing_seen = fields.get("Listing Seen", "N/A")
-            amount = fields.get("Amount", "1")
-            debug_log(f"Parsed listing_seen: {listing_seen}, amount: {amount}")
+            poke_name = listing.poke_name
+            listed_price = listing.listed_price
+            lowest_market = listing.lowest_market
+            original_id = listing.listing_id
 
-            original_id = fields.get("ID", "0")
-            embed_color = embed.color.value
-            display_pokemon_name = poke_name.title()
-
-            if original_id in processed_market_feed_ids:
+            if processed_market_feed_ids.check_and_add(original_id):
                 debug_log(f"Market Feed ID {original_id} already processed")
                 continue
             debug_log(f"Market Feed ID {original_id}")
-            processed_market_feed_ids.add(original_id)
 
-            # If Listed Price is 30% or more below Lowest Market, it's a snipe
-            if lowest_market > 0 and listed_price <= lowest_market * 0.7:
-                debug_log(
-                    f"Snipe detected for {poke_name} at price {listed_price} (lowest market: {lowest_market})"
+            # Compare against the rolling market price before this listing
+            # joins it, then record it
+            reference_price = snipe_reference_price(poke_name, lowest_market)
+            try:
+                await record_market_price(
+                    bot,
+                    poke_name,
+                    original_id,
+                    listed_price,
+                    lowest_market,
+                    listing.amount,
                 )
+            except Exception as e:
+                debug_log(f"Exception in record_market_price: {e}", highlight=True)
 
+            # Keep market_value current; unchanged listings are skipped and the
+            # rest of this feed message is written in one batch
+            if lowest_market > 0:
                 try:
-                    await market_snipe_handler(
-                        bot=bot,
-                        poke_name=poke_name,
-                        listed_price=listed_price,
-                        id=original_id,
-                        lowest_market=lowest_market,
-                        amount=int(amount),
-                        listing_seen=listing_seen,
-                        guild=message.guild,
-                        embed=embed,
+                    await update_market_value_via_listener(
+                        bot,
+                        poke_name,
+                        lowest_market,
+                        listing.listing_seen,
+                        current_listing=listed_price,
                     )
                 except Exception as e:
-                    debug_log(f"Exception in market_snipe_handler: {e}", highlight=True)
+                    debug_log(
+                        f"Exception in update_market_value_via_listener: {e}",
+                        highlight=True,
+                    )
+
+            # If Listed Price is 30% or more below the market price, it's a snipe
+            if (
+                lowest_market > 0
+                and reference_price > 0
+                and listed_price <= reference_price * SNIPE_PRICE_RATIO
+            ):
+                debug_log(
+                    f"Snipe detected for {poke_name} at price {listed_price} (lowest market: {lowest_market}, reference: {reference_price})"
+                )
+
+                notifications.append(
+                    (
+                        f"market_snipe_handler {original_id}",
+                        partial(
+                            market_snipe_handler,
+                            bot=bot,
+                            listing=listing,
+                            guild=message.guild,
+                            embed=embed,
+                        ),
+                    )
+                )
 
             # Check for market alerts
             if not market_alert_cache:
                 debug_log("Market alert cache is empty, skipping alert checks.")
                 continue  # Skip if cache is empty
 
-            # ✅ O(1) lookup using indexed cache
-            alerts_to_check = [
-                alert
-                for key, alert in _market_alert_index.items()
-                if key[0].lower() == poke_name.lower()
-            ]
+            # ✅ Bisect straight to the alerts with max_price >= listed_price
+            alerts_to_check = fetch_matching_market_alerts(poke_name, listed_price)
             debug_log(f"Alerts to check: {alerts_to_check}")
 
             for alert in alerts_to_check:
-                if not isinstance(alert, dict):
-                    debug_log(f"Skipping alert (not a dict): {alert}")
-                    continue
+                role_id = alert["role_id"]
+                channel_id = alert["channel_id"]
+                user_name = alert["user_name"]
+
                 debug_log(
-                    f"Checking alert for user {alert['user_name']} and pokemon {alert['pokemon']}"
+                    f"Triggering market alert for {user_name} on {poke_name} at price {listed_price}"
                 )
-                debug_log(f"Alert type: {type(alert)}, value: {alert}")
-                if (
-                    alert["pokemon"].lower() == poke_name.lower()
-                    and listed_price <= alert["max_price"]
-                ):
-                    role_id = alert["role_id"]
-                    channel_id = alert["channel_id"]
-                    user_name = alert["user_name"]
-
-                    debug_log(
-                        f"Triggering market alert for {user_name} on {poke_name} at price {listed_price}"
-                    )
-                    await handle_market_alert(
-                        bot=bot,
-                        user_name=user_name,
-                        guild=message.guild,
-                        original_id=original_id,
-                        poke_name=poke_name,
-                        listed_price=listed_price,
-                        channel_id=channel_id,
-                        role_id=role_id,
-                        amount=amount,
-                        lowest_market=lowest_market,
-                        listing_seen=listing_seen,
-                        embed=embed,
+                notifications.append(
+                    (
+                        f"handle_market_alert {original_id} for {user_name}",
+                        partial(
+                            handle_market_alert,
+                            bot=bot,
+                            user_name=user_name,
+                            guild=message.guild,
+                            listing=listing,
+                            channel_id=channel_id,
+                            role_id=role_id,
+                            embed=embed,
+                        ),
                     )
+                )
         except Exception as e:
             debug_log(f"Exception in embed processing: {e}", highlight=True, force=True)
+
+    await fan_out_market_notifications(notifications)
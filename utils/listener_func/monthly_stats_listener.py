@@ -15,6 +15,7 @@ from utils.essentials.stats_parsers import (
     parse_clan_stats_message,
     split_known_and_unknown_members,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import (
     get_message_interaction_member,
@@ -25,6 +26,7 @@ from .pokemon_caught_listener import goal_checker
 from .weekly_stats_listener import extract_current_page_number
 
 
+@instrument_listener
 async def monthly_stats_listener(
     bot: discord.Client, before_message: discord.Message, after_message: discord.Message
 ):
@@ -50,9 +52,8 @@ async def monthly_stats_listener(
     current_page = extract_current_page_number(embed_footer)
     # Check if current page and message id is in processed messages
     key = (after_message.id, current_page)
-    if key in processed_monthly_stats_messages:
+    if processed_monthly_stats_messages.check_and_add(key):
         return
-    processed_monthly_stats_messages.add(key)
 
     # Check if command user is in monthly and weekly goal caches
     from utils.cache.cache_list import (
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from Constants.vn_allstars_constants import (
@@ -9,12 +7,15 @@ from Constants.vn_allstars_constants import (
     WEEKLY_REQUIREMENT,
 )
 from utils.cache.cache_list import processed_caught_messages
+from utils.cache.member_name_cache import find_member_by_name
 from utils.db.monthly_goal_tracker import upsert_monthly_goal
 from utils.db.vna_members_db_func import update_member_pokemeow_name
 from utils.db.weekly_goal_tracker import upsert_weekly_goal
 from utils.functions.webhook_func import send_webhook
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import extract_caught_username
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 # enable_debug(f"{__name__}.goal_checker")
@@ -138,18 +139,7 @@ def extract_member_username_from_embed(embed: discord.Embed) -> str | None:
     Returns None if not found.
     """
     if embed.author and embed.author.name:
-        # Try 'Congratulations, username!' first
-        match = re.search(r"Congratulations, ([^!]+)!", embed.author.name)
-        if match:
-            return match.group(1).strip()
-        # Fallback: 'Well done, username!'
-        match = re.search(r"Well done, ([^!]+)!", embed.author.name)
-        if match:
-            return match.group(1).strip()
-        # Fallback: 'Great work, username!'
-        match = re.search(r"Great work, ([^!]+)!", embed.author.name)
-        if match:
-            return match.group(1).strip()
+        return extract_caught_username(embed.author.name)
     return None
 
 
@@ -191,6 +181,7 @@ async def check_pokemeow_name(bot, member: discord.Member, pokemeow_name: str):
 
 
 # Pokemon Caught Listener
+@instrument_listener
 async def pokemon_caught_listener(
     bot: discord.Client,
     before_message: discord.Message,
@@ -226,7 +217,7 @@ async def pokemon_caught_listener(
                 f"⚠️ Could not find VNA member for username '{username}' from Pokémon caught message embed.",
             )
             # Try searching username in guild members as a last resort
-            member = guild.get_member_named(username)
+            member = find_member_by_name(guild, username)
             user_id = member.id if member else None
 
         member = after_message.guild.get_member(user_id) if user_id else None
@@ -315,10 +306,9 @@ async def pokemon_caught_listener(
     debug_log(f"embed_color={embed_color}, embed_description={embed_description}")
 
     # Prevent double processing
-    if after_message.id in processed_caught_messages:
+    if processed_caught_messages.check_and_add(after_message.id):
         debug_log(f"after_message.id {after_message.id} already processed.")
         return
-    processed_caught_messages.add(after_message.id)
 
     # Fish catch
     if embed_color == FISHING_COLOR:
@@ -13,35 +13,20 @@ from utils.cache.cache_list import (
 )
 from utils.db.daily_faction_ball import update_faction_ball
 from utils.db.faction_members import update_faction_member_faction
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import extract_trainer_name_from_description
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 FISHING_COLOR = 0x87CEFA
 
 
-"""enable_debug(f"{__name__}.extract_trainer_name_from_description")
-enable_debug(f"{__name__}.get_faction_member_via_trainer_name")
+"""enable_debug(f"{__name__}.get_faction_member_via_trainer_name")
 enable_debug(f"{__name__}.faction_ball_alert")
 enable_debug(f"{__name__}.pokemon_spawn_listener")"""
 
 
-def extract_trainer_name_from_description(description: str) -> str | None:
-    """
-    Extracts the trainer name (e.g. 'khy.09') from a PokéMeow embed description.
-    Handles both 'found a wild' and 'fished a wild' scenarios.
-    Example lines:
-    '<:irida:...>  **khy.09** found a wild ...'
-    '<:irida:...>  **khy.09** fished a wild ...'
-    """
-
-    match = re.search(r"\*\*(.+?)\*\*\s+(?:found|fished) a wild", description)
-    if match:
-        debug_log(f"Extracted trainer name: {match.group(1).strip()}")
-        return match.group(1).strip()
-    return None
-
-
 def get_faction_member_via_trainer_name(bot, guild: discord.Guild, trainer_name: str):
 
     debug_log(f"Looking up faction member for trainer_name: {trainer_name}")
@@ -103,10 +88,9 @@ async def faction_ball_alert(
     team_logo_emoji = team_logo_emoji[0]
     debug_log(f" Using team logo emoji: {team_logo_emoji}")
 
-    if after.id in processed_faction_ball_alerts:
+    if processed_faction_ball_alerts.check_and_add(after.id):
         debug_log(f" Message {after.id} already processed.")
         return
-    processed_faction_ball_alerts.add(after.id)
 
     embed_faction = get_faction_by_emoji(team_logo_emoji)
     debug_log(f" Faction from emoji: {embed_faction}")
@@ -174,6 +158,7 @@ async def faction_ball_alert(
         await after.add_reaction(ball_emoji)
 
 
+@instrument_listener
 async def pokemon_spawn_listener(bot, message: discord.Message):
     debug_log(
         f" Called for message.id: {getattr(message, 'id', None)} | bot: {getattr(bot, 'user', None)}"
@@ -194,10 +179,9 @@ async def pokemon_spawn_listener(bot, message: discord.Message):
         debug_log(" 'found a wild' not in message content, exiting.")
         return
 
-    if message.id in processed_pokemon_spawn_msgs:
+    if processed_pokemon_spawn_msgs.check_and_add(message.id):
         debug_log(f" Message ID {message.id} already processed, exiting.")
         return
-    processed_pokemon_spawn_msgs.add(message.id)
 
     guild = message.guild
     debug_log(f" Guild: {guild}")
@@ -1,12 +1,14 @@
 import asyncio
-import re
 from datetime import datetime
 
 import discord
 
 from Constants.timer_settings import *
 from utils.cache.cache_list import timer_cache  # 💜 import your cache
+from utils.cache.member_name_cache import find_member_by_name
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import parse_spawn_trainer
 
 # 🗂 Track scheduled "command ready" tasks to avoid duplicates
 ready_tasks = {}
@@ -16,6 +18,7 @@ ready_tasks = {}
 #   Function: detect_pokemeow_reply
 #   Handles Pokemon timer notifications per user settings
 # 💜────────────────────────────────────────────
+@instrument_listener
 async def pokemon_timer_handler(message: discord.Message):
     """
     Triggered on any message.
@@ -29,19 +32,15 @@ async def pokemon_timer_handler(message: discord.Message):
         if message.author.id != POKEMEOW_APPLICATION_ID:
             return
 
-        match = re.search(r"\*\*(.+?)\*\* found a wild", message.content)
-        if not match:
+        spawn = parse_spawn_trainer(message.content)
+        if not spawn or spawn.action != "found":
             return
 
-        username = match.group(1).strip()
+        username = spawn.trainer_name
         guild = message.guild
 
         # Match member case-insensitive
-        member = discord.utils.find(
-            lambda m: m.name.lower() == username.lower()
-            or m.display_name.lower() == username.lower(),
-            guild.members,
-        )
+        member = find_member_by_name(guild, username)
         if not member:
             return
 
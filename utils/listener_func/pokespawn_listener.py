@@ -7,6 +7,7 @@ from Constants.paldea_galar_dict import *
 from Constants.variables import PublicChannels, Roles, Server
 from Constants.vn_allstars_constants import VN_ALLSTARS_ROLES, VN_ALLSTARS_TEXT_CHANNELS
 from utils.functions.webhook_func import send_webhook
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
 
 # -------------------- Constants --------------------
@@ -64,6 +65,7 @@ GUILD_MAP = {
 }
 
 
+@instrument_listener
 async def as_spawn_ping(bot: discord.Client, message: discord.Message):
     """
     Detects a wild Pokémon spawn in a message and sends the appropriate pings and embeds
@@ -9,6 +9,7 @@ from utils.db.misc_pokemeow_reminders_db import (
     update_secret_santa_reminder,
     upsert_secret_santa_reminder,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
@@ -27,6 +28,7 @@ def extract_timestamp(message: str) -> int | None:
 
 
 # 🍭 Listener for Secret Santa participation
+@instrument_listener
 async def secret_santa_listener(bot: discord.Client, message: discord.Message):
     """
     Listener that triggers when a user participates in Secret Santa.
@@ -47,6 +49,7 @@ async def secret_santa_listener(bot: discord.Client, message: discord.Message):
     )  # React with Santa emoji to confirm participation
 
 
+@instrument_listener
 async def secret_santa_timer_listener(bot: discord.Client, message: discord.Message):
     """
     Listener that triggers when a user participates in Secret Santa.
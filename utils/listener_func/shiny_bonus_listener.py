@@ -21,6 +21,7 @@ from utils.db.shiny_bonus_db import (
     upsert_shiny_bonus,
 )
 from utils.essentials.cleanup_first_match import cleanup_first_match
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 
@@ -42,6 +43,7 @@ async def send_timestamp_to_cc_channel(bot: commands.Bot, expires_unix: int) ->
         pretty_log("warn", "CC shiny bonus channel not found.")
 
 
+@instrument_listener
 async def read_shiny_bonus_timestamp_from_cc_channel(
     bot: commands.Bot, message: discord.Message
 ):
@@ -162,6 +164,7 @@ async def build_extended_shiny_bonus_embed(
     return embed
 
 
+@instrument_listener
 async def handle_pokemeow_global_bonus(
     bot: commands.Bot,
     message: discord.Message,
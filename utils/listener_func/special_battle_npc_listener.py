@@ -8,6 +8,7 @@ from utils.db.special_npc_timer_db_func import (
     get_special_battle_timer,
     upsert_special_battle_timer,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.debug_log import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
@@ -31,6 +32,7 @@ def extract_timestamp_from_message(content: str) -> int | None:
     return None
 
 
+@instrument_listener
 async def special_battle_npc_timer_listener(
     bot: discord.Client, message: discord.Message
 ):
@@ -114,6 +116,7 @@ async def special_battle_npc_timer_listener(
 
 
 # 🍭 Listener for special battle NPC timers
+@instrument_listener
 async def special_battle_npc_listener(bot: discord.Client, message: discord.Message):
 
     member = await get_pokemeow_reply_member(message)
@@ -1,5 +1,4 @@
 import asyncio
-import re
 import time
 
 import discord
@@ -10,7 +9,13 @@ from Constants.vn_allstars_constants import (
     VN_ALLSTARS_TEXT_CHANNELS,
 )
 from utils.cache.cache_list import user_alerts_cache, vna_members_cache
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow.embed_parsers import (
+    extract_relative_timestamp,
+    extract_wb_boss_name,
+    parse_world_boss_announcement,
+)
 from utils.pokemeow.get_pokemeow_reply import (
     get_message_interaction_member,
     get_pokemeow_reply_member,
@@ -21,17 +26,6 @@ from utils.logs.debug_log import debug_log, enable_debug
 wb_tasks = {}
 
 
-def extract_wb_unix_seconds(description: str) -> int | None:
-    """
-    Extracts the unix seconds from the line:
-    '🔹 :crossed_swords: The battle begins <t:1763620682:R>'
-    """
-    match = re.search(r"<t:(\d+):R>", description)
-    if match:
-        return int(match.group(1))
-    return None
-
-
 def format_display_boss_name(boss_name: str) -> str:
     """Formats the boss name for display by replacing certain keywords with emojis."""
     if "Shiny Gigantamax" in boss_name:
@@ -48,41 +42,6 @@ def format_display_boss_name(boss_name: str) -> str:
     return boss_name.strip()
 
 
-def extract_wb_boss_name(description: str) -> str | None:
-    """
-    Extracts the boss name from the line:
-    '🔹 :crossed_swords: Boss challenge: ... Shiny Gigantamax-Copperajah'
-    """
-    match = re.search(r"Boss challenge: [^>]+>\s*(.+)", description)
-    if match:
-
-        boss_name = match.group(1).strip()
-
-        return boss_name
-    return None
-
-
-def extract_boss_and_timestamp(embed_description: str) -> tuple[str | None, int | None]:
-    """
-    Extracts the boss name and unix timestamp from a World Boss embed description.
-    Args:
-        embed_description (str): The embed description text.
-    Returns:
-        tuple[str | None, int | None]: (boss_name, unix_timestamp) or (None, None) if not found.
-    """
-    # Boss name: after 'World Boss challenge:' and before newline
-    boss_match = re.search(
-        r"World Boss challenge:\s*(?:<[^>]+>\s*)?([A-Za-z0-9\s\-]+)", embed_description
-    )
-    boss_name = boss_match.group(1).strip() if boss_match else None
-
-    # Timestamp: look for <t:digits(:letters)?>
-    timestamp_match = re.search(r"<t:(\d+)(?::[A-Za-z]+)?>", embed_description)
-    unix_timestamp = int(timestamp_match.group(1)) if timestamp_match else None
-
-    return boss_name, unix_timestamp
-
-
 async def world_boss_waiter(
     bot: discord.Client,
     unix_seconds,
@@ -186,6 +145,7 @@ async def start_world_boss_task(
             return
 
 
+@instrument_listener
 async def register_wb_battle_reminder(
     bot: discord.Client,
     message: discord.Message,
@@ -238,7 +198,7 @@ async def register_wb_battle_reminder(
         if not notify_channel:
             notify_channel = public_channel
 
-    unix_seconds = extract_wb_unix_seconds(embed.description)
+    unix_seconds = extract_relative_timestamp(embed.description)
     boss_name = extract_wb_boss_name(embed.description)
 
     now = int(time.time())
@@ -315,6 +275,7 @@ async def centralize_wb_register_handler(
 
 
 # WB REGISTER COMMAND EMBED
+@instrument_listener
 async def handle_wb_register_command(
     bot: discord.Client,
     before_message: discord.Message,
@@ -368,7 +329,7 @@ async def handle_wb_register_command(
         if not notify_channel:
             notify_channel = public_channel
 
-    boss_name, unix_seconds = extract_boss_and_timestamp(embed_description)
+    boss_name, unix_seconds = parse_world_boss_announcement(embed_description)
     if not boss_name and not unix_seconds:
         debug_log(
             f"Failed to extract both boss name and unix seconds from embed description. Description: {embed_description}"
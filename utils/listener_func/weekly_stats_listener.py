@@ -9,12 +9,14 @@ from Constants.vn_allstars_constants import (
     WEEKLY_REQUIREMENT,
 )
 from utils.cache.cache_list import processed_weekly_stats_messages, vna_members_cache
+from utils.cache.weekly_goal_tracker_cache import fetch_all_weekly_goal_cache
 from utils.db.monthly_goal_tracker import upsert_monthly_goal
-from utils.db.weekly_goal_tracker import fetch_all_weekly_goals, upsert_weekly_goal
+from utils.db.weekly_goal_tracker import upsert_weekly_goal
 from utils.essentials.stats_parsers import (
     parse_clan_stats_message,
     split_known_and_unknown_members,
 )
+from utils.essentials.listener_stats import instrument_listener
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import (
     get_message_interaction_member,
@@ -36,6 +38,7 @@ def extract_current_page_number(footer_text: str) -> int | None:
     return None
 
 
+@instrument_listener
 async def weekly_stats_listener(
     bot: discord.Client, before_message: discord.Message, after_message: discord.Message
 ):
@@ -61,9 +64,8 @@ async def weekly_stats_listener(
     current_page = extract_current_page_number(embed_footer)
     # Check if current page and message id is in processed messages
     key = (after_message.id, current_page)
-    if key in processed_weekly_stats_messages:
+    if processed_weekly_stats_messages.check_and_add(key):
         return
-    processed_weekly_stats_messages.add(key)
 
     # Check if command user is in monthly and weekly goal caches
     from utils.cache.cache_list import (
@@ -133,12 +135,12 @@ async def weekly_stats_listener(
     if not clan_members_stats:
         return
 
-    # Fetch old weekly goals from DB
+    # Fetch old weekly goals from cache (the DB only catches up on flush)
     from utils.cache.vna_members_cache import (
         fetch_vna_member_id_by_username_or_pokemeow_name,
     )
 
-    old_weekly_goals = await fetch_all_weekly_goals(bot=bot)
+    old_weekly_goals = fetch_all_weekly_goal_cache()
     # Convert list of dicts to dict keyed by user_id for fast lookup
     old_weekly_goals_dict = {g["user_id"]: g for g in old_weekly_goals}
     if not old_weekly_goals:
@@ -189,7 +191,7 @@ async def weekly_stats_listener(
                     bot=bot,
                 )
                 continue
-            # Compare from old weekly goals from db
+            # Compare with the cached weekly goals
             old_goal = old_weekly_goals_dict.get(member_id) if member_id else None
             old_catches = old_goal.get("pokemon_caught") if old_goal else 0
             old_fishes = old_goal.get("fish_caught") if old_goal else 0
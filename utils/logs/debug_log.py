@@ -1,20 +1,27 @@
 # utils/loggers/smart_debug.py
-import inspect
+import sys
 from datetime import datetime
+
 import discord
 
+from utils.logs.log_backend import LogRecord, log_backend
+
 # -----------------------------
 # 🔹 Global Debug Toggles
 # -----------------------------
 DEBUG_TOGGLES: dict[str, bool] = {}
+# Keys currently enabled, so debug_log can bail out without a lookup
+_ENABLED_KEYS: set[str] = set()
 
 
 def enable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = True
+    _ENABLED_KEYS.add(func_path)
 
 
 def disable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = False
+    _ENABLED_KEYS.discard(func_path)
 
 
 def debug_enabled(func_path: str) -> bool:
@@ -24,32 +31,40 @@ def debug_enabled(func_path: str) -> bool:
 # -----------------------------
 # 🔹 Core debug_log
 # -----------------------------
+# 🌸 pastel pink + underline for highlights
+COLOR_PASTEL_PINK = "\033[38;2;255;182;193m\033[4m"
+COLOR_RESET = "\033[0m"
+
+
 def debug_log(
-    message: str, highlight: bool = False, disabled: bool = False, force: bool = False
+    message, highlight: bool = False, disabled: bool = False, force: bool = False
 ):
-    if disabled:
+    """
+    Prints message if debugging is enabled for the calling function
+    (or force=True). message may be a zero-arg callable so expensive
+    messages are only built when they will actually be printed.
+    """
+    # Cheap exits first: nothing enabled means no frame lookup at all
+    if disabled or not (force or _ENABLED_KEYS):
         return
 
-    stack = inspect.stack()
-    caller_frame = stack[1]
-    func_name = caller_frame.function
-    module_name = caller_frame.frame.f_globals.get("__name__", "__main__")
-    key = f"{module_name}.{func_name}"
+    caller = sys._getframe(1)
+    func_name = caller.f_code.co_name
+    if not force:
+        module_name = caller.f_globals.get("__name__", "__main__")
+        if f"{module_name}.{func_name}" not in _ENABLED_KEYS:
+            return
 
-    if not debug_enabled(key) and not force:
-        return
+    if callable(message):
+        message = message()
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"[{timestamp}] [🧪 {func_name}] {message}"
 
-    # 🌸 pastel pink + underline for highlights
-    COLOR_PASTEL_PINK = "\033[38;2;255;182;193m\033[4m"
-    COLOR_RESET = "\033[0m"
-
     if highlight:
         log_line = f"{COLOR_PASTEL_PINK}{log_line}{COLOR_RESET}"
 
-    print(log_line)
+    log_backend.emit(LogRecord("debug", log_line, raw=True))
 
 
 # -----------------------------
@@ -0,0 +1,211 @@
+import asyncio
+import io
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import discord
+
+from utils.logs.log_backend import LogRecord, log_backend
+
+# 🟣────────────────────────────────────────────
+#        🚨 Discord Error-Log Sink
+# 🟣────────────────────────────────────────────
+# warn/error/critical logs used to be one channel.send task per line per
+# log channel, so an error storm (e.g. a DB outage) spawned thousands of
+# sends and ate into the rate limits of user-facing sends.
+#
+# Now every log only lands in a pending digest:
+#   - identical (tag, label, message) logs are merged and counted, and a
+#     message already sent in the last DEDUP_WINDOW_SECONDS is only counted
+#   - every FLUSH_INTERVAL_SECONDS the digest goes out as one message per
+#     channel, or as a short summary + .txt attachment if it is too long
+#   - at most SEND_BUDGET_PER_MINUTE sends per minute; over budget, the
+#     digest keeps growing until the next interval with budget left
+
+FLUSH_INTERVAL_SECONDS = 5
+DEDUP_WINDOW_SECONDS = 60
+SEND_BUDGET_PER_MINUTE = 12
+MAX_PENDING_ENTRIES = 500
+MAX_MESSAGE_CHARS = 2000
+MAX_TRACE_CHARS = 1500
+
+SINK_LABEL = "🚨 LOG SINK"
+
+
+@dataclass
+class _DigestEntry:
+    header: str
+    trace: str
+    count: int = 1
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+
+
+class DiscordLogSink:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[tuple, _DigestEntry] = {}
+        self._last_sent: dict[tuple, float] = {}
+        self._send_times: list[float] = []
+        self._channel_ids: tuple[int, ...] = ()
+        self._bot: discord.Client | None = None
+        self._flusher: asyncio.Task | None = None
+        self._flusher_requested = False
+
+        # 📊 Counters
+        self.submitted = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.sent_messages = 0
+        self.sent_files = 0
+        self.send_failures = 0
+        self.budget_deferrals = 0
+
+    # 📥 Called by pretty_log (any thread)
+    def submit(
+        self,
+        bot: discord.Client,
+        channel_ids,
+        tag: str,
+        header: str,
+        trace: str | Callable[[], str] = "",
+        key: tuple | None = None,
+    ):
+        """
+        Queues one log line (header) for the digest. trace may be a callable,
+        it is then only formatted for the first occurrence of the header.
+        """
+        now = time.time()
+        key = key or (tag, header)
+        with self._lock:
+            self._bot = bot
+            self._channel_ids = tuple(channel_ids)
+            self.submitted += 1
+            entry = self._pending.get(key)
+            if entry:
+                entry.count += 1
+                entry.last_seen = now
+                self.deduplicated += 1
+            elif len(self._pending) >= MAX_PENDING_ENTRIES:
+                self.dropped += 1
+            else:
+                if callable(trace):
+                    trace = trace()
+                self._pending[key] = _DigestEntry(header, trace, 1, now, now)
+            if self._flusher_requested:
+                return
+            self._flusher_requested = True
+
+        try:
+            bot.loop.call_soon_threadsafe(self._ensure_flusher)
+        except Exception:
+            # Loop not running (startup/shutdown): keep it pending for later
+            with self._lock:
+                self._flusher_requested = False
+
+    def _ensure_flusher(self):
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+
+    # ⏱ Flush loop, exits once nothing is pending
+    async def _run(self):
+        try:
+            while True:
+                await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+                with self._lock:
+                    if not self._pending:
+                        self._flusher_requested = False
+                        return
+                if not self._take_budget(len(self._channel_ids)):
+                    self.budget_deferrals += 1
+                    continue
+                with self._lock:
+                    pending, self._pending = self._pending, {}
+                    bot, channel_ids = self._bot, self._channel_ids
+                await self._flush(bot, channel_ids, pending)
+        finally:
+            with self._lock:
+                self._flusher_requested = False
+
+    def _take_budget(self, sends: int) -> bool:
+        now = time.monotonic()
+        self._send_times = [t for t in self._send_times if now - t < 60]
+        if len(self._send_times) + sends > SEND_BUDGET_PER_MINUTE:
+            return False
+        self._send_times.extend([now] * sends)
+        return True
+
+    async def _flush(self, bot, channel_ids, pending: dict[tuple, _DigestEntry]):
+        now = time.time()
+        lines = []
+        for key, entry in pending.items():
+            recently_sent = now - self._last_sent.get(key, 0) < DEDUP_WINDOW_SECONDS
+            self._last_sent[key] = now
+            repeat = f" `×{entry.count}`" if entry.count > 1 else ""
+            if recently_sent:
+                lines.append(f"↩️{repeat or ' `×1`'} again: {entry.header}")
+                continue
+            line = f"{entry.header}{repeat}"
+            if entry.trace:
+                trace = entry.trace
+                if len(trace) > MAX_TRACE_CHARS:
+                    trace = "..." + trace[-MAX_TRACE_CHARS:]
+                line += f"\n```py\n{trace}```"
+            lines.append(line)
+        self._last_sent = {
+            k: t for k, t in self._last_sent.items() if now - t < DEDUP_WINDOW_SECONDS
+        }
+
+        text = "\n".join(lines)
+        if self.dropped:
+            text += f"\n⚠️ {self.dropped} more distinct logs dropped (digest full)"
+            self.dropped = 0
+
+        for channel_id in channel_ids:
+            channel = bot.get_channel(channel_id)
+            if not channel:
+                continue
+            try:
+                if len(text) <= MAX_MESSAGE_CHARS:
+                    await channel.send(text)
+                else:
+                    total = sum(e.count for e in pending.values())
+                    span = now - min(e.first_seen for e in pending.values())
+                    summary = (
+                        f"📄 {total} logs ({len(pending)} distinct) in the last "
+                        f"{span:.0f}s, full digest attached.\n"
+                        f"{pending[next(iter(pending))].header}"
+                    )[:MAX_MESSAGE_CHARS]
+                    file = discord.File(
+                        io.BytesIO(text.encode("utf-8")), filename="error_digest.txt"
+                    )
+                    await channel.send(summary, file=file)
+                    self.sent_files += 1
+                self.sent_messages += 1
+            except Exception as e:
+                # Console only: logging this through pretty_log would loop
+                self.send_failures += 1
+                log_backend.emit(
+                    LogRecord(
+                        "error",
+                        f"Failed to send log digest to channel {channel_id}: {e}",
+                        prefix="❌ ERROR",
+                        label=SINK_LABEL,
+                    )
+                )
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "pending": len(self._pending),
+            "sent_messages": self.sent_messages,
+            "sent_files": self.sent_files,
+            "send_failures": self.send_failures,
+            "budget_deferrals": self.budget_deferrals,
+        }
+
+
+discord_log_sink = DiscordLogSink()
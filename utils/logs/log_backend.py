@@ -0,0 +1,221 @@
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+
+# 🟣────────────────────────────────────────────
+#        📜 Non-blocking Log Backend
+# 🟣────────────────────────────────────────────
+# pretty_log / debug_log only check the level filter and put a small record
+# on a queue. A daemon writer thread does the timestamp / color / traceback
+# formatting and the actual stdout writes, so the event loop never blocks
+# on a slow terminal or pipe.
+#
+# Level filters are checked before anything is formatted:
+#   set_log_level("warn")                     everything below warn is dropped
+#   set_log_level("debug", label="💾 DB")     per-label override
+# Extra keyword fields passed to pretty_log are kept as structured data and
+# only rendered by the writer ("key=value", or JSON lines with json_output).
+
+LEVELS = {
+    "debug": 10,
+    "info": 20,
+    "warn": 30,
+    "warning": 30,
+    "error": 40,
+    "critical": 50,
+}
+TAG_LEVELS = {"debug": 10, "warn": 30, "error": 40, "critical": 50}
+# Everything is shown unless LOG_LEVEL raises it, as before this backend
+DEFAULT_LEVEL = LEVELS["debug"]
+QUEUE_MAX_SIZE = 10_000  # beyond this, records are dropped (and counted)
+WRITE_BATCH_SIZE = 256
+
+COLOR_RESET = "\033[0m"
+_STOP = object()
+
+
+def tag_level(tag: str) -> int:
+    """Numeric level of a pretty_log tag; unknown/empty tags count as info."""
+    return TAG_LEVELS.get(tag, LEVELS["info"])
+
+
+class LogRecord:
+    __slots__ = (
+        "created",
+        "tag",
+        "prefix",
+        "label",
+        "message",
+        "color",
+        "fields",
+        "exc_info",
+        "raw",
+    )
+
+    def __init__(
+        self,
+        tag: str = "",
+        message: str = "",
+        *,
+        prefix: str = "",
+        label: str | None = None,
+        color: str = "",
+        fields: dict | None = None,
+        exc_info: tuple | None = None,
+        raw: bool = False,
+    ):
+        self.created = time.time()
+        self.tag = tag
+        self.prefix = prefix
+        self.label = label
+        self.message = message
+        self.color = color
+        self.fields = fields
+        self.exc_info = exc_info
+        self.raw = raw
+
+
+class LogBackend:
+    def __init__(self, stream=None):
+        self._stream = stream
+        self._queue: queue.Queue = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.level = DEFAULT_LEVEL
+        self.label_levels: dict[str, int] = {}
+        self.json_output = False
+        self.written = 0
+        self.dropped = 0
+
+    # 🔍 Filter (cheap, runs on the caller's thread)
+    def is_enabled(self, level: int, label: str | None = None) -> bool:
+        if self.label_levels and label in self.label_levels:
+            return level >= self.label_levels[label]
+        return level >= self.level
+
+    # 📥 Enqueue
+    def emit(self, record: LogRecord):
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._writer, name="log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def flush(self, timeout: float = 5.0):
+        """Blocks until everything queued so far is written (or timeout)."""
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self, timeout: float = 5.0):
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+        self._thread = None
+
+    # ✍️ Writer thread
+    def _writer(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            lines = []
+            for record in batch:
+                if record is _STOP:
+                    stop = True
+                    continue
+                try:
+                    lines.append(self._format(record))
+                except Exception as e:
+                    lines.append(f"[log-writer] could not format record: {e!r}")
+
+            if lines:
+                stream = self._stream or sys.stdout
+                try:
+                    stream.write("\n".join(lines) + "\n")
+                    stream.flush()
+                    self.written += len(lines)
+                except Exception:
+                    pass
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _format(self, record: LogRecord) -> str:
+        if record.raw:
+            return record.message
+
+        trace = ""
+        if record.exc_info:
+            trace = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+
+        if self.json_output:
+            return json.dumps(
+                {
+                    "ts": datetime.fromtimestamp(record.created).isoformat(
+                        timespec="milliseconds"
+                    ),
+                    "tag": record.tag,
+                    "label": record.label,
+                    "message": record.message,
+                    **(record.fields or {}),
+                    **({"trace": trace} if trace else {}),
+                },
+                default=str,
+                ensure_ascii=False,
+            )
+
+        now = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        prefix_part = f"[{record.prefix}] " if record.prefix else ""
+        label_str = f"[{record.label}] " if record.label else ""
+        fields = ""
+        if record.fields:
+            fields = " " + " ".join(f"{k}={v!r}" for k, v in record.fields.items())
+        line = f"{record.color}[{now}] {prefix_part}{label_str}{record.message}{fields}{COLOR_RESET}"
+        return f"{line}\n{trace}" if trace else line
+
+
+log_backend = LogBackend()
+atexit.register(log_backend.close)
+
+
+def set_log_level(level: str | int, label: str | None = None):
+    """Sets the minimum level globally, or for one label. None label = global."""
+    value = LEVELS[level.lower()] if isinstance(level, str) else level
+    if label is None:
+        log_backend.level = value
+    else:
+        log_backend.label_levels[label] = value
+
+
+def configure_logging(level: str | int | None = None, json_output: bool = False):
+    """Startup config, e.g. configure_logging(os.getenv("LOG_LEVEL"))."""
+    if level:
+        set_log_level(level)
+    log_backend.json_output = json_output
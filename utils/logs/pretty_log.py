@@ -1,180 +1,182 @@
-import traceback
-from datetime import datetime
-
-import discord
-from discord.ext import commands
-
-CC_ERROR_LOGS_CHANNEL_ID = 1444997181244444672
-# -------------------- 🧩 Global Bot Reference --------------------
-from typing import Optional
-
-BOT_INSTANCE: Optional[commands.Bot] = None
-
-
-def set_arceus_bot(bot: commands.Bot):
-    """Set the global bot instance for automatic logging."""
-    global BOT_INSTANCE
-    BOT_INSTANCE = bot
-
-
-# -------------------- 🧩 Log Tags --------------------
-TAGS = {
-    "info": "🌀 INFO",
-    "db": "💾 DB",
-    "cmd": "✨ CMD",
-    "ready": "🚀 READY",
-    "error": "❌ ERROR",
-    "warn": "⚠️ WARN",
-    "critical": "💥 CRITICAL",
-    "skip": "🤍 SKIP",
-    "sent": "📨 SENT",
-    "debug": "🐛 DEBUG",
-    "success": "✅ SUCCESS",
-    "cache": "🗄️ CACHE",
-    "schedule": "⏰ SCHEDULE",
-}
-
-# -------------------- 🎨 Arceus ANSI Colors --------------------
-COLOR_CYAN = "\033[38;2;136;223;255m"
-COLOR_TEAL = "\033[38;2;168;245;255m"
-COLOR_ORANGE = "\033[38;2;255;184;128m"
-COLOR_PURPLE = "\033[38;2;179;176;255m"
-COLOR_RED = "\033[38;2;255;85;85m"
-COLOR_RESET = "\033[0m"
-
-MAIN_COLORS = {
-    "cyan": COLOR_CYAN,
-    "teal": COLOR_TEAL,
-    "orange": COLOR_ORANGE,
-    "purple": COLOR_PURPLE,
-    "red": COLOR_RED,
-    "reset": COLOR_RESET,
-}
-
-# -------------------- ⚠️ Critical Logs Channel --------------------
-CRITICAL_LOG_CHANNEL_ID = (
-    1375702774771093697  # replace with your Arceus bot log channel
-)
-CRITICAL_LOG_CHANNEL_LIST = [
-    1375702774771093697,  # Arceus Bot Logs
-    CC_ERROR_LOGS_CHANNEL_ID,
-]
-
-
-# -------------------- 🌟 Pretty Log --------------------
-def pretty_log(
-    tag: str = "info",
-    message: str = "",
-    *,
-    label: str = None,
-    bot: commands.Bot = None,
-    include_trace: bool = True,
-):
-    """
-    Prints a colored log for Arceus-themed bots with timestamp and emoji.
-    Sends critical/error/warn messages to Discord if bot is set.
-    """
-    prefix = TAGS.get(tag) if tag else ""
-    prefix_part = f"[{prefix}] " if prefix else ""
-    label_str = f"[{label}] " if label else ""
-
-    # Choose color based on tag
-    color = MAIN_COLORS["cyan"]
-    if tag in ("warn",):
-        color = MAIN_COLORS["orange"]
-    elif tag in ("error",):
-        color = MAIN_COLORS["red"]
-    elif tag in ("critical",):
-        color = MAIN_COLORS["purple"]
-
-    now = datetime.now().strftime("%H:%M:%S")
-    log_message = f"{color}[{now}] {prefix_part}{label_str}{message}{COLOR_RESET}"
-    print(log_message)
-
-    # Optionally print traceback
-    if include_trace and tag in ("error", "critical"):
-        traceback.print_exc()
-
-    # Send to all Discord channels in the list if bot available
-    bot_to_use = bot or BOT_INSTANCE
-    if bot_to_use and tag in ("critical", "error", "warn"):
-        for channel_id in CRITICAL_LOG_CHANNEL_LIST:
-            try:
-                channel = bot_to_use.get_channel(channel_id)
-                if channel:
-                    full_message = f"{prefix_part}{label_str}{message}"
-                    if include_trace and tag in ("error", "critical"):
-                        full_message += f"\n```py\n{traceback.format_exc()}```"
-                    if len(full_message) > 2000:
-                        full_message = full_message[:1997] + "..."
-                    bot_to_use.loop.create_task(channel.send(full_message))
-            except Exception:
-                print(
-                    f"{COLOR_RED}[❌ ERROR] Failed to send log to Discord channel {channel_id}{COLOR_RESET}"
-                )
-                traceback.print_exc()
-
-
-# -------------------- 🌸 UI Error Logger --------------------
-def log_ui_error(
-    *,
-    error: Exception,
-    interaction: discord.Interaction = None,
-    label: str = "UI",
-    bot: commands.Bot = None,
-    include_trace: bool = True,
-):
-    """Logs UI errors with automatic Discord reporting."""
-    location_info = ""
-    if interaction:
-        user = interaction.user
-        location_info = f"User: {user} ({user.id}) | Channel: {interaction.channel} ({interaction.channel_id})"
-
-    error_message = f"UI error occurred. {location_info}".strip()
-    now = datetime.now().strftime("%H:%M:%S")
-
-    print(
-        f"{COLOR_RED}[{now}] [💥 CRITICAL] {label} error: {error_message}{COLOR_RESET}"
-    )
-    if include_trace:
-        traceback.print_exception(type(error), error, error.__traceback__)
-
-    bot_to_use = bot or BOT_INSTANCE
-
-    pretty_log(
-        "error",
-        error_message,
-        label=label,
-        bot=bot_to_use,
-        include_trace=include_trace,
-    )
-
-    if bot_to_use:
-        for channel_id in CRITICAL_LOG_CHANNEL_LIST:
-            try:
-                channel = bot_to_use.get_channel(channel_id)
-                if channel:
-                    embed = discord.Embed(
-                        title=f"⚠️ UI Error Logged [{label}]",
-                        description=f"{location_info or '*No interaction data*'}",
-                        color=0x88DFFF,  # Arceus cyan
-                    )
-                    if include_trace:
-                        trace_text = "".join(
-                            traceback.format_exception(
-                                type(error), error, error.__traceback__
-                            )
-                        )
-                        if len(trace_text) > 1000:
-                            trace_text = trace_text[:1000] + "..."
-                        embed.add_field(
-                            name="Traceback",
-                            value=f"```py\n{trace_text}```",
-                            inline=False,
-                        )
-                    bot_to_use.loop.create_task(channel.send(embed=embed))
-            except Exception:
-                print(
-                    f"{COLOR_RED}[❌ ERROR] Failed to send UI error to bot channel {channel_id}{COLOR_RESET}"
-                )
-                traceback.print_exc()
+import sys
+import traceback
+from typing import Callable
+
+import discord
+from discord.ext import commands
+
+from utils.logs.discord_log_sink import discord_log_sink
+from utils.logs.log_backend import LogRecord, log_backend, tag_level
+
+CC_ERROR_LOGS_CHANNEL_ID = 1444997181244444672
+# -------------------- 🧩 Global Bot Reference --------------------
+from typing import Optional
+
+BOT_INSTANCE: Optional[commands.Bot] = None
+
+
+def set_arceus_bot(bot: commands.Bot):
+    """Set the global bot instance for automatic logging."""
+    global BOT_INSTANCE
+    BOT_INSTANCE = bot
+
+
+# -------------------- 🧩 Log Tags --------------------
+TAGS = {
+    "info": "🌀 INFO",
+    "db": "💾 DB",
+    "cmd": "✨ CMD",
+    "ready": "🚀 READY",
+    "error": "❌ ERROR",
+    "warn": "⚠️ WARN",
+    "critical": "💥 CRITICAL",
+    "skip": "🤍 SKIP",
+    "sent": "📨 SENT",
+    "debug": "🐛 DEBUG",
+    "success": "✅ SUCCESS",
+    "cache": "🗄️ CACHE",
+    "schedule": "⏰ SCHEDULE",
+}
+
+# -------------------- 🎨 Arceus ANSI Colors --------------------
+COLOR_CYAN = "\033[38;2;136;223;255m"
+COLOR_TEAL = "\033[38;2;168;245;255m"
+COLOR_ORANGE = "\033[38;2;255;184;128m"
+COLOR_PURPLE = "\033[38;2;179;176;255m"
+COLOR_RED = "\033[38;2;255;85;85m"
+COLOR_RESET = "\033[0m"
+
+MAIN_COLORS = {
+    "cyan": COLOR_CYAN,
+    "teal": COLOR_TEAL,
+    "orange": COLOR_ORANGE,
+    "purple": COLOR_PURPLE,
+    "red": COLOR_RED,
+    "reset": COLOR_RESET,
+}
+
+# -------------------- ⚠️ Critical Logs Channel --------------------
+CRITICAL_LOG_CHANNEL_ID = (
+    1375702774771093697  # replace with your Arceus bot log channel
+)
+CRITICAL_LOG_CHANNEL_LIST = [
+    1375702774771093697,  # Arceus Bot Logs
+    CC_ERROR_LOGS_CHANNEL_ID,
+]
+
+
+# -------------------- 🌟 Pretty Log --------------------
+def pretty_log(
+    tag: str = "info",
+    message: str | Callable[[], str] = "",
+    *,
+    label: str = None,
+    bot: commands.Bot = None,
+    include_trace: bool = True,
+    **fields,
+):
+    """
+    Logs a colored, timestamped line for Arceus-themed bots.
+    Console output goes through the non-blocking log backend; the level
+    filter runs first, so nothing is formatted for filtered-out logs.
+    message may be a zero-arg callable for expensive messages, and extra
+    keyword args are kept as structured fields.
+    Sends critical/error/warn messages to Discord if bot is set.
+    """
+    bot_to_use = bot or BOT_INSTANCE
+    to_console = log_backend.is_enabled(tag_level(tag), label)
+    to_discord = bool(bot_to_use) and tag in ("critical", "error", "warn")
+    if not to_console and not to_discord:
+        return
+
+    if callable(message):
+        message = message()
+    prefix = TAGS.get(tag) if tag else ""
+    with_trace = include_trace and tag in ("error", "critical")
+
+    if to_console:
+        # Choose color based on tag
+        color = MAIN_COLORS["cyan"]
+        if tag in ("warn",):
+            color = MAIN_COLORS["orange"]
+        elif tag in ("error",):
+            color = MAIN_COLORS["red"]
+        elif tag in ("critical",):
+            color = MAIN_COLORS["purple"]
+
+        exc_info = sys.exc_info() if with_trace else None
+        log_backend.emit(
+            LogRecord(
+                tag,
+                message,
+                prefix=prefix,
+                label=label,
+                color=color,
+                fields=fields or None,
+                exc_info=exc_info if exc_info and exc_info[0] else None,
+            )
+        )
+
+    # Coalesced, rate-limited digest to the Discord log channels
+    if to_discord:
+        prefix_part = f"[{prefix}] " if prefix else ""
+        label_str = f"[{label}] " if label else ""
+        discord_log_sink.submit(
+            bot_to_use,
+            CRITICAL_LOG_CHANNEL_LIST,
+            tag,
+            f"{prefix_part}{label_str}{message}",
+            trace=_format_trace if with_trace else "",
+        )
+
+
+def _format_trace(exc_info: tuple | None = None) -> str:
+    exc_info = exc_info or sys.exc_info()
+    if not exc_info[0]:
+        return ""
+    return "".join(traceback.format_exception(*exc_info)).rstrip()
+
+
+# -------------------- 🌸 UI Error Logger --------------------
+def log_ui_error(
+    *,
+    error: Exception,
+    interaction: discord.Interaction = None,
+    label: str = "UI",
+    bot: commands.Bot = None,
+    include_trace: bool = True,
+):
+    """Logs UI errors with automatic Discord reporting."""
+    location_info = ""
+    if interaction:
+        user = interaction.user
+        location_info = f"User: {user} ({user.id}) | Channel: {interaction.channel} ({interaction.channel_id})"
+
+    error_message = f"UI error occurred. {location_info}".strip()
+
+    log_backend.emit(
+        LogRecord(
+            "critical",
+            f"{label} error: {error_message}",
+            prefix=TAGS["critical"],
+            color=COLOR_RED,
+            exc_info=(
+                (type(error), error, error.__traceback__) if include_trace else None
+            ),
+        )
+    )
+
+    # One digest entry per UI error (replaces the separate error log + embed)
+    bot_to_use = bot or BOT_INSTANCE
+    if bot_to_use:
+        discord_log_sink.submit(
+            bot_to_use,
+            CRITICAL_LOG_CHANNEL_LIST,
+            "critical",
+            f"[⚠️ UI Error Logged] [{label}] {location_info or '*No interaction data*'}",
+            trace=(
+                (lambda: _format_trace((type(error), error, error.__traceback__)))
+                if include_trace
+                else ""
+            ),
+        )
@@ -0,0 +1,508 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, NamedTuple
+
+# 🟣────────────────────────────────────────────
+#        🧩 PokéMeow Embed Parsers
+# 🟣────────────────────────────────────────────
+# Every regex the listeners run against PokéMeow embeds is compiled once here
+# instead of inside the listener on every message. Each parser does one pass
+# over its embed text and returns a small typed record (a NamedTuple, so
+# callers that unpack tuples keep working), or None when the text doesn't
+# match.
+#
+# PATTERNS is the registry benchmarks/bench_embed_parsers.py runs against
+# recorded embeds; add new patterns to it when adding a parser.
+
+# Custom Discord emojis, static or animated: <:name:id> / <a:name:id>
+EMOJI_RE = re.compile(r"<a?:\w+:\d+>")
+# Discord timestamps: <t:unix> / <t:unix:R>
+TIMESTAMP_RE = re.compile(r"<t:(\d+)(?::[A-Za-z]+)?>")
+RELATIVE_TIMESTAMP_RE = re.compile(r"<t:(\d+):R>")
+
+SPAWN_TRAINER_RE = re.compile(r"\*\*(.+?)\*\*\s+(found|fished) a wild")
+FISHING_TRAINER_RE = re.compile(r"\*\*(.+?)\*\* cast a")
+CAUGHT_AUTHOR_RE = re.compile(r"(?:Congratulations|Well done|Great work), ([^!]+)!")
+
+WATERING_ACTION_RE = re.compile(
+    r"<:(\w+):\d+>\s+Watered\s+\*\*(.+?)\*\*\s+in Slot (\d+)!", re.IGNORECASE
+)
+MULCH_APPLICATION_RE = re.compile(
+    r"<:(\w+):\d+>\s+Applied\s+\*\*(.+?)\*\*\s+to Slot (\d+)", re.IGNORECASE
+)
+
+BERRY_SLOT_RE = re.compile(r"\*\*Slot (\d+)\*\* — (.+?)(?:\n|$)")
+BERRY_NAME_RE = re.compile(r"— <:\w+:\d+> ([A-Za-z ]+?)(?:\s*<|\s*•|$)")
+BERRY_MULCH_RE = re.compile(r"<:(\w+_mulch):\d+>")
+BERRY_NEXT_STAGE_RE = re.compile(r"Next stage <t:(\d+):R>")
+BERRY_STATUS_RE = re.compile(r"• 💧 \*\*(.*?)\*\*")
+# Emoji, stage name and [STAGE x/y] with optional backticks
+BERRY_GROWTH_STAGE_RE = re.compile(
+    r"<:[^:]+:\d+>\s*([^`\[]+?)\s*`?\[STAGE \d+/\d+\]`?", re.IGNORECASE
+)
+
+BATTLE_CHALLENGE_RE = re.compile(
+    r"(?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\* challenged (?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\*"
+)
+ENEMY_ID_RE = re.compile(r"Enemy ID:\s*(\d+)")
+
+WB_BOSS_NAME_RE = re.compile(r"Boss challenge: [^>]+>\s*(.+)")
+WB_ANNOUNCEMENT_RE = re.compile(
+    r"World Boss challenge:\s*(?:<[^>]+>\s*)?([A-Za-z0-9\s\-]+)"
+)
+WB_BOSS_VARIANT_RE = re.compile(
+    r"(Shiny\s+)?(?:Gigantamax|Eternamax)-([\w-]+)", re.IGNORECASE
+)
+WB_BATTLE_BEGINS_RE = re.compile(r"The battle begins <t:(\d+):R>")
+WB_CHALLENGE_STARTS_RE = re.compile(r"Challenge starts <t:(\d+):R>")
+WB_SPAWNED_BY_RE = re.compile(r"Spawned by:\s*(.+)")
+EE_VOTES_RE = re.compile(
+    r"Eternamax-Eternatus\s+spawn:\s*([\d,]+)\s*/\s*([\d,]+)", re.IGNORECASE
+)
+
+# "Golden Pikachu #9025"
+MARKET_AUTHOR_RE = re.compile(r"(.+?)\s+#(\d+)")
+# First number in a field value, in one match: whole emojis are skipped as a
+# unit (a stray "<" only when no emoji starts there), so emoji ids never count
+MARKET_NUMBER_RE = re.compile(r"(?:<a?:\w+:\d+>|[^\d<]|<(?!a?:\w+:\d+>))*(\d[\d,]*)")
+
+CLAN_RANK_LINE_RE = re.compile(r"\*\*(\d+)\*\*\s+(.+)")
+CLAN_USERNAME_STARS_RE = re.compile(r"^\*+|\*+$")
+CLAN_CATCHES_RE = re.compile(r"(?:<:dexcaught:\d+>|:dexcaught:)\s*([\d,]+)")
+CLAN_FISHES_RE = re.compile(r"(?:<:oldrod:\d+>|:oldrod:)\s*([\d,]+)")
+
+PATTERNS: dict[str, re.Pattern] = {
+    "emoji": EMOJI_RE,
+    "timestamp": TIMESTAMP_RE,
+    "relative_timestamp": RELATIVE_TIMESTAMP_RE,
+    "spawn_trainer": SPAWN_TRAINER_RE,
+    "fishing_trainer": FISHING_TRAINER_RE,
+    "caught_author": CAUGHT_AUTHOR_RE,
+    "watering_action": WATERING_ACTION_RE,
+    "mulch_application": MULCH_APPLICATION_RE,
+    "berry_slot": BERRY_SLOT_RE,
+    "berry_name": BERRY_NAME_RE,
+    "berry_mulch": BERRY_MULCH_RE,
+    "berry_next_stage": BERRY_NEXT_STAGE_RE,
+    "berry_status": BERRY_STATUS_RE,
+    "berry_growth_stage": BERRY_GROWTH_STAGE_RE,
+    "battle_challenge": BATTLE_CHALLENGE_RE,
+    "enemy_id": ENEMY_ID_RE,
+    "wb_boss_name": WB_BOSS_NAME_RE,
+    "wb_announcement": WB_ANNOUNCEMENT_RE,
+    "wb_boss_variant": WB_BOSS_VARIANT_RE,
+    "wb_battle_begins": WB_BATTLE_BEGINS_RE,
+    "wb_challenge_starts": WB_CHALLENGE_STARTS_RE,
+    "wb_spawned_by": WB_SPAWNED_BY_RE,
+    "ee_votes": EE_VOTES_RE,
+    "market_author": MARKET_AUTHOR_RE,
+    "market_number": MARKET_NUMBER_RE,
+    "clan_rank_line": CLAN_RANK_LINE_RE,
+    "clan_catches": CLAN_CATCHES_RE,
+    "clan_fishes": CLAN_FISHES_RE,
+}
+
+
+# 🍡──────────────────────────────────────────────
+#   Records
+# 🍡──────────────────────────────────────────────
+class SpawnTrainer(NamedTuple):
+    trainer_name: str
+    action: str  # "found" or "fished"
+
+
+class WateringAction(NamedTuple):
+    water_can_emoji: str
+    berry_name: str
+    slot_number: int
+
+
+class MulchApplication(NamedTuple):
+    mulch_name: str
+    mulch_label: str
+    slot_number: int
+
+
+class BerrySlot(NamedTuple):
+    slot_number: int
+    berry_name: str | None
+    mulch_name: str | None
+    status: str | None
+    growth_stage: str | None
+    next_stage_time: int | None
+    has_growth_paused: bool
+    has_ready_to_harvest: bool
+
+
+class BattleChallenge(NamedTuple):
+    challenger_name: str
+    opponent_name: str
+
+
+class WorldBossAnnouncement(NamedTuple):
+    boss_name: str | None
+    unix_seconds: int | None
+
+
+class WorldBossVariant(NamedTuple):
+    boss_name: str
+    variant: str  # "shiny" or "regular"
+
+
+class EternatusVotes(NamedTuple):
+    current_votes: int
+    total_votes: int
+
+    @property
+    def votes_left(self) -> int:
+        return self.total_votes - self.current_votes
+
+
+@dataclass(slots=True)
+class MarketListing:
+    poke_name: str
+    dex: int
+    listing_id: str
+    listed_price: int
+    lowest_market: int
+    amount: int
+    listing_seen: str
+
+    @property
+    def display_name(self) -> str:
+        return self.poke_name.title()
+
+
+class ClanMemberStats(NamedTuple):
+    username: str
+    catches: int
+    fishes: int
+
+
+class RankedClanMemberStats(NamedTuple):
+    rank: int | None
+    username: str
+    catches: int
+    fishes: int
+
+
+# 🍡──────────────────────────────────────────────
+#   Shared Helpers
+# 🍡──────────────────────────────────────────────
+def strip_emojis(text: str) -> str:
+    """Removes custom Discord emojis (static and animated)."""
+    return EMOJI_RE.sub("", text)
+
+
+def extract_timestamp(text: str) -> int | None:
+    """First Discord timestamp in the text, as unix seconds."""
+    match = TIMESTAMP_RE.search(text)
+    return int(match.group(1)) if match else None
+
+
+# 🍡──────────────────────────────────────────────
+#   Spawns / Catches
+# 🍡──────────────────────────────────────────────
+def parse_spawn_trainer(description: str) -> SpawnTrainer | None:
+    """
+    '<:irida:...>  **khy.09** found a wild ...'
+    '<:irida:...>  **khy.09** fished a wild ...'
+    """
+    match = SPAWN_TRAINER_RE.search(description)
+    if not match:
+        return None
+    return SpawnTrainer(match.group(1).strip(), match.group(2))
+
+
+def extract_trainer_name_from_description(description: str) -> str | None:
+    """Trainer name of a 'found a wild' / 'fished a wild' embed."""
+    spawn = parse_spawn_trainer(description)
+    return spawn.trainer_name if spawn else None
+
+
+def extract_fishing_trainer_name(description: str) -> str | None:
+    """'<:irida:...> **khy.09** cast a ...' -> 'khy.09'"""
+    match = FISHING_TRAINER_RE.search(description)
+    return match.group(1).strip() if match else None
+
+
+def extract_caught_username(author_name: str) -> str | None:
+    """
+    'Congratulations, frayl!' / 'Well done, frayl!' / 'Great work, frayl!'
+    -> 'frayl'
+    """
+    match = CAUGHT_AUTHOR_RE.search(author_name)
+    return match.group(1).strip() if match else None
+
+
+# 🍡──────────────────────────────────────────────
+#   Berries
+# 🍡──────────────────────────────────────────────
+def parse_watering_action(line: str) -> WateringAction | None:
+    """'<:wailmer_pail:...> Watered **Aspear Berry** in Slot 3!'"""
+    match = WATERING_ACTION_RE.search(line)
+    if not match:
+        return None
+    return WateringAction(match.group(1), match.group(2), int(match.group(3)))
+
+
+def parse_mulch_application(line: str) -> MulchApplication | None:
+    """'<:damp_mulch:...> Applied **Damp Mulch** to Slot 1 (...)!'"""
+    match = MULCH_APPLICATION_RE.search(line)
+    if not match:
+        return None
+    return MulchApplication(match.group(1), match.group(2), int(match.group(3)))
+
+
+def parse_berry_slots(embed_description: str) -> list[BerrySlot]:
+    """
+    Every planted slot of a berry garden embed. Skips slots that are empty
+    or locked (padlock emoji).
+    """
+    has_ready_to_harvest = False
+    results = []
+    lines = embed_description.splitlines()
+    for i, line in enumerate(lines):
+        slot_match = BERRY_SLOT_RE.search(line)
+        if not slot_match:
+            continue
+        slot_content = slot_match.group(2).strip()
+        normalized = slot_content.lower()
+        if "empty" in normalized or "slot locked" in normalized or "🔒" in slot_content:
+            continue
+
+        berry_name_match = BERRY_NAME_RE.search(line)
+        mulch_match = BERRY_MULCH_RE.search(line)
+
+        next_stage_time = None
+        for j in range(i, min(i + 2, len(lines))):
+            next_stage_match = BERRY_NEXT_STAGE_RE.search(lines[j])
+            if next_stage_match:
+                next_stage_time = int(next_stage_match.group(1))
+                break
+
+        status = None
+        growth_stage = None
+        has_growth_paused = False
+        for j in range(i, min(i + 3, len(lines))):
+            status_match = BERRY_STATUS_RE.search(lines[j])
+            if status_match:
+                status = status_match.group(1).strip()
+            growth_stage_match = BERRY_GROWTH_STAGE_RE.search(lines[j])
+            if growth_stage_match:
+                growth_stage = growth_stage_match.group(1).strip()
+            lowered = lines[j].lower()
+            if "growth paused" in lowered:
+                has_growth_paused = True
+            if "ready to harvest" in lowered:
+                has_ready_to_harvest = True
+
+        results.append(
+            BerrySlot(
+                slot_number=int(slot_match.group(1)),
+                berry_name=(
+                    berry_name_match.group(1).strip() if berry_name_match else None
+                ),
+                mulch_name=(
+                    mulch_match.group(1).replace("_", " ").title()
+                    if mulch_match
+                    else None
+                ),
+                status=status,
+                growth_stage=growth_stage,
+                next_stage_time=next_stage_time,
+                has_growth_paused=has_growth_paused,
+                has_ready_to_harvest=has_ready_to_harvest,
+            )
+        )
+    return results
+
+
+# 🍡──────────────────────────────────────────────
+#   Battles / World Boss
+# 🍡──────────────────────────────────────────────
+def parse_battle_challenge(description: str) -> BattleChallenge | None:
+    """'**Alice** challenged **Bob** to a battle!'"""
+    match = BATTLE_CHALLENGE_RE.search(description)
+    if not match:
+        return None
+    return BattleChallenge(match.group(1).strip(), match.group(2).strip())
+
+
+def extract_enemy_id(footer_text: str) -> str | None:
+    """'Enemy ID: 12345' -> '12345'"""
+    match = ENEMY_ID_RE.search(footer_text)
+    return match.group(1) if match else None
+
+
+def extract_relative_timestamp(text: str) -> int | None:
+    """'The battle begins <t:1763620682:R>' -> 1763620682"""
+    match = RELATIVE_TIMESTAMP_RE.search(text)
+    return int(match.group(1)) if match else None
+
+
+def extract_wb_boss_name(description: str) -> str | None:
+    """
+    '🔹 :crossed_swords: Boss challenge: <:...> Shiny Gigantamax-Copperajah'
+    -> 'Shiny Gigantamax-Copperajah'
+    """
+    match = WB_BOSS_NAME_RE.search(description)
+    return match.group(1).strip() if match else None
+
+
+def parse_world_boss_announcement(description: str) -> WorldBossAnnouncement:
+    """Boss name after 'World Boss challenge:' and the first timestamp."""
+    boss_match = WB_ANNOUNCEMENT_RE.search(description)
+    return WorldBossAnnouncement(
+        boss_match.group(1).strip() if boss_match else None,
+        extract_timestamp(description),
+    )
+
+
+def parse_wb_boss_variant(text: str) -> WorldBossVariant | None:
+    """'Shiny Gigantamax-Copperajah' -> ('Copperajah', 'shiny')"""
+    match = WB_BOSS_VARIANT_RE.search(text)
+    if not match:
+        return None
+    shiny_prefix, boss_name = match.groups()
+    return WorldBossVariant(boss_name, "shiny" if shiny_prefix else "regular")
+
+
+def parse_eternatus_votes(text: str) -> EternatusVotes | None:
+    """'Eternamax-Eternatus spawn: 1,234 / 5,000'"""
+    match = EE_VOTES_RE.search(text)
+    if not match:
+        return None
+    return EternatusVotes(
+        int(match.group(1).replace(",", "")), int(match.group(2).replace(",", ""))
+    )
+
+
+# 🍡──────────────────────────────────────────────
+#   Market Feed
+# 🍡──────────────────────────────────────────────
+def _first_number(value: str, default: int) -> int:
+    """First number in a field value ('<:PokeCoin:...> 1,250,000' -> 1250000)."""
+    if value.isascii() and value.isdigit():
+        return int(value)
+    match = MARKET_NUMBER_RE.match(value)
+    return int(match.group(1).replace(",", "")) if match else default
+
+
+def parse_market_listing(
+    author_name: str, fields: Iterable[tuple[str, str]]
+) -> MarketListing | None:
+    """
+    One pass over a market feed embed: the author line gives name and dex,
+    each (name, value) field is scanned once. None if the author line isn't
+    a listing. Missing prices are 0, a missing amount is 1.
+    """
+    author_match = MARKET_AUTHOR_RE.match(author_name)
+    if not author_match:
+        return None
+
+    listing = MarketListing(
+        poke_name=author_match.group(1),
+        dex=int(author_match.group(2)),
+        listing_id="0",
+        listed_price=0,
+        lowest_market=0,
+        amount=1,
+        listing_seen="N/A",
+    )
+    for name, value in fields:
+        if name == "Listed Price":
+            listing.listed_price = _first_number(value, 0)
+        elif name == "Lowest Market":
+            listing.lowest_market = _first_number(value, 0)
+        elif name == "Amount":
+            listing.amount = _first_number(value, 1)
+        elif name == "ID":
+            listing.listing_id = value
+        elif name == "Listing Seen":
+            listing.listing_seen = value
+    return listing
+
+
+# 🍡──────────────────────────────────────────────
+#   Clan Stats
+# 🍡──────────────────────────────────────────────
+def _is_catches_line(line: str) -> bool:
+    return line.startswith(":dexcaught:") or line.startswith("<:dexcaught:")
+
+
+def trim_clan_stats_header(message: str) -> list[str]:
+    """
+    Lines of a clan stats embed starting at the first member line, skipping
+    the timestamp / totals / "You're Rank" header.
+    """
+    lines = message.splitlines()
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if CLAN_RANK_LINE_RE.match(line):
+            return lines[i:]
+        if (
+            line
+            and not _is_catches_line(line)
+            and "You're Rank" not in line
+            and not line.startswith(":calendar:")
+            and not line.startswith(":bar_chart:")
+        ):
+            return lines[i:]
+    return lines
+
+
+def clean_clan_username(username: str) -> str:
+    return CLAN_USERNAME_STARS_RE.sub("", username).strip()
+
+
+def parse_clan_stats_ranked(message: str) -> list[RankedClanMemberStats]:
+    """
+    One pass over a Clan Weekly / Monthly Stats embed. Each member is a name
+    line ('**1** username' or just 'username') followed by a stats line with
+    the :dexcaught: and :oldrod: counts. Members without a rank line keep the
+    previous rank.
+    """
+    lines = trim_clan_stats_header(message)
+    members = []
+    rank = None
+
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        i += 1
+        if "You're Rank" in line:
+            continue
+
+        rank_match = CLAN_RANK_LINE_RE.match(line)
+        if rank_match:
+            rank = int(rank_match.group(1))
+            username = clean_clan_username(rank_match.group(2))
+        elif not _is_catches_line(line):
+            username = clean_clan_username(line)
+        else:
+            continue
+
+        if i < len(lines):
+            stats_line = lines[i]
+            catch_match = CLAN_CATCHES_RE.search(stats_line)
+            fish_match = CLAN_FISHES_RE.search(stats_line)
+            members.append(
+                RankedClanMemberStats(
+                    rank,
+                    username,
+                    int(catch_match.group(1).replace(",", "")) if catch_match else 0,
+                    int(fish_match.group(1).replace(",", "")) if fish_match else 0,
+                )
+            )
+        i += 1
+
+    return members
+
+
+def parse_clan_stats(message: str) -> list[ClanMemberStats]:
+    """(username, catches, fishes) of every member in a clan stats embed."""
+    return [
+        ClanMemberStats(member.username, member.catches, member.fishes)
+        for member in parse_clan_stats_ranked(message)
+    ]
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from Constants.paldea_galar_dict import get_dex_number_by_name
+from Constants.pokedex_index import POKEDEX
 from Constants.pokemon_gif import *
 from utils.logs.pretty_log import pretty_log
 
@@ -112,7 +112,7 @@ def get_pokemon_gif(input_name: str):
         )  # Replace spaces with hyphens
         golden_base_name_attr = golden_base_name.replace("-", "_")
         debug_log(f"Golden base name for dex lookup: {golden_base_name}")
-        dex_number = get_dex_number_by_name(golden_base_name)
+        dex_number = POKEDEX.dex_by_name.get(golden_base_name)
         debug_log(f"Dex number for golden form: {dex_number}")
         pretty_log(
             tag="debug",